@@ -43,8 +43,13 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import bisect
 import calendar
+import contextlib
 import datetime as dt
+import functools
+import heapq
+import itertools
 import os
 from pathlib import Path
 import re
@@ -56,9 +61,10 @@ import uuid
 import threading
 import unicodedata
 import webbrowser
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional, Tuple, Iterable, Set
+from operator import itemgetter
+from typing import Callable, Coroutine, Dict, List, Optional, Tuple, Iterable, Set, Union
 
 import requests
 import yaml
@@ -781,6 +787,55 @@ ROW_STYLE_UNKNOWN = 'table.row.unknown'
 ROW_STYLE_RUNNING = 'table.row.running'
 FUTURE_ROW_STYLE_CLASSES = ['table.row.future0', 'table.row.future1', 'table.row.future2', 'table.row.future3', 'table.row.future4']
 STATUS_WAITING_CLASS = 'table.status.waiting'
+# Checked in order, so a status like "done (blocked)" still classifies as blocked.
+_STATUS_STYLE_RES: Tuple[Tuple[str, re.Pattern], ...] = (
+    ('table.status.blocked', re.compile(r'block|hold|stuck')),
+    ('table.status.in_progress', re.compile(r'progress|doing|active|working')),
+    (STATUS_WAITING_CLASS, re.compile(r'wait')),
+    ('table.status.done', re.compile(r'done|complete|closed|shipped')),
+    ('table.status.todo', re.compile(r'todo|backlog|ready|plan')),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _status_style_name(status: Optional[str]) -> str:
+    """Theme style name for a status cell, or '' when the status is unrecognised."""
+    norm = (status or '').strip().lower()
+    if not norm:
+        return ''
+    for style_name, pattern in _STATUS_STYLE_RES:
+        if pattern.search(norm):
+            return style_name
+    return ''
+
+
+_ADD_OVERLAY_HEADERS: Dict[str, str] = {
+    'mode': '🧷 Choose Type',
+    'project': '📁 Select Project',
+    'repo': '📦 Select Repository',
+    'title': '📝 Enter Title',
+    'start': '📅 Start Date (YYYY-MM-DD)',
+    'end': '📆 End Date (optional)',
+    'focus': '🎯 Focus Day (YYYY-MM-DD)',
+    'iteration': '🔁 Select Iteration',
+    'iteration-create': '➕ New Iteration',
+    'labels': '🏷️ Select Labels',
+    'priority': '⚡ Select Priority',
+    'assignee': '👥 Choose Assignees',
+    'comment': '💬 Initial Comment',
+    'confirm': '✅ Confirm',
+}
+_ADD_DATE_PROMPTS: Dict[str, str] = {
+    'start': 'Enter Start Date (YYYY-MM-DD)',
+    'end': 'Enter End Date (optional, YYYY-MM-DD)',
+    'focus': 'Enter Focus Day (YYYY-MM-DD)',
+}
+# Add-overlay date step -> (add_state value key, add_state cursor key)
+_ADD_DATE_FIELD_MAP: Dict[str, Tuple[str, str]] = {
+    'start': ('start_date', 'start_cursor'),
+    'end': ('end_date', 'end_cursor'),
+    'focus': ('focus_date', 'focus_cursor'),
+}
 
 
 def _load_theme_presets(theme_dir: Path) -> List[ThemePreset]:
@@ -841,6 +896,7 @@ STATUS_OPTION_CACHE: Dict[str, List[Dict[str, object]]] = {}
 PRIORITY_FIELD_CACHE: Dict[str, Tuple[str, List[Dict[str, str]]]] = {}
 ITERATION_FIELD_CACHE: Dict[Tuple[str, str], Tuple[str, List[Dict[str, object]], str]] = {}
 PEOPLE_FIELD_CACHE: Dict[str, str] = {}
+PROJECT_FIELD_ID_CACHE: Dict[str, Dict[str, str]] = {}
 _UNSET = object()
 PENDING_URL_PREFIX = "pending://"
 
@@ -994,6 +1050,8 @@ class TaskDB:
     def __init__(self, path: str):
         self.conn = sqlite3.connect(path)
         self.conn.execute("PRAGMA journal_mode=WAL")
+        # Bumped on every work_sessions write so callers can cache timer aggregates.
+        self.sessions_version = 0
         self._migrate_if_needed()
 
     def _cols(self) -> List[str]:
@@ -1124,6 +1182,7 @@ class TaskDB:
             (task_url, project_title, repo, labels_json or "[]", 'start', now),
         )
         self.conn.commit()
+        self.sessions_version += 1
 
     def stop_session(self, task_url: str, project_title: Optional[str] = None, repo: Optional[str] = None, labels_json: Optional[str] = None) -> None:
         if not task_url:
@@ -1139,6 +1198,7 @@ class TaskDB:
             (task_url, project_title, repo, labels_json or "[]", 'stop', now),
         )
         self.conn.commit()
+        self.sessions_version += 1
 
     def log_timer_event(self, task_url: str, project_title: Optional[str], repo: Optional[str], labels_json: Optional[str], action: str, at_ts: Optional[str] = None) -> None:
         at_ts = at_ts or dt.datetime.now(dt.timezone.utc).astimezone().isoformat(timespec="seconds")
@@ -1254,6 +1314,7 @@ class TaskDB:
         else:
             task_url, project_title = '', None
         self.conn.commit()
+        self.sessions_version += 1
         if task_url:
             try:
                 self.log_timer_event(task_url, project_title, None, "[]", 'edit')
@@ -1266,6 +1327,7 @@ class TaskDB:
         row = cur.fetchone()
         cur.execute("DELETE FROM work_sessions WHERE id=?", (session_id,))
         self.conn.commit()
+        self.sessions_version += 1
         if row:
             task_url, project_title = row
             try:
@@ -1458,15 +1520,51 @@ class TaskDB:
             st, en, keep = self._clip_range(st, en, since_dt)
             if not keep or st >= en:
                 continue
-            cur = st
-            while cur < en:
-                boundary = self._next_boundary(cur, granularity)
-                seg_end = min(boundary, en)
-                key = self._period_key(cur, granularity)
-                out[key] = out.get(key, 0) + int((seg_end - cur).total_seconds())
-                cur = seg_end
+            self._add_period_seconds(out, st, en, granularity)
         return out
 
+    def _add_period_seconds(self, out: Dict[str, int], start: dt.datetime, end: dt.datetime, granularity: str) -> None:
+        cur = start
+        while cur < end:
+            seg_end = min(self._next_boundary(cur, granularity), end)
+            key = self._period_key(cur, granularity)
+            out[key] = out.get(key, 0) + int((seg_end - cur).total_seconds())
+            cur = seg_end
+
+    def aggregate_period_totals_multi(
+        self, scopes: Iterable[Tuple[str, Optional[int], Optional[str], Optional[str]]],
+    ) -> List[Dict[str, int]]:
+        """aggregate_period_totals for each (granularity, since_days, project_title, task_url) scope.
+
+        Sessions are read and parsed once and shared by every scope.
+        """
+        cur = self.conn.cursor()
+        cur.execute("SELECT task_url, project_title, started_at, ended_at FROM work_sessions")
+        now = dt.datetime.now(dt.timezone.utc).astimezone()
+        sessions: List[Tuple[str, str, dt.datetime, dt.datetime]] = []
+        for url, proj, st_s, en_s in cur.fetchall():
+            st = self._parse_iso(st_s)
+            if not st:
+                continue
+            en = self._parse_iso(en_s) if en_s else None
+            sessions.append((url, proj, st, en or now))
+        results: List[Dict[str, int]] = []
+        for granularity, since_days, project_title, task_url in scopes:
+            since_dt = (now - dt.timedelta(days=since_days)) if since_days else None
+            out: Dict[str, int] = {}
+            for url, proj, st, en in sessions:
+                if task_url:
+                    if url != task_url:
+                        continue
+                elif project_title and proj != project_title:
+                    continue
+                st, en, keep = self._clip_range(st, en, since_dt)
+                if not keep or st >= en:
+                    continue
+                self._add_period_seconds(out, st, en, granularity)
+            results.append(out)
+        return results
+
     def aggregate_project_totals(self, since_days: Optional[int] = None) -> Dict[str, int]:
         cur = self.conn.cursor()
         cur.execute("SELECT project_title, started_at, ended_at FROM work_sessions")
@@ -1801,8 +1899,9 @@ class TaskDB:
         )
         self.conn.commit()
 
-    def upsert_many(self, rows: List[TaskRow], *, commit: bool = True):
-        if not rows:
+    def upsert_many(self, rows: Iterable[TaskRow], *, commit: bool = True):
+        """Upsert ``rows``; any iterable works and is streamed into ``executemany``."""
+        if isinstance(rows, (list, tuple)) and not rows:
             return
         cur = self.conn.cursor()
         cur.executemany(
@@ -1859,7 +1958,7 @@ class TaskDB:
                           assignee_logins=excluded.assignee_logins,
                           content_node_id=excluded.content_node_id
             """,
-            [
+            (
                 (
                     r.owner_type,
                     r.owner,
@@ -1877,7 +1976,7 @@ class TaskDB:
                     r.iteration_start,
                     r.iteration_duration,
                     r.title,
-                    getattr(r, 'description', ''),
+                    r.description,
                     r.repo_id,
                     r.repo,
                     r.labels,
@@ -1885,8 +1984,8 @@ class TaskDB:
                     r.priority_field_id,
                     r.priority_option_id,
                     r.priority_options,
-                    int(getattr(r, 'priority_dirty', 0)),
-                    getattr(r, 'priority_pending_option_id', ''),
+                    int(r.priority_dirty),
+                    r.priority_pending_option_id,
                     r.url,
                     r.updated_at,
                     r.status,
@@ -1909,13 +2008,13 @@ class TaskDB:
                     r.content_node_id,
                 )
                 for r in rows
-            ],
+            ),
         )
         if commit:
             self.conn.commit()
 
-    def replace_all(self, rows: List[TaskRow]):
-        """Replace all existing tasks with new list (ensures deletions reflected)."""
+    def replace_all(self, rows: Iterable[TaskRow]):
+        """Replace all existing tasks with new rows (ensures deletions reflected)."""
         cur = self.conn.cursor()
         try:
             cur.execute("BEGIN")
@@ -1923,8 +2022,7 @@ class TaskDB:
                 "DELETE FROM tasks WHERE url IS NULL OR url = '' OR url NOT LIKE ?",
                 (f"{PENDING_URL_PREFIX}%",),
             )
-            if rows:
-                self.upsert_many(rows, commit=False)
+            self.upsert_many(rows, commit=False)
             cur.execute("COMMIT")
         except Exception:
             try:
@@ -1938,13 +2036,7 @@ class TaskDB:
         if today_only:
             today = today or dt.date.today().isoformat()
             cur.execute(
-                """                SELECT owner_type,owner,project_number,project_title,start_field,
-                       start_date,end_field,end_date,focus_field,focus_date,focus_field_id,
-                       iteration_field,iteration_title,iteration_start,iteration_duration,
-                       title,description,repo_id,repo,labels,priority,priority_field_id,priority_option_id,priority_options,priority_dirty,priority_pending_option_id,
-                       url,updated_at,status,is_done,assigned_to_me,created_by_me,
-                       item_id,project_id,status_field_id,status_option_id,status_options,status_dirty,status_pending_option_id,
-                       start_field_id,iteration_field_id,iteration_options,assignee_field_id,assignee_user_ids,assignee_logins,content_node_id
+                f"""                SELECT {', '.join(self.SCHEMA_COLUMNS)}
                 FROM tasks WHERE focus_date = ? OR url LIKE ?
                 ORDER BY project_title, focus_date, repo, title
                 """,
@@ -1952,13 +2044,7 @@ class TaskDB:
             )
         else:
             cur.execute(
-                """                SELECT owner_type,owner,project_number,project_title,start_field,
-                       start_date,end_field,end_date,focus_field,focus_date,focus_field_id,
-                       iteration_field,iteration_title,iteration_start,iteration_duration,
-                       title,description,repo_id,repo,labels,priority,priority_field_id,priority_option_id,priority_options,priority_dirty,priority_pending_option_id,
-                       url,updated_at,status,is_done,assigned_to_me,created_by_me,
-                       item_id,project_id,status_field_id,status_option_id,status_options,status_dirty,status_pending_option_id,
-                       start_field_id,iteration_field_id,iteration_options,assignee_field_id,assignee_user_ids,assignee_logins,content_node_id
+                f"""                SELECT {', '.join(self.SCHEMA_COLUMNS)}
                 FROM tasks
                 ORDER BY project_title, focus_date, repo, title
                 """
@@ -2497,6 +2583,11 @@ PROJECTS_V2_PREVIEW_ACCEPT = ",".join([
     "application/vnd.github.inertia-preview+json",
 ])
 
+# Blocking GitHub calls issued from the TUI run here rather than on the event
+# loop's default executor, so interactive edits are not queued behind each
+# other or behind unrelated blocking work.
+_GH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gh-io")
+
 
 def _build_accept_header(extra_accept: Optional[str] = None) -> str:
     accepts = [GITHUB_ACCEPT_HEADER]
@@ -2508,10 +2599,22 @@ def _build_accept_header(extra_accept: Optional[str] = None) -> str:
     return ", ".join(accepts)
 
 
+# Sessions are pooled per thread so repeated edits reuse keep-alive
+# connections instead of paying a TLS handshake on every call.
+_SESSION_POOL = threading.local()
+
+
 def _session(token: str, extra_accept: Optional[str] = None) -> requests.Session:
-    s = requests.Session()
-    s.headers["Authorization"] = f"Bearer {token}"
-    s.headers["Accept"] = _build_accept_header(extra_accept)
+    pool = getattr(_SESSION_POOL, "sessions", None)
+    if pool is None:
+        pool = _SESSION_POOL.sessions = {}
+    key = (token, extra_accept)
+    s = pool.get(key)
+    if s is None:
+        s = requests.Session()
+        s.headers["Authorization"] = f"Bearer {token}"
+        s.headers["Accept"] = _build_accept_header(extra_accept)
+        pool[key] = s
     return s
 
 
@@ -2923,6 +3026,8 @@ def set_project_date(
     if not errs:
         return field_id
     if field_name and _is_missing_project_field_error(errs):
+        # The cached id is the one GitHub just rejected; re-read the project's fields.
+        PROJECT_FIELD_ID_CACHE.pop(project_id, None)
         lookup_id = None
         try:
             lookup_id = get_project_field_id_by_name(token, project_id, field_name)
@@ -3115,8 +3220,7 @@ def set_issue_labels(token: str, issue_url: str, labels: List[str]) -> None:
         'Authorization': f'Bearer {token}',
         'Accept': 'application/vnd.github+json',
     }
-    import requests as _rq
-    r = _rq.patch(
+    r = _session(token).patch(
         f'https://api.github.com/repos/{owner}/{repo}/issues/{number}',
         headers=headers,
         json={'labels': labels},
@@ -3135,8 +3239,7 @@ def set_issue_title(token: str, issue_url: str, title: str) -> None:
         'Authorization': f'Bearer {token}',
         'Accept': 'application/vnd.github+json',
     }
-    import requests as _rq
-    r = _rq.patch(
+    r = _session(token).patch(
         f'https://api.github.com/repos/{owner}/{repo}/issues/{number}',
         headers=headers,
         json={'title': title},
@@ -3155,8 +3258,7 @@ def set_issue_assignees(token: str, issue_url: str, assignees: List[str]) -> Non
         'Authorization': f'Bearer {token}',
         'Accept': 'application/vnd.github+json',
     }
-    import requests as _rq
-    r = _rq.patch(
+    r = _session(token).patch(
         f'https://api.github.com/repos/{owner}/{repo}/issues/{number}',
         headers=headers,
         json={'assignees': assignees},
@@ -3175,8 +3277,7 @@ def add_issue_comment(token: str, issue_url: str, body: str) -> None:
         'Authorization': f'Bearer {token}',
         'Accept': 'application/vnd.github+json',
     }
-    import requests as _rq
-    r = _rq.post(
+    r = _session(token).post(
         f'https://api.github.com/repos/{owner}/{repo}/issues/{number}/comments',
         headers=headers,
         json={'body': body},
@@ -3341,22 +3442,34 @@ def discover_open_projects(session: requests.Session, owner_type: str, owner: st
         nodes = (((resp.get("data") or {}).get("user") or {}).get("projectsV2") or {}).get("nodes") or []
     return [n for n in nodes if n is not None and isinstance(n, dict) and not n.get("closed")]
 
-def get_project_field_id_by_name(token: str, project_id: str, name_lower: str) -> Optional[str]:
+def get_project_field_ids(token: str, project_id: str) -> Dict[str, str]:
+    """Lower-cased field name -> field id for a project; cached until the next full refresh."""
     if not project_id:
-        return None
+        return {}
+    cached = PROJECT_FIELD_ID_CACHE.get(project_id)
+    if cached is not None:
+        return cached
     session = _session(token)
     resp = _graphql_with_backoff(session, GQL_PROJECT_FIELDS, {"id": project_id})
     errs = resp.get("errors") or []
     if errs:
-        return None
+        return {}
     node = (resp.get("data") or {}).get("node") or {}
     fields = ((node.get("fields") or {}).get("nodes")) or []
-    target = (name_lower or '').strip().lower()
+    ids_by_name: Dict[str, str] = {}
     for f in fields:
+        if not isinstance(f, dict):
+            continue
         nm = (f.get("name") or '').strip().lower()
-        if nm == target:
-            return f.get("id") or None
-    return None
+        if nm not in ids_by_name:
+            ids_by_name[nm] = f.get("id") or ''
+    PROJECT_FIELD_ID_CACHE[project_id] = ids_by_name
+    return ids_by_name
+
+
+def get_project_field_id_by_name(token: str, project_id: str, name_lower: str) -> Optional[str]:
+    target = (name_lower or '').strip().lower()
+    return get_project_field_ids(token, project_id).get(target) or None
 
 
 def get_project_field_options(token: str, field_id: str) -> List[Dict[str, str]]:
@@ -3545,15 +3658,150 @@ PEOPLE_FIELD_HINTS = ("people", "owner", "assignee")
 ITERATION_FIELD_HINTS = ("iteration", "sprint", "cycle")
 END_FIELD_HINTS = ("end date", "due date", "target date", "finish date")
 ITERATION_CREATE_SENTINEL = "__create_iteration__"
+FOCUS_DAY_FIELD_NAME = sys.intern("focus day")
+_TN_USER = sys.intern("ProjectV2ItemFieldUserValue")
+_TN_SELECT = sys.intern("ProjectV2ItemFieldSingleSelectValue")
+_TN_DATE = sys.intern("ProjectV2ItemFieldDateValue")
+_TN_ITER = sys.intern("ProjectV2ItemFieldIterationValue")
+_DONE_STATUS_RE = re.compile("done|complete|closed|merged|finished|✅|✔")
+STATUS_KEYWORDS: Dict[str, List[str]] = {
+    'done': ["done", "complete", "completed", "finished", "closed", "resolved", "merged", "✅", "✔"],
+    'in_progress': ["in progress", "progress", "doing", "active", "working"]
+}
+_STATUS_KEYWORD_RES: Dict[str, re.Pattern] = {
+    target: re.compile("|".join(re.escape(kw.lower()) for kw in kws))
+    for target, kws in STATUS_KEYWORDS.items()
+}
+_DONE_KEYWORD_SEARCH = _STATUS_KEYWORD_RES['done'].search
 ITERATION_DEFAULT_DURATION_DAYS = 7
 LONG_TASK_THRESHOLD_SECONDS = 4 * 60 * 60  # 4 hours
 LONG_TASK_REPROMPT_INCREMENT = 60 * 60     # re-confirm every extra hour over threshold
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_status_options(raw: str) -> Tuple[Tuple[str, str, str], ...]:
+    """Parse a row's status_options JSON into (lower_name, option_id, name) triples."""
+    try:
+        data = json.loads(raw or "[]")
+    except Exception:
+        return ()
+    if not isinstance(data, list):
+        return ()
+    out: List[Tuple[str, str, str]] = []
+    for opt in data:
+        if not isinstance(opt, dict):
+            continue
+        name = (opt.get("name") or "").strip()
+        opt_id = (opt.get("id") or "").strip()
+        if name and opt_id:
+            out.append((name.lower(), opt_id, name))
+    return tuple(out)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_priority_options(raw: str) -> Tuple[Dict[str, object], ...]:
+    """Parse a row's priority_options JSON, keeping only dict entries."""
+    try:
+        data = json.loads(raw or "[]")
+    except Exception:
+        return ()
+    if not isinstance(data, list):
+        return ()
+    return tuple(opt for opt in data if isinstance(opt, dict))
+
+
+@functools.lru_cache(maxsize=8192)
+def _task_search_blob(title: str, repo: str, priority: str, status: str, project_title: str) -> str:
+    """Lower-cased, NUL-joined haystack of the fields the search filter matches."""
+    return "\0".join((title, repo, priority, status, project_title)).lower()
+
+
+@functools.lru_cache(maxsize=4096)
+def _priority_rank_for(raw_options: str, option_id: str, priority: str) -> int:
+    """Sort rank of a priority within its field's options (lower is more urgent)."""
+    opts = _parse_priority_options(raw_options)
+    pname = (priority or '').strip().lower()
+    if opts:
+        id_lookup = {str(opt.get('id') or ''): idx for idx, opt in enumerate(opts)}
+        opt_id = (option_id or '').strip()
+        if opt_id in id_lookup:
+            return id_lookup[opt_id]
+        name_lookup = {(opt.get('name') or '').strip().lower(): idx for idx, opt in enumerate(opts)}
+        if pname in name_lookup:
+            return name_lookup[pname]
+        return len(opts)
+    if pname in ('urgent', 'highest', 'high'):  # conventional mapping
+        return 0
+    if pname in ('medium', 'normal'):  # mid tier
+        return 1
+    if pname in ('low', 'lowest', 'minor'):
+        return 2
+    return 99
+
+
+def _match_priority_option(label: str, options: List[Dict[str, object]]) -> str:
+    """Option id for a priority label: exact name (or the part after ':'), then substring."""
+    if not label:
+        return ''
+    norm = label.strip().lower()
+    core = norm.split(':', 1)[-1].strip() if ':' in norm else norm
+    names = [((opt.get('name') or '').strip().lower(), opt.get('id') or '') for opt in options if isinstance(opt, dict)]
+    for low, opt_id in names:
+        if low and (low == norm or low == core):
+            return opt_id
+    if core:
+        for low, opt_id in names:
+            if core in low:
+                return opt_id
+    return ''
+
+
 def _looks_like_iso_date(value: str) -> bool:
     return bool(re.match(r"^\d{4}-\d{2}-\d{2}$", (value or "").strip()))
 
 
+_monthrange_cached = functools.lru_cache(maxsize=1024)(calendar.monthrange)
+
+
+def _shift_months(current: dt.date, months: int) -> dt.date:
+    """Move a date by whole months, clamping the day to the target month's length."""
+    years, month_idx = divmod(current.month - 1 + months, 12)
+    year = current.year + years
+    month = month_idx + 1
+    return dt.date(year, month, min(current.day, _monthrange_cached(year, month)[1]))
+
+
+_CALENDAR = calendar.Calendar(firstweekday=0)
+_CALENDAR_DAY_HEADER = ''.join(f" {calendar.day_abbr[i][:2]} " for i in range(7))
+
+
+@functools.lru_cache(maxsize=64)
+def _calendar_week_lines(cursor_date: dt.date) -> Tuple[str, ...]:
+    """Week rows of the month picker: cursor day in [..], other months in (..)."""
+    lines: List[str] = []
+    for week in _CALENDAR.monthdatescalendar(cursor_date.year, cursor_date.month):
+        row_cells: List[str] = []
+        for day in week:
+            label = f"{day.day:2d}"
+            if day == cursor_date:
+                cell = f"[{label}]"
+            elif day.month != cursor_date.month:
+                cell = f"({label})"
+            else:
+                cell = f" {label} "
+            row_cells.append(cell)
+        lines.append(''.join(row_cells))
+    return tuple(lines)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> Optional[dt.date]:
+    try:
+        return dt.date.fromisoformat(value)
+    except Exception:
+        return None
+
+
 def _default_iteration_duration(options: Iterable[object]) -> int:
     for opt in reversed(list(options or [])):
         if not isinstance(opt, dict):
@@ -3896,6 +4144,8 @@ def fetch_tasks_github(
                 break
 
             items = (proj_node.get("items") or {}).get("nodes") or []
+            regex_search = regex.search
+            iter_regex_search = iter_regex.search if iter_regex is not None else None
             for it in items:
                 item_id = it.get("id") or ""
                 content = it.get("content") or {}
@@ -3958,8 +4208,12 @@ def fetch_tasks_github(
                 iteration_field_id: str = ""
                 iteration_options_list: List[Dict[str, object]] = []
                 start_field_id: str = ""
+                date_nodes: List[Dict[str, object]] = []
                 for fv in (it.get("fieldValues") or {}).get("nodes") or []:
-                    if fv and fv.get("__typename") == "ProjectV2ItemFieldUserValue":
+                    if not fv:
+                        continue
+                    typename = fv.get("__typename")
+                    if typename == _TN_USER:
                         field_data = fv.get("field") or {}
                         assignee_field_id = field_data.get("id") or assignee_field_id
                         for node in (fv.get("users") or {}).get("nodes") or []:
@@ -3973,7 +4227,7 @@ def fetch_tasks_github(
                             node_id = (node or {}).get("id")
                             if node_id:
                                 assignee_user_ids.append(node_id)
-                    if fv and fv.get("__typename") == "ProjectV2ItemFieldSingleSelectValue":
+                    elif typename == _TN_SELECT:
                         field_data = fv.get("field") or {}
                         raw_name = field_data.get("name") or ""
                         option_id_val = fv.get("optionId") or ""
@@ -4019,7 +4273,8 @@ def fetch_tasks_github(
                             priority_field_id = field_data.get("id") or priority_field_id
                             priority_text = (fv.get("name") or "").strip()
                             priority_option_id = option_id_val
-                    if fv and fv.get("__typename") == "ProjectV2ItemFieldDateValue":
+                    elif typename == _TN_DATE:
+                        date_nodes.append(fv)
                         field_info = fv.get("field") or {}
                         start_field_id = field_info.get("id") or start_field_id
                         fname_raw = (field_info.get("name") or "")
@@ -4030,10 +4285,10 @@ def fetch_tasks_github(
                                 end_field_name = fname_raw
                             if candidate:
                                 end_date_value = candidate
-                    if (not iteration_captured) and fv and fv.get("__typename") == "ProjectV2ItemFieldIterationValue":
+                    elif typename == _TN_ITER and not iteration_captured:
                         field_info = fv.get("field") or {}
                         fname_iter = (field_info.get("name") or "")
-                        if (iter_regex is None) or iter_regex.search(fname_iter):
+                        if (iter_regex_search is None) or iter_regex_search(fname_iter):
                             iteration_field = fname_iter
                             iteration_title = (fv.get("title") or "")
                             iteration_start = fv.get("startDate") or ""
@@ -4066,19 +4321,18 @@ def fetch_tasks_github(
                 focus_fname: str = ""
                 focus_fdate: str = ""
                 focus_field_id_local: str = ""
-                for fv in (it.get("fieldValues") or {}).get("nodes") or []:
-                    if fv and fv.get("__typename") == "ProjectV2ItemFieldDateValue":
-                        field_fd = fv.get("field") or {}
-                        fname_fd = (field_fd.get("name") or "")
-                        if fname_fd.strip().lower() == "focus day":
-                            fdate_fd = fv.get("date")
-                            if fdate_fd:
-                                try:
-                                    dt.date.fromisoformat(fdate_fd)
-                                    focus_fname, focus_fdate = fname_fd, fdate_fd
-                                    focus_field_id_local = field_fd.get("id") or focus_field_id_local
-                                except ValueError:
-                                    pass
+                for fv in date_nodes:
+                    field_fd = fv.get("field") or {}
+                    fname_fd = (field_fd.get("name") or "")
+                    if fname_fd.strip().lower() == FOCUS_DAY_FIELD_NAME:
+                        fdate_fd = fv.get("date")
+                        if fdate_fd:
+                            try:
+                                dt.date.fromisoformat(fdate_fd)
+                                focus_fname, focus_fdate = fname_fd, fdate_fd
+                                focus_field_id_local = field_fd.get("id") or focus_field_id_local
+                            except ValueError:
+                                pass
 
                 need_priority_lookup = False
                 if priority_field_id:
@@ -4108,13 +4362,7 @@ def fetch_tasks_github(
                     priority_options_list = priority_options_cache.copy()
 
                 if assignee_user_ids:
-                    seen_ids = set()
-                    unique_ids = []
-                    for uid in assignee_user_ids:
-                        if uid and uid not in seen_ids:
-                            seen_ids.add(uid)
-                            unique_ids.append(uid)
-                    assignee_user_ids = unique_ids
+                    assignee_user_ids = list(dict.fromkeys(uid for uid in assignee_user_ids if uid))
 
                 seen_assignees: Set[str] = set()
                 assignee_logins_ordered: List[str] = []
@@ -4132,70 +4380,61 @@ def fetch_tasks_github(
                 except Exception:
                     assignee_logins_json = "[]"
 
+                status_text_low = status_text.lower() if status_text else ""
+                done_flag = 1 if status_text_low and _DONE_STATUS_RE.search(status_text_low) else 0
                 found_date = False
-                for fv in (it.get("fieldValues") or {}).get("nodes") or []:
-                    if fv and fv.get("__typename") == "ProjectV2ItemFieldDateValue":
-                        fname = ((fv.get("field") or {}).get("name")) or ""
-                        fdate = fv.get("date")
-                        if not fdate or not regex.search(fname):
-                            continue
-                        try:
-                            dt.date.fromisoformat(fdate)
-                        except ValueError:
-                            continue
-                        done_flag = 0
-                        if status_text:
-                            low = status_text.lower()
-                            if any(k in low for k in ("done", "complete", "closed", "merged", "finished", "✅", "✔")):
-                                done_flag = 1
-                        local_rows.append(
-                            TaskRow(
-                                owner_type=owner_type, owner=owner, project_number=number,
-                                project_title=project_title,
-                                start_field=fname, start_date=fdate,
-                                end_field=end_field_name or "",
-                                end_date=end_date_value or "",
-                                focus_field=focus_fname or "",
-                                focus_date=focus_fdate or "",
-                                iteration_field=iteration_field,
-                                iteration_title=iteration_title,
-                                iteration_start=iteration_start,
-                                iteration_duration=iteration_duration,
-                                title=title, repo=repo,
-                                description=desc_text,
-                                labels=json.dumps(label_names, ensure_ascii=False),
-                                priority=priority_text,
-                                priority_field_id=priority_field_id,
-                                priority_option_id=priority_option_id,
-                                priority_options=json.dumps(priority_options_list, ensure_ascii=False),
-                                url=url, updated_at=iso_now,
-                                status=status_text, is_done=done_flag,
-                                repo_id=repo_id,
-                                assigned_to_me=int(assigned_to_me),
-                                created_by_me=int(created_by_me),
-                                item_id=item_id,
-                                project_id=project_id,
-                                status_field_id=status_field_id,
-                                status_option_id=status_option_id,
-                                status_options=json.dumps(status_options_list, ensure_ascii=False),
-                                status_dirty=0,
-                                status_pending_option_id="",
-                                start_field_id=start_field_id,
-                                focus_field_id=focus_field_id_local,
-                                iteration_field_id=iteration_field_id,
-                                iteration_options=json.dumps(iteration_options_list, ensure_ascii=False),
-                                assignee_field_id=assignee_field_id,
-                                assignee_user_ids=json.dumps(assignee_user_ids, ensure_ascii=False),
-                                assignee_logins=assignee_logins_json,
-                            )
+                for fv in date_nodes:
+                    fname = ((fv.get("field") or {}).get("name")) or ""
+                    fdate = fv.get("date")
+                    if not fdate or not regex_search(fname):
+                        continue
+                    try:
+                        dt.date.fromisoformat(fdate)
+                    except ValueError:
+                        continue
+                    local_rows.append(
+                        TaskRow(
+                            owner_type=owner_type, owner=owner, project_number=number,
+                            project_title=project_title,
+                            start_field=fname, start_date=fdate,
+                            end_field=end_field_name or "",
+                            end_date=end_date_value or "",
+                            focus_field=focus_fname or "",
+                            focus_date=focus_fdate or "",
+                            iteration_field=iteration_field,
+                            iteration_title=iteration_title,
+                            iteration_start=iteration_start,
+                            iteration_duration=iteration_duration,
+                            title=title, repo=repo,
+                            description=desc_text,
+                            labels=json.dumps(label_names, ensure_ascii=False),
+                            priority=priority_text,
+                            priority_field_id=priority_field_id,
+                            priority_option_id=priority_option_id,
+                            priority_options=json.dumps(priority_options_list, ensure_ascii=False),
+                            url=url, updated_at=iso_now,
+                            status=status_text, is_done=done_flag,
+                            repo_id=repo_id,
+                            assigned_to_me=int(assigned_to_me),
+                            created_by_me=int(created_by_me),
+                            item_id=item_id,
+                            project_id=project_id,
+                            status_field_id=status_field_id,
+                            status_option_id=status_option_id,
+                            status_options=json.dumps(status_options_list, ensure_ascii=False),
+                            status_dirty=0,
+                            status_pending_option_id="",
+                            start_field_id=start_field_id,
+                            focus_field_id=focus_field_id_local,
+                            iteration_field_id=iteration_field_id,
+                            iteration_options=json.dumps(iteration_options_list, ensure_ascii=False),
+                            assignee_field_id=assignee_field_id,
+                            assignee_user_ids=json.dumps(assignee_user_ids, ensure_ascii=False),
+                            assignee_logins=assignee_logins_json,
                         )
-                        found_date = True
+                    )
+                    found_date = True
                 if not found_date:
-                    done_flag = 0
-                    if status_text:
-                        low = status_text.lower()
-                        if any(k in low for k in ("done", "complete", "closed", "merged", "finished", "✅", "✔")):
-                            done_flag = 1
                     local_rows.append(
                         TaskRow(
                             owner_type=owner_type, owner=owner, project_number=number,
@@ -4270,15 +4509,13 @@ def fetch_tasks_github(
                 rate_limited_triggered = True
                 if not partial_message:
                     partial_message = result.message or "Rate limited; fetching incomplete"
-                for other_future, other_idx in future_map.items():
-                    if other_future is future:
+                done, _ = wait(future_map, timeout=0)
+                for other_future in done:
+                    if other_future is future or other_future.cancelled():
                         continue
-                    if other_future.done():
-                        try:
-                            other_result = other_future.result()
-                        except Exception:
-                            continue
-                        results_by_idx[other_idx] = other_result.rows
+                    if other_future.exception() is None:
+                        results_by_idx[future_map[other_future]] = other_future.result().rows
+                executor.shutdown(wait=False, cancel_futures=True)
                 break
             tracker.advance(f"Finished {result.label}")
 
@@ -4300,20 +4537,43 @@ def fetch_tasks_github(
 # -----------------------------
 # UI helpers (fragments only)
 # -----------------------------
-def color_for_date(d: Optional[str], today: dt.date, palette: Optional[Dict[str, str]] = None) -> str:
-    try:
-        dd = dt.date.fromisoformat(d) if d else None
-    except Exception:
-        dd = None
-    if dd is None:
+# Shared result for overlay builders while their overlay is closed; never mutate.
+_EMPTY_FT: List[Tuple[str, str]] = []
+# Task editor list styling, indexed by "is this the cursor row" (False/True).
+_CURSOR_MARKERS = (' ', '➤')
+_EDITOR_FIELD_STYLES = ('class:editor.field', 'class:editor.field.cursor')
+_EDITOR_OPTION_STYLES = ('class:editor.priority', 'class:editor.priority.cursor')
+# Label/assignee checklists, indexed by is_cursor * 2 + is_selected.
+_EDITOR_CHECK_STYLES = (
+    'class:editor.label', 'class:editor.label.selected',
+    'class:editor.label.cursor', 'class:editor.label.cursor.selected',
+)
+_CHECKBOXES = ('☐', '☑')
+_STATUS_BAR_TEMPLATE = " {mode}  ⏱ {now}  🧩 {task}  📦 {proj}  🟢 {active}  🎨 {theme}"
+
+
+def color_for_date(
+    d: Optional[str],
+    today: Union[dt.date, str],
+    palette: Optional[Dict[str, str]] = None,
+) -> str:
+    """Pick the date colour for ``d`` relative to ``today``.
+
+    ``today`` may be passed pre-formatted as an ISO string so callers colouring
+    many rows can format it once; both sides go through the cached
+    ``_parse_iso_date``, so an impossible date on either side counts as unknown.
+    """
+    dd = _parse_iso_date(d) if d else None
+    today_date = _parse_iso_date(today) if isinstance(today, str) else today
+    if dd is None or today_date is None:
         if palette:
             return palette.get('unknown', 'ansigray')
         return "ansigray"
-    if dd == today:
+    if dd == today_date:
         if palette:
             return palette.get('today', 'ansired bold')
         return "ansired bold"
-    if dd < today:
+    if dd < today_date:
         if palette:
             return palette.get('past', 'ansiyellow')
         return "ansiyellow"
@@ -4353,6 +4613,7 @@ def _sanitize_cell_text(s: Optional[str]) -> str:
     return (s or "").replace("\n", " ").replace("\r", " ")
 
 
+@functools.lru_cache(maxsize=4096)
 def _truncate(s: str, maxlen: int) -> str:
     """Truncate string to a maximum display width, preserving whole glyphs."""
     s = _sanitize_cell_text(s)
@@ -4379,6 +4640,7 @@ def _truncate(s: str, maxlen: int) -> str:
     return ellipsis if maxlen >= ell_w else ""
 
 
+@functools.lru_cache(maxsize=8192)
 def _pad_display(text: Optional[str], width: int, align: str = "left") -> str:
     """Pad/truncate text to an exact display width using spaces."""
     align = align.lower()
@@ -4395,11 +4657,327 @@ def _pad_display(text: Optional[str], width: int, align: str = "left") -> str:
         return (" " * pad) + raw
     return raw + (" " * pad)
 
-def build_fragments(tasks: List[TaskRow], today: dt.date) -> List[Tuple[str, str]]:
-    """Return a list of (style, text) tuples for FormattedTextControl."""
+
+@functools.lru_cache(maxsize=2048)
+def _parse_task_labels(raw: str) -> Tuple[str, ...]:
+    """Parse a row's labels JSON into the non-empty label names."""
+    try:
+        data = json.loads(raw or "[]")
+        return tuple(str(x) for x in data if isinstance(x, str) and x)
+    except Exception:
+        return ()
+
+
+@functools.lru_cache(maxsize=2048)
+def _labels_cell_text(raw: str, empty: str = '-') -> str:
+    """Comma-joined label names from a row's labels JSON, or ``empty`` when there are none."""
+    return ", ".join(_parse_task_labels(raw)) or empty
+
+
+@functools.lru_cache(maxsize=2048)
+def _assignees_cell_text(raw: str) -> str:
+    """Table cell text for a row's assignee_logins JSON: up to three @logins or '-'."""
+    try:
+        parsed = json.loads(raw or '[]')
+        if not isinstance(parsed, list):
+            parsed = []
+    except Exception:
+        parsed = []
+    names = [('@' + s) if s and not s.startswith('@') else s for s in parsed if s]
+    if not names:
+        return '-'
+    clipped = names[:3]
+    if len(names) > 3:
+        clipped.append('…')
+    return ', '.join(clipped)
+
+
+@functools.lru_cache(maxsize=256)
+def _assignees_detail_text(raw: str) -> str:
+    """Detail pane text for a row's assignee_logins JSON: distinct @logins, at most three shown."""
+    try:
+        parsed = json.loads(raw or '[]')
+        if not isinstance(parsed, list):
+            parsed = []
+    except Exception:
+        parsed = []
+    cleaned: List[str] = []
+    seen: Set[str] = set()
+    for entry in parsed:
+        login = str(entry).strip()
+        if not login:
+            continue
+        login_disp = login if login.startswith('@') else '@' + login
+        key = login_disp.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        cleaned.append(login_disp)
+        if len(cleaned) >= 5:
+            break
+    if not cleaned:
+        return '—'
+    if len(cleaned) > 3:
+        return ', '.join(cleaned[:3]) + ', …'
+    return ', '.join(cleaned)
+
+
+def _dedup_casefold(values: Iterable[str]) -> List[str]:
+    """Drop empty values and case-insensitive repeats, keeping the first spelling."""
+    by_key: Dict[str, str] = {}
+    for value in values:
+        if value:
+            by_key.setdefault(value.casefold(), value)
+    return list(by_key.values())
+
+def _table_row_segments(
+    marker: str,
+    cells: Dict[str, str],
+    column_specs: List[Tuple[str, int]],
+    row_style: str,
+    status_style: str,
+) -> List[Tuple[str, str]]:
+    """Lay out one table row: the marker, then each column's cell two spaces apart.
+
+    Works on pre-rendered cell strings only, so the row loop in
+    build_table_fragments keeps TaskRow and UI state out of the assembly step.
+    Columns missing from ``cells`` render as a padded '-'.
+    """
+    sep = (row_style, '  ')
+    segments: List[Tuple[str, str]] = [(row_style, marker)]
+    for col_id, col_width in column_specs:
+        if len(segments) > 1:
+            segments.append(sep)
+        text = cells.get(col_id)
+        if text is None:
+            text = _pad_display('-', col_width)
+        segments.append((status_style if col_id == 'status' else row_style, text))
+    return segments
+
+
+def _trim_segments(segments: List[Tuple[str, str]], offset: int) -> List[Tuple[str, str]]:
+    """Drop the first ``offset`` characters of a row (horizontal scrolling)."""
+    if offset <= 0:
+        return segments
+    ends = list(itertools.accumulate(len(text) for _, text in segments))
+    first = bisect.bisect_right(ends, offset)
+    if first >= len(segments):
+        return []
+    style_txt, text = segments[first]
+    skip = offset - (ends[first - 1] if first else 0)
+    return [(style_txt, text[skip:])] + segments[first + 1:]
+
+
+def _highlight_segments(segments: List[Tuple[str, str]], pattern: 're.Pattern[str]') -> List[Tuple[str, str]]:
+    """Underline every ``pattern`` match inside the row's segments."""
+    # Most rows don't contain the needle; one scan of the whole row rules that out.
+    if pattern.search(''.join(text for _, text in segments)) is None:
+        return segments
+    result: List[Tuple[str, str]] = []
+    for style_txt, text in segments:
+        if not text:
+            continue
+        parts = pattern.split(text)
+        if len(parts) == 1:
+            result.append((style_txt, text))
+            continue
+        matches = pattern.findall(text)
+        highlight_style = (style_txt + ' underline').strip() if style_txt else 'underline'
+        for part, match in zip(parts, matches):
+            if part:
+                result.append((style_txt, part))
+            result.append((highlight_style, match))
+        if parts[-1]:
+            result.append((style_txt, parts[-1]))
+    return result
+
+
+def _merge_style_runs(segments: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Join adjacent fragments that share a style so the renderer sees fewer pieces."""
+    merged: List[Tuple[str, str]] = []
+    for style, text in segments:
+        if not text:
+            continue
+        if merged and merged[-1][0] == style:
+            merged[-1] = (style, merged[-1][1] + text)
+        else:
+            merged.append((style, text))
+    return merged
+
+
+@functools.lru_cache(maxsize=1024)
+def _dirty_cell_text(value: Optional[str], dirty: bool) -> str:
+    """Cell text for a field that may have an unsynced local edit (marked with '*')."""
+    return (value or '-') + ('*' if dirty else '')
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_hm(seconds: int) -> str:
+    """Format a duration as H:MM."""
+    h, r = divmod(int(max(0, seconds)), 3600)
+    return f"{h:d}:{r // 60:02d}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_mmss(seconds: int) -> str:
+    """Format a duration as MM:SS (minutes are not wrapped into hours)."""
+    m, s = divmod(int(max(0, seconds)), 60)
+    return f"{m:02d}:{s:02d}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_hms(seconds: int) -> str:
+    """Format a duration as H:MM:SS, or MM:SS when under an hour."""
+    h, r = divmod(int(max(0, seconds)), 3600)
+    m, s = divmod(r, 60)
+    return f"{h:d}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _time_cell_text(current_seconds: int, total_seconds: int) -> str:
+    """Text for the table's Time column: running session MM:SS | logged total H:MM."""
+    return f"{_fmt_mmss(current_seconds)}|{_fmt_hm(total_seconds)}"
+
+
+_TIME_TEXT_IDLE = "00:00|0:00"  # _time_cell_text(0, 0): not running, nothing logged
+
+
+_BARS = tuple('█' * n for n in range(31))  # timer report bars are 1..30 cells long
+
+
+@functools.lru_cache(maxsize=256)
+def _meter_bar(filled: int, width: int) -> str:
+    """A ``width``-cell meter with ``filled`` solid cells, as drawn in the summary panel."""
+    return '█' * filled + '░' * (width - filled)
+
+
+@functools.lru_cache(maxsize=1024)
+def _session_row_text(marker: str, number: int, start_disp: str, end_disp: str, duration: int, running: bool) -> str:
+    """One line of the timer session editor's session list."""
+    running_flag = ' ⏱' if running else ''
+    return f"{marker} {number:02d}  {start_disp}  ->  {end_disp:<19}  {_fmt_hms(duration):>9}{running_flag}"
+
+
+def _report_bar_lines(items: List[Tuple[str, int]], label_width: int = 10) -> List[str]:
+    """Timer report rows: label, duration and a bar scaled to the largest value."""
+    if not items:
+        return ["  (no data)"]
+    maxv = max(secs for _, secs in items) or 1
+    return [
+        f"  {label:<{label_width}} {_fmt_hms(secs):>10}  {_BARS[max(1, int(30 * secs / maxv))]}"
+        for label, secs in items
+    ]
+
+
+# Task field editor: field type -> (field_info, row) -> (display value, extra lines).
+def _edit_field_priority(field_info: Dict[str, object], row: Optional[TaskRow]) -> Tuple[str, Tuple[str, ...]]:
+    opts = field_info.get('options') or []
+    if opts:
+        index = max(0, min(field_info.get('index', 0), len(opts)-1))
+        value = opts[index].get('name')
+        if row and row.priority_dirty:
+            value = (value or '-') + '*'
+        return value, ()
+    fallback = (row.priority or '').strip() if row else ''
+    if fallback:
+        return fallback, ()
+    return ('(load options)' if field_info.get('field_available') else '(none)'), ()
+
+
+def _edit_field_list(field_info: Dict[str, object], row: Optional[TaskRow]) -> Tuple[str, Tuple[str, ...]]:
+    vals = field_info.get('value') or []
+    if isinstance(vals, list):
+        return ', '.join(vals) or '-', ()
+    return str(vals) or '-', ()
+
+
+def _edit_field_iteration(field_info: Dict[str, object], row: Optional[TaskRow]) -> Tuple[str, Tuple[str, ...]]:
+    opts = field_info.get('options') or []
+    if opts:
+        opt = opts[max(0, min(field_info.get('index', 0), len(opts)-1))]
+        title = (opt.get('title') or '').strip()
+        start = (opt.get('startDate') or '').strip()
+        if title and start:
+            return f"{title} ({start})", ()
+        return title or start or '-', ()
+    value = field_info.get('value') or ''
+    if not value:
+        value = '(load options)' if field_info.get('field_available') else '(none)'
+    return value, ()
+
+
+def _edit_field_comment_history(field_info: Dict[str, object], row: Optional[TaskRow]) -> Tuple[str, Tuple[str, ...]]:
+    values = field_info.get('value') or []
+    if isinstance(values, list) and values:
+        return values[0], tuple(values[1:])
+    if isinstance(values, list):
+        return '(no comments)', ()
+    return str(values) or '(no comments)', ()
+
+
+def _edit_field_default(field_info: Dict[str, object], row: Optional[TaskRow]) -> Tuple[str, Tuple[str, ...]]:
+    return field_info.get('value', ''), ()
+
+
+_EDIT_FIELD_RENDERERS: Dict[str, Callable[[Dict[str, object], Optional[TaskRow]], Tuple[str, Tuple[str, ...]]]] = {
+    'priority': _edit_field_priority,
+    'assignees': _edit_field_list,
+    'labels': _edit_field_list,
+    'iteration': _edit_field_iteration,
+    'priority-text': lambda field_info, row: (field_info.get('value') or '-', ()),
+    'comment': lambda field_info, row: ('(add comment)', ()),
+    'comment-history': _edit_field_comment_history,
+}
+
+
+def _join_styled_lines(styles: List[str], texts: List[str]) -> List[Tuple[str, str]]:
+    """Join parallel style/line lists into fragments, one per run of equal styles."""
+    fragments: List[Tuple[str, str]] = []
+    count = len(texts)
+    start = 0
+    while start < count:
+        style = styles[start]
+        end = start + 1
+        while end < count and styles[end] == style:
+            end += 1
+        text = '\n'.join(texts[start:end])
+        if end < count:
+            text += '\n'
+        if text:
+            fragments.append((style, text))
+        start = end
+    return fragments
+
+
+@functools.lru_cache(maxsize=8)
+def _box_frame_parts(width: int) -> Tuple[str, str, str, str, str]:
+    """Return (top, title_fmt, line_fmt, separator, bottom) for a boxed panel of ``width``."""
+    span = max(0, width - 4)
+    border = "─" * (width - 2)
+    return (
+        "╭" + border + "╮",
+        f"│ {{:^{span}}} │",
+        f"│ {{:<{span}}} │",
+        "├" + border + "┤",
+        "╰" + border + "╯",
+    )
+
+
+def build_fragments(
+    tasks: List[TaskRow],
+    today: dt.date,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> List[Tuple[str, str]]:
+    """Return a list of (style, text) tuples for FormattedTextControl.
+
+    Only ``tasks[start:end]`` is rendered; a project header is emitted for every
+    group that intersects that window, including one that began above it.
+    """
     frags: List[Tuple[str, str]] = []
     if not tasks:
         return [("bold", "Nothing to show."), ("", " Press "), ("bold", "u"), ("", " to fetch.")]
+    visible = tasks[max(0, start):end]
 
     def _assignee_display(row: TaskRow) -> str:
         raw = row.assignee_logins or '[]'
@@ -4427,9 +5005,10 @@ def build_fragments(tasks: List[TaskRow], today: dt.date) -> List[Tuple[str, str
             return display
         return "@me" if row.assigned_to_me else '-'
 
+    today_iso = today.isoformat()
     current: Optional[str] = None
     header = "Focus Day   Start Date   End Date    Status   Priority   Assignees           Title                                     Repo                 URL"
-    for t in tasks:
+    for t in visible:
         if t.project_title != current:
             current = t.project_title
             if frags:
@@ -4438,12 +5017,12 @@ def build_fragments(tasks: List[TaskRow], today: dt.date) -> List[Tuple[str, str
             frags.append(("", "\n"))
             frags.append(("bold", header))
             frags.append(("", "\n"))
-        col = color_for_date(t.focus_date, today)
+        col = color_for_date(t.focus_date, today_iso)
         focus_cell = _pad_display(t.focus_date or '-', 11)
         start_cell = _pad_display(t.start_date, 12)
         end_cell = _pad_display(t.end_date or '-', 12)
         status_cell = _pad_display(t.status or '-', 10)
-        priority_cell = _pad_display((t.priority or '-') + ('*' if getattr(t, 'priority_dirty', 0) else ''), 10)
+        priority_cell = _pad_display(_dirty_cell_text(t.priority, bool(t.priority_dirty)), 10)
         assignee_cell = _pad_display(_assignee_display(t), 20)
         title_cell = _pad_display(t.title, 45)
         repo_cell = _pad_display(t.repo or '-', 20)
@@ -4496,6 +5075,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
     status_line = ""
     pending_status_urls: Set[str] = set()
     pending_priority_urls: Set[str] = set()
+    row_edit_locks: Dict[str, List[object]] = {}  # url -> [asyncio.Lock, active users]
     show_start_column = True
     show_end_column = True
     show_assignee_column = True
@@ -4515,8 +5095,24 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         'project': {'ts': 0.0, 'data': {}, 'tops': []},
         'label': {'ts': 0.0, 'data': {}, 'tops': []},
     }
+    summary_fragments_cache: Dict[str, object] = {'key': None, 'fragments': []}
+    timer_frame_ttl = 1.0  # seconds; redraws inside this window share timer lookups
+    timer_frame_cache: Dict[str, object] = {'ts': 0.0, 'active_urls': None, 'project_secs': {}}
+    status_snapshot_ttl = 0.5  # seconds; fast redraws reuse the status bar's task timers
+    status_snapshot_cache: Dict[str, object] = {'ts': 0.0, 'key': None, 'vals': (0, 0)}
     issue_detail_cache: Dict[str, Dict[str, object]] = {}
     issue_detail_tasks: Dict[str, asyncio.Task] = {}
+    repo_metadata_cache_ttl = 120.0  # seconds; reuse repo labels/assignees across add overlays
+    repo_metadata_cache: Dict[str, Dict[str, object]] = {}
+    repo_labels_inflight: Dict[str, asyncio.Future] = {}
+    repo_labels_prefetch_limit = 8  # other repos in view to warm when the label editor opens
+    recent_repos_cache_ttl = 30.0  # seconds; fallback repo list for projects without known repos
+    recent_repos_cache: Dict[str, object] = {'ts': 0.0, 'data': None}
+    # Column widths/header only change on resize or column toggles.
+    table_layout_cache: Dict[str, object] = {'key': None, 'columns': [], 'header': '', 'lookup': {}, 'widths': {}}
+    search_highlight_cache: Dict[str, object] = {'needle': None, 'pattern': None}
+    # Last table fragments with the filtered list and view state they were built from.
+    table_fragments_cache: Dict[str, object] = {'rows': None, 'key': None, 'fragments': []}
 
     def _schedule_issue_detail_fetch(url: str, comment_limit: int) -> None:
         if not token or not _parse_issue_url(url):
@@ -4538,7 +5134,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         async def _load() -> None:
             try:
                 loop_inner = asyncio.get_running_loop()
-                data = await loop_inner.run_in_executor(None, lambda: fetch_issue_details(token, url, comment_limit))
+                data = await loop_inner.run_in_executor(_GH_EXECUTOR, functools.partial(fetch_issue_details, token, url, comment_limit))
             except Exception as exc:
                 issue_detail_cache[url] = {
                     'tasks': base_tasks,
@@ -4571,6 +5167,18 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             return
         background_handles.append(obj)
 
+    def _spawn_background(coro: Coroutine[object, object, None]) -> None:
+        """Run ``coro`` as an app background task (asyncio fallback) and track it for shutdown."""
+        try:
+            handle = app.create_background_task(coro)
+        except Exception:
+            try:
+                handle = asyncio.create_task(coro)
+            except Exception:
+                coro.close()
+                return
+        _track_background(handle if handle is not None else coro)
+
     def _drain_background_tasks(application: object) -> None:
         candidates: List[object] = []
         seen_ids: Set[int] = set()
@@ -4755,13 +5363,48 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             return BASE_THEME_STYLE[name]
         return default
 
+    # Theme presets are fixed once loaded, so (theme index, name, fallback)
+    # fully determines the class; switching themes just changes the key.
+    style_class_cache: Dict[Tuple[int, str, Optional[str]], str] = {}
+
     def _style_class(name: str, fallback: Optional[str] = None) -> str:
+        cache_key = (current_theme_index, name, fallback)
+        cached = style_class_cache.get(cache_key)
+        if cached is not None:
+            return cached
         key = name if name in theme_presets[current_theme_index].style else fallback
         if key is None and name in BASE_THEME_STYLE:
             key = name
-        if key is None:
-            return ''
-        return f"class:{key}"
+        value = f"class:{key}" if key is not None else ''
+        style_class_cache[cache_key] = value
+        return value
+
+    theme_style_groups: Dict[Tuple[int, str], object] = {}
+
+    def _date_palette() -> Dict[str, str]:
+        key = (current_theme_index, 'date_palette')
+        palette = theme_style_groups.get(key)
+        if palette is None:
+            palette = theme_style_groups[key] = {
+                'today': _style_class('table.date.today'),
+                'past': _style_class('table.date.past'),
+                'future': _style_class('table.date.future'),
+                'unknown': _style_class('table.date.unknown'),
+            }
+        return palette
+
+    def _summary_styles() -> Tuple[str, str, str, str]:
+        """(heading, label, value, accent) classes for the summary panel."""
+        key = (current_theme_index, 'summary')
+        styles = theme_style_groups.get(key)
+        if styles is None:
+            styles = theme_style_groups[key] = (
+                _style_class('summary.title'),
+                _style_class('summary.label'),
+                _style_class('summary.value'),
+                _style_class('summary.accent'),
+            )
+        return styles
 
     def _layout_int(name: str, default: int) -> int:
         value = current_layout_options.get(name) if isinstance(current_layout_options, dict) else None
@@ -4824,49 +5467,52 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         rows = all_rows if rows is None else rows
         for row in rows:
             key = (row.owner_type, row.owner, row.project_number)
-            entry = meta.setdefault(key, {
-                'owner_type': row.owner_type,
-                'owner': row.owner,
-                'project_number': row.project_number,
-                'project_title': row.project_title or "",
-                'project_id': row.project_id or "",
-                'start_field_id': row.start_field_id or "",
-                'status_field_id': row.status_field_id or "",
-                'start_field_name': row.start_field or "",
-                'focus_field_id': row.focus_field_id or "",
-                'focus_field_name': row.focus_field or "",
-                'iteration_field_id': row.iteration_field_id or "",
-                'iteration_options': _json_list(row.iteration_options),
-                'status_options': _json_list(row.status_options),
-                'priority_field_id': row.priority_field_id or "",
-                'priority_options': _json_list(row.priority_options),
-                'assignee_field_id': row.assignee_field_id or "",
-                'repos': {}
-            })
-            if not entry['project_title'] and row.project_title:
-                entry['project_title'] = row.project_title
-            if not entry['project_id'] and row.project_id:
-                entry['project_id'] = row.project_id
-            if not entry['start_field_id'] and row.start_field_id:
-                entry['start_field_id'] = row.start_field_id
-                entry['start_field_name'] = row.start_field
-            if (not entry.get('status_field_id')) and row.status_field_id:
-                entry['status_field_id'] = row.status_field_id
-            if not entry.get('status_options') and row.status_options:
-                entry['status_options'] = _json_list(row.status_options)
-            if not entry['focus_field_id'] and row.focus_field_id:
-                entry['focus_field_id'] = row.focus_field_id
-                entry['focus_field_name'] = row.focus_field or entry.get('focus_field_name', '')
-            if (not entry['iteration_field_id']) and row.iteration_field_id:
-                entry['iteration_field_id'] = row.iteration_field_id
-            if not entry['iteration_options'] and row.iteration_options:
-                entry['iteration_options'] = _json_list(row.iteration_options)
-            if not entry['priority_field_id'] and row.priority_field_id:
-                entry['priority_field_id'] = row.priority_field_id
-            if not entry['priority_options'] and row.priority_options:
-                entry['priority_options'] = _json_list(row.priority_options)
-            if not entry['assignee_field_id'] and row.assignee_field_id:
-                entry['assignee_field_id'] = row.assignee_field_id
+            entry = meta.get(key)
+            if entry is None:
+                entry = meta[key] = {
+                    'owner_type': row.owner_type,
+                    'owner': row.owner,
+                    'project_number': row.project_number,
+                    'project_title': row.project_title or "",
+                    'project_id': row.project_id or "",
+                    'start_field_id': row.start_field_id or "",
+                    'status_field_id': row.status_field_id or "",
+                    'start_field_name': row.start_field or "",
+                    'focus_field_id': row.focus_field_id or "",
+                    'focus_field_name': row.focus_field or "",
+                    'iteration_field_id': row.iteration_field_id or "",
+                    'iteration_options': _json_list(row.iteration_options),
+                    'status_options': _json_list(row.status_options),
+                    'priority_field_id': row.priority_field_id or "",
+                    'priority_options': _json_list(row.priority_options),
+                    'assignee_field_id': row.assignee_field_id or "",
+                    'repos': {}
+                }
+            else:
+                if not entry['project_title'] and row.project_title:
+                    entry['project_title'] = row.project_title
+                if not entry['project_id'] and row.project_id:
+                    entry['project_id'] = row.project_id
+                if not entry['start_field_id'] and row.start_field_id:
+                    entry['start_field_id'] = row.start_field_id
+                    entry['start_field_name'] = row.start_field
+                if (not entry.get('status_field_id')) and row.status_field_id:
+                    entry['status_field_id'] = row.status_field_id
+                if not entry.get('status_options') and row.status_options:
+                    entry['status_options'] = _json_list(row.status_options)
+                if not entry['focus_field_id'] and row.focus_field_id:
+                    entry['focus_field_id'] = row.focus_field_id
+                    entry['focus_field_name'] = row.focus_field or entry.get('focus_field_name', '')
+                if (not entry['iteration_field_id']) and row.iteration_field_id:
+                    entry['iteration_field_id'] = row.iteration_field_id
+                if not entry['iteration_options'] and row.iteration_options:
+                    entry['iteration_options'] = _json_list(row.iteration_options)
+                if not entry['priority_field_id'] and row.priority_field_id:
+                    entry['priority_field_id'] = row.priority_field_id
+                if not entry['priority_options'] and row.priority_options:
+                    entry['priority_options'] = _json_list(row.priority_options)
+                if not entry['assignee_field_id'] and row.assignee_field_id:
+                    entry['assignee_field_id'] = row.assignee_field_id
             repo_key = (row.repo or '').strip()
             if repo_key:
                 entry['repos'].setdefault(repo_key, row.repo_id or '')
@@ -4880,31 +5526,36 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 except Exception:
                     continue
                 key = (spec.owner_type, spec.owner, num_int)
-                existing = meta.setdefault(key, {
-                    'owner_type': spec.owner_type,
-                    'owner': spec.owner,
-                    'project_number': num_int,
-                    'project_title': entry.get("title") or "",
-                    'project_id': entry.get("project_id") or "",
-                    'start_field_id': "",
-                    'start_field_name': "",
-                    'focus_field_id': "",
-                    'focus_field_name': "",
-                    'iteration_field_id': "",
-                    'iteration_options': [],
-                    'priority_field_id': "",
-                    'priority_options': [],
-                    'assignee_field_id': entry.get('assignee_field_id') or "",
-                    'repos': {}
-                })
-                if not existing['project_title'] and entry.get("title"):
-                    existing['project_title'] = entry.get("title")
-                if not existing['project_id'] and entry.get("project_id"):
-                    existing['project_id'] = entry.get("project_id")
-                if not existing.get('status_field_id') and entry.get('status_field_id'):
-                    existing['status_field_id'] = entry.get('status_field_id')
-
-        choices = []
+                title = entry.get("title") or ""
+                project_id = entry.get("project_id") or ""
+                status_field_id = entry.get('status_field_id') or ""
+                existing = meta.get(key)
+                if existing is None:
+                    existing = meta[key] = {
+                        'owner_type': spec.owner_type,
+                        'owner': spec.owner,
+                        'project_number': num_int,
+                        'project_title': title,
+                        'project_id': project_id,
+                        'start_field_id': "",
+                        'start_field_name': "",
+                        'focus_field_id': "",
+                        'focus_field_name': "",
+                        'iteration_field_id': "",
+                        'iteration_options': [],
+                        'priority_field_id': "",
+                        'priority_options': [],
+                        'assignee_field_id': entry.get('assignee_field_id') or "",
+                        'repos': {}
+                    }
+                if not existing['project_title'] and title:
+                    existing['project_title'] = title
+                if not existing['project_id'] and project_id:
+                    existing['project_id'] = project_id
+                if not existing.get('status_field_id') and status_field_id:
+                    existing['status_field_id'] = status_field_id
+
+        decorated: List[Tuple[str, Dict[str, object]]] = []
         for key, entry in meta.items():
             if not entry.get('project_id'):
                 continue
@@ -4912,9 +5563,9 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             entry['project_title'] = title
             entry['iteration_options'] = entry.get('iteration_options') or []
             entry['repos'] = entry.get('repos') or {}
-            choices.append(entry)
-        choices.sort(key=lambda e: e.get('project_title', '').lower())
-        return choices
+            decorated.append((title.lower(), entry))
+        decorated.sort(key=itemgetter(0))
+        return [entry for _, entry in decorated]
 
     def _find_project_choice(choices: List[Dict[str, object]], title: str) -> Optional[Dict[str, object]]:
         target = (title or '').strip().lower()
@@ -4982,10 +5633,14 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
 
     def _build_repo_choices(project: Optional[Dict[str, object]]) -> List[Dict[str, str]]:
         repo_map = (project or {}).get('repos') or {}
-        items = sorted(repo_map.items())
-        choices = [{'repo': name, 'repo_id': rid or ''} for name, rid in items if name]
+        choices = [{'repo': name, 'repo_id': repo_map[name] or ''} for name in sorted(repo_map) if name] if repo_map else []
         if not choices:
-            recent = db.recent_repositories(limit=20)
+            now_mon = time.monotonic()
+            recent = recent_repos_cache.get('data')
+            if recent is None or (now_mon - float(recent_repos_cache.get('ts', 0.0))) >= recent_repos_cache_ttl:
+                recent = db.recent_repositories(limit=20)
+                recent_repos_cache['data'] = recent
+                recent_repos_cache['ts'] = now_mon
             choices = [{'repo': name, 'repo_id': rid or ''} for name, rid in recent if name]
         return choices
 
@@ -5008,6 +5663,55 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         add_state['calendar_date'] = ''
         add_state['calendar_prev'] = ''
 
+    def _apply_repo_metadata(labels_raw: List[Dict[str, str]], assignees_raw: List[Dict[str, str]]) -> None:
+        label_names = _dedup_casefold(
+            ((item.get('name') if isinstance(item, dict) else '') or '').strip() for item in labels_raw
+        )
+        add_state['label_choices'] = label_names
+        add_state['label_index'] = 0
+        add_state['labels_selected'] = set()
+
+        priority_options_local = add_state.get('priority_options') or []
+        priority_names = _dedup_casefold(
+            (opt.get('name') or '').strip() for opt in priority_options_local if isinstance(opt, dict)
+        )
+        if not priority_names:
+            priority_names = [nm for nm in label_names if 'priority' in nm.lower()]
+        add_state['priority_choices'] = priority_names
+        add_state['priority_index'] = 0
+        # Do not auto-select priority; let the user choose explicitly
+        add_state['priority_label'] = ''
+
+        users_by_key: Dict[str, Tuple[str, Dict[str, str]]] = {}
+        for item in assignees_raw:
+            if not isinstance(item, dict):
+                continue
+            login_val = (item.get('login') or '').strip()
+            if login_val:
+                users_by_key.setdefault(login_val.casefold(), (login_val, item))
+        decorated_users: List[Tuple[str, Dict[str, str]]] = []
+        for key, (login_val, item) in users_by_key.items():
+            real_name = (item.get('name') or '').strip()
+            if real_name and real_name.casefold() != key:
+                display = f"{login_val} ({real_name})"
+            else:
+                display = login_val
+            decorated_users.append((display.lower(), {'login': login_val, 'display': display}))
+        decorated_users.sort(key=itemgetter(0))
+        assignee_entries = [entry for _, entry in decorated_users]
+        add_state['assignee_choices'] = assignee_entries
+        add_state['assignee_index'] = 0
+        default_login = (cfg.user or '').strip().casefold()
+        selected_assignees: Set[str] = set()
+        if default_login:
+            for i, entry in enumerate(assignee_entries):
+                if entry['login'].casefold() == default_login:
+                    selected_assignees.add(entry['login'])
+                    add_state['assignee_index'] = i
+                    break
+        add_state['assignees_selected'] = selected_assignees
+        add_state['metadata_error'] = '' if label_names else 'No labels found for repository'
+
     async def _fetch_repo_metadata(repo_full_name: str) -> None:
         nonlocal add_state, status_line
         if not token:
@@ -5025,15 +5729,13 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             invalidate()
             return
 
-        def _do_fetch():
-            return (
-                list_repo_labels(token, repo_full_name),
-                list_repo_assignees(token, repo_full_name),
-            )
-
+        labels_fut = loop.run_in_executor(_GH_EXECUTOR, list_repo_labels, token, repo_full_name)
+        assignees_fut = loop.run_in_executor(_GH_EXECUTOR, list_repo_assignees, token, repo_full_name)
         try:
-            labels_raw, assignees_raw = await loop.run_in_executor(None, _do_fetch)
+            labels_raw, assignees_raw = await asyncio.gather(labels_fut, assignees_fut)
         except asyncio.CancelledError:
+            labels_fut.cancel()
+            assignees_fut.cancel()
             return
         except Exception as exc:
             add_state['metadata_error'] = f'Metadata error: {exc}'
@@ -5041,74 +5743,12 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             add_state['priority_choices'] = []
             add_state['assignee_choices'] = []
         else:
-            label_names: List[str] = []
-            seen_labels: Set[str] = set()
-            for item in labels_raw:
-                name_val = (item.get('name') if isinstance(item, dict) else '') or ''
-                name_clean = name_val.strip()
-                if not name_clean:
-                    continue
-                key = name_clean.lower()
-                if key in seen_labels:
-                    continue
-                seen_labels.add(key)
-                label_names.append(name_clean)
-            add_state['label_choices'] = label_names
-            add_state['label_index'] = 0 if label_names else 0
-            add_state['labels_selected'] = set()
-
-            priority_options_local = add_state.get('priority_options') or []
-            priority_names: List[str] = []
-            seen_priority: Set[str] = set()
-            for opt in priority_options_local:
-                if not isinstance(opt, dict):
-                    continue
-                name_val = (opt.get('name') or '').strip()
-                if not name_val:
-                    continue
-                key = name_val.lower()
-                if key in seen_priority:
-                    continue
-                seen_priority.add(key)
-                priority_names.append(name_val)
-            if not priority_names:
-                priority_names = [nm for nm in label_names if 'priority' in nm.lower()]
-            add_state['priority_choices'] = priority_names
-            add_state['priority_index'] = 0 if priority_names else 0
-            # Do not auto-select priority; let the user choose explicitly
-            add_state['priority_label'] = ''
-
-            assignee_entries: List[Dict[str, str]] = []
-            seen_users: Set[str] = set()
-            for item in assignees_raw:
-                if not isinstance(item, dict):
-                    continue
-                login_val = (item.get('login') or '').strip()
-                if not login_val:
-                    continue
-                key = login_val.lower()
-                if key in seen_users:
-                    continue
-                seen_users.add(key)
-                real_name = (item.get('name') or '').strip()
-                if real_name and real_name.lower() != key:
-                    display = f"{login_val} ({real_name})"
-                else:
-                    display = login_val
-                assignee_entries.append({'login': login_val, 'display': display})
-            assignee_entries.sort(key=lambda x: x['display'].lower())
-            add_state['assignee_choices'] = assignee_entries
-            add_state['assignee_index'] = 0 if assignee_entries else 0
-            default_login = (cfg.user or '').strip().lower()
-            selected_assignees: Set[str] = set()
-            if default_login:
-                for entry in assignee_entries:
-                    if entry['login'].strip().lower() == default_login:
-                        selected_assignees.add(entry['login'])
-                        add_state['assignee_index'] = assignee_entries.index(entry)
-                        break
-            add_state['assignees_selected'] = selected_assignees
-            add_state['metadata_error'] = '' if label_names else 'No labels found for repository'
+            repo_metadata_cache[repo_full_name.lower()] = {
+                'ts': time.monotonic(),
+                'labels': labels_raw,
+                'assignees': assignees_raw,
+            }
+            _apply_repo_metadata(labels_raw, assignees_raw)
         finally:
             add_state['loading_repo_metadata'] = False
             add_state['repo_metadata_task'] = None
@@ -5127,6 +5767,19 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         task = add_state.get('repo_metadata_task')
         if isinstance(task, asyncio.Task):
             task.cancel()
+        cached = repo_metadata_cache.get(repo_full_name.lower())
+        # Entries warmed by the label editor carry labels only (assignees=None).
+        if cached and cached.get('assignees') is not None and (time.monotonic() - float(cached.get('ts', 0.0))) < repo_metadata_cache_ttl:
+            add_state['repo_metadata_source'] = repo_full_name
+            add_state['repo_metadata_task'] = None
+            add_state['loading_repo_metadata'] = False
+            add_state['calendar_active'] = False
+            add_state['calendar_field'] = ''
+            add_state['calendar_date'] = ''
+            add_state['calendar_prev'] = ''
+            _apply_repo_metadata(cached.get('labels') or [], cached.get('assignees') or [])
+            invalidate()
+            return
         add_state['repo_metadata_source'] = repo_full_name
         add_state['loading_repo_metadata'] = True
         add_state['metadata_error'] = ''
@@ -5150,12 +5803,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         nonlocal status_line
         if field not in ('start', 'end', 'focus'):
             return
-        field_map = {
-            'start': ('start_date', 'start_cursor'),
-            'end': ('end_date', 'end_cursor'),
-            'focus': ('focus_date', 'focus_cursor'),
-        }
-        field_key, cursor_key = field_map[field]
+        field_key, cursor_key = _ADD_DATE_FIELD_MAP[field]
         raw = (add_state.get(field_key) or '').strip()
         fallback_raw = raw
         if not raw:
@@ -5185,13 +5833,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         if not add_state.get('calendar_active'):
             return
         field = add_state.get('calendar_field') or ''
-        field_map = {
-            'start': ('start_date', 'start_cursor'),
-            'end': ('end_date', 'end_cursor'),
-            'focus': ('focus_date', 'focus_cursor'),
-        }
-        if field in field_map:
-            field_key, cursor_key = field_map[field]
+        if field in _ADD_DATE_FIELD_MAP:
+            field_key, cursor_key = _ADD_DATE_FIELD_MAP[field]
             prev = add_state.get('calendar_prev', '') or ''
             add_state[field_key] = prev
             add_state[cursor_key] = len(prev)
@@ -5238,295 +5881,274 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         except Exception:
             current = dt.date.today()
         if months:
-            month = current.month - 1 + months
-            year = current.year + month // 12
-            month = (month % 12) + 1
-            day = min(current.day, calendar.monthrange(year, month)[1])
-            current = dt.date(year, month, day)
+            current = _shift_months(current, months)
         if days:
             current += dt.timedelta(days=days)
         add_state['calendar_date'] = current.isoformat()
         invalidate()
 
-    def build_add_overlay() -> List[Tuple[str, str]]:
-        if not add_mode:
-            return []
-        step = add_state.get('step', 'project')
-        project = _current_add_project()
-        mode_label = 'Issue' if add_state.get('mode', 'issue') == 'issue' else 'Project Task'
-        repo_full = (add_state.get('repo_full_name') or '').strip()
-        metadata_error = add_state.get('metadata_error', '')
-        loading_metadata = bool(add_state.get('loading_repo_metadata'))
+    def _add_overlay_body_mode(body: List[str]) -> None:
+        body.append("Use j/k to move, Enter to choose, Esc to cancel")
+        choices = add_state.get('mode_choices') or []
+        for idx, label in enumerate(choices):
+            prefix = "➤" if idx == add_state.get('mode_index', 0) else " "
+            body.append(f" {prefix} {label}")
 
-        headers = {
-            'mode': '🧷 Choose Type',
-            'project': '📁 Select Project',
-            'repo': '📦 Select Repository',
-            'title': '📝 Enter Title',
-            'start': '📅 Start Date (YYYY-MM-DD)',
-            'end': '📆 End Date (optional)',
-            'focus': '🎯 Focus Day (YYYY-MM-DD)',
-            'iteration': '🔁 Select Iteration',
-            'iteration-create': '➕ New Iteration',
-            'labels': '🏷️ Select Labels',
-            'priority': '⚡ Select Priority',
-            'assignee': '👥 Choose Assignees',
-            'comment': '💬 Initial Comment',
-            'confirm': '✅ Confirm',
-        }
-        title_head = headers.get(step, '➕ Add Item')
-        body: List[str] = []
+    def _add_overlay_body_project(body: List[str]) -> None:
+        body.append("Use j/k to move, Enter to choose, Esc to cancel")
+        choices = add_state.get('project_choices') or []
+        if not choices:
+            body.append("  (no projects available)")
+        for idx, proj in enumerate(choices):
+            prefix = "➤" if idx == add_state.get('project_index', 0) else " "
+            body.append(f" {prefix} {proj.get('project_title')} (#{proj.get('project_number')})")
 
-        if step == 'mode':
-            body.append("Use j/k to move, Enter to choose, Esc to cancel")
-            choices = add_state.get('mode_choices') or []
-            for idx, label in enumerate(choices):
-                prefix = "➤" if idx == add_state.get('mode_index', 0) else " "
-                body.append(f" {prefix} {label}")
-        elif step == 'project':
+    def _add_overlay_body_repo(body: List[str]) -> None:
+        metadata_error = add_state.get('metadata_error', '')
+        loading_metadata = bool(add_state.get('loading_repo_metadata'))
+        choices = add_state.get('repo_choices') or []
+        if choices:
             body.append("Use j/k to move, Enter to choose, Esc to cancel")
-            choices = add_state.get('project_choices') or []
-            if not choices:
-                body.append("  (no projects available)")
-            for idx, proj in enumerate(choices):
-                prefix = "➤" if idx == add_state.get('project_index', 0) else " "
-                body.append(f" {prefix} {proj.get('project_title')} (#{proj.get('project_number')})")
-        elif step == 'repo':
-            choices = add_state.get('repo_choices') or []
-            if choices:
-                body.append("Use j/k to move, Enter to choose, Esc to cancel")
-                for idx, repo_entry in enumerate(choices):
-                    prefix = "➤" if idx == add_state.get('repo_index', 0) else " "
-                    body.append(f" {prefix} {repo_entry.get('repo')}")
-                if loading_metadata:
-                    body.append("")
-                    body.append(" Loading metadata…")
-            else:
-                body.append("Type owner/name, Enter to confirm, Esc to cancel")
-                r = add_state.get('repo_manual', '')
-                cur = max(0, min(len(r), add_state.get('repo_cursor', len(r))))
-                body.append(r[:cur] + "_" + r[cur:])
-                if loading_metadata:
-                    body.append("")
-                    body.append(" Loading metadata…")
-                elif metadata_error:
-                    body.append(f" ⚠️ {metadata_error}")
-        elif step == 'title':
-            body.append("Type a concise title, Enter to continue, Esc cancel")
-            text = add_state.get('title', '')
-            cur = max(0, min(len(text), add_state.get('title_cursor', len(text))))
-            body.append(text[:cur] + "_" + text[cur:])
-        elif step in ('start', 'end', 'focus'):
-            prompts = {
-                'start': 'Enter Start Date (YYYY-MM-DD)',
-                'end': 'Enter End Date (optional, YYYY-MM-DD)',
-                'focus': 'Enter Focus Day (YYYY-MM-DD)',
-            }
-            field_map = {
-                'start': ('start_date', 'start_cursor'),
-                'end': ('end_date', 'end_cursor'),
-                'focus': ('focus_date', 'focus_cursor'),
-            }
-            prompt = prompts.get(step, 'Enter Date')
-            field_key, cursor_key = field_map[step]
-            if add_state.get('calendar_active') and add_state.get('calendar_field') == step:
-                iso = add_state.get('calendar_date') or add_state.get(field_key) or dt.date.today().isoformat()
-                try:
-                    cursor_date = dt.date.fromisoformat(str(iso))
-                except Exception:
-                    cursor_date = dt.date.today()
-                cal = calendar.Calendar(firstweekday=0)
-                body.append("Use h/l day, j/k week, </> month, t today, Enter=save, Esc=cancel, Tab=close")
-                body.append(cursor_date.strftime("%B %Y"))
-                header = ''.join(f" {calendar.day_abbr[i][:2]} " for i in range(7))
-                body.append(header)
-                for week in cal.monthdatescalendar(cursor_date.year, cursor_date.month):
-                    row_cells: List[str] = []
-                    for day in week:
-                        label = f"{day.day:2d}"
-                        if day == cursor_date:
-                            cell = f"[{label}]"
-                        elif day.month != cursor_date.month:
-                            cell = f"({label})"
-                        else:
-                            cell = f" {label} "
-                        row_cells.append(cell)
-                    body.append(''.join(row_cells))
-            else:
-                body.append(f"{prompt}. Enter to continue, Esc cancel, press Tab or C for calendar")
-                val = add_state.get(field_key, '')
-                cur = max(0, min(len(val), add_state.get(cursor_key, len(val))))
-                body.append(val[:cur] + "_" + val[cur:])
-        elif step == 'iteration':
-            body.append("Use j/k to move, Enter to choose, Esc cancel")
-            choices = add_state.get('iteration_choices') or []
-            if not choices:
-                body.append("  (no iterations configured)")
-            for idx, opt in enumerate(choices):
-                prefix = "➤" if idx == add_state.get('iteration_index', 0) else " "
-                label = opt.get('title') or '(None)'
-                body.append(f" {prefix} {label}")
-        elif step == 'iteration-create':
-            body.append("Enter: title | YYYY-MM-DD | duration days (duration optional)")
-            default_days = _default_iteration_duration(add_state.get('iteration_choices') or [])
-            body.append(f"Default duration: {default_days} days")
-            if add_state.get('iteration_creating'):
+            for idx, repo_entry in enumerate(choices):
+                prefix = "➤" if idx == add_state.get('repo_index', 0) else " "
+                body.append(f" {prefix} {repo_entry.get('repo')}")
+            if loading_metadata:
                 body.append("")
-                body.append(" Creating iteration…")
-            elif add_state.get('iteration_create_error'):
-                body.append(f" ⚠️ {add_state.get('iteration_create_error')}")
-            raw = add_state.get('iteration_create', '')
-            cur = max(0, min(len(raw), add_state.get('iteration_create_cursor', len(raw))))
-            body.append(raw[:cur] + "_" + raw[cur:])
-        elif step == 'labels':
-            labels = add_state.get('label_choices') or []
-            selected = add_state.get('labels_selected') or set()
-            if not isinstance(selected, set):
-                selected = set(selected)
-            idx = max(0, min(len(labels)-1, add_state.get('label_index', 0))) if labels else 0
+                body.append(" Loading metadata…")
+        else:
+            body.append("Type owner/name, Enter to confirm, Esc to cancel")
+            r = add_state.get('repo_manual', '')
+            cur = max(0, min(len(r), add_state.get('repo_cursor', len(r))))
+            body.append(r[:cur] + "_" + r[cur:])
             if loading_metadata:
-                body.append(f"Loading labels for {repo_full or '(repo pending)'}…")
+                body.append("")
+                body.append(" Loading metadata…")
             elif metadata_error:
-                body.append(f"⚠️ {metadata_error}")
-            body.append("Use j/k to move, Space to toggle, Enter to continue, Esc cancel")
-            if not labels:
-                body.append("  (no labels available)")
-            for i, name in enumerate(labels):
-                prefix = "➤" if i == idx else " "
-                marker = '✔' if name in selected else ' '
-                body.append(f" {prefix} [{marker}] {name}")
-        elif step == 'priority':
-            priorities = add_state.get('priority_choices') or []
-            selected_label = (add_state.get('priority_label') or '').strip()
-            idx = max(0, min(len(priorities)-1, add_state.get('priority_index', 0))) if priorities else 0
-            if loading_metadata:
-                body.append(f"Loading labels for {repo_full or '(repo pending)'}…")
-            elif metadata_error and not priorities:
-                body.append(f"⚠️ {metadata_error}")
-            body.append("Use j/k to move, Space to select, Enter to continue, Esc cancel")
-            if not priorities:
-                body.append("  (no priority candidates; leave blank if not needed)")
-            for i, name in enumerate(priorities):
-                prefix = "➤" if i == idx else " "
-                marker = '●' if name == selected_label else '○'
-                body.append(f" {prefix} {marker} {name}")
-        elif step == 'assignee':
-            assignees = add_state.get('assignee_choices') or []
-            selected = add_state.get('assignees_selected') or set()
-            if not isinstance(selected, set):
-                selected = set(selected)
-            idx = max(0, min(len(assignees)-1, add_state.get('assignee_index', 0))) if assignees else 0
-            if loading_metadata:
-                body.append(f"Loading assignees for {repo_full or '(repo pending)'}…")
-            elif metadata_error and not assignees:
-                body.append(f"⚠️ {metadata_error}")
-            body.append("Use j/k to move, Space to toggle, Enter to continue, Esc cancel")
-            if not assignees:
-                body.append("  (no assignable users found)")
-            for i, entry in enumerate(assignees):
-                prefix = "➤" if i == idx else " "
-                marker = '✔' if entry.get('login') in selected else ' '
-                body.append(f" {prefix} [{marker}] {entry.get('display') or entry.get('login')}")
-        elif step == 'comment':
-            body.append("Type an optional comment (Ctrl+J=newline), Enter to continue, Esc cancel")
-            comment = add_state.get('comment', '')
-            cur = max(0, min(len(comment), add_state.get('comment_cursor', len(comment))))
-            display = comment[:cur] + "_" + comment[cur:]
-            for line in display.splitlines():
-                body.append(line)
-        elif step == 'confirm':
-            title_val = add_state.get('title', '').strip()
-            start_val = (add_state.get('start_date') or '').strip() or '(auto)'
-            end_val = (add_state.get('end_date') or '').strip() or '(none)'
-            focus_val = (add_state.get('focus_date') or '').strip() or '(none)'
-            iteration_choices = add_state.get('iteration_choices') or []
-            iteration_idx = add_state.get('iteration_index', 0)
-            iter_label = '(none)'
-            if iteration_choices:
-                opt = iteration_choices[max(0, min(iteration_idx, len(iteration_choices)-1))]
-                iter_label = opt.get('title') or '(none)'
-            repo_label = repo_full or '(n/a)'
-            labels_selected = add_state.get('labels_selected') or set()
-            if not isinstance(labels_selected, set):
-                labels_selected = set(labels_selected)
-            label_choices = add_state.get('label_choices') or []
-            label_list = [name for name in label_choices if name in labels_selected]
-            priority_label = (add_state.get('priority_label') or '').strip() or '(none)'
-            assignees_selected = add_state.get('assignees_selected') or set()
-            if not isinstance(assignees_selected, set):
-                assignees_selected = set(assignees_selected)
-            assignee_entries = add_state.get('assignee_choices') or []
-            assignee_display = []
-            for entry in assignee_entries:
-                login = entry.get('login')
-                if login in assignees_selected:
-                    assignee_display.append(entry.get('display') or login)
-            assignee_display.extend(sorted({login for login in assignees_selected if login not in {e.get('login') for e in assignee_entries}}))
-            comment_val = add_state.get('comment', '')
-
-            body.append("Review and press Enter to create, Esc cancel")
+                body.append(f" ⚠️ {metadata_error}")
+
+    def _add_overlay_body_title(body: List[str]) -> None:
+        body.append("Type a concise title, Enter to continue, Esc cancel")
+        text = add_state.get('title', '')
+        cur = max(0, min(len(text), add_state.get('title_cursor', len(text))))
+        body.append(text[:cur] + "_" + text[cur:])
+
+    def _add_overlay_body_date(step: str, body: List[str]) -> None:
+        prompt = _ADD_DATE_PROMPTS.get(step, 'Enter Date')
+        field_key, cursor_key = _ADD_DATE_FIELD_MAP[step]
+        if add_state.get('calendar_active') and add_state.get('calendar_field') == step:
+            iso = add_state.get('calendar_date') or add_state.get(field_key) or dt.date.today().isoformat()
+            try:
+                cursor_date = dt.date.fromisoformat(str(iso))
+            except Exception:
+                cursor_date = dt.date.today()
+            body.append("Use h/l day, j/k week, </> month, t today, Enter=save, Esc=cancel, Tab=close")
+            body.append(cursor_date.strftime("%B %Y"))
+            body.append(_CALENDAR_DAY_HEADER)
+            body.extend(_calendar_week_lines(cursor_date))
+        else:
+            body.append(f"{prompt}. Enter to continue, Esc cancel, press Tab or C for calendar")
+            val = add_state.get(field_key, '')
+            cur = max(0, min(len(val), add_state.get(cursor_key, len(val))))
+            body.append(val[:cur] + "_" + val[cur:])
+
+    def _add_overlay_body_iteration(body: List[str]) -> None:
+        body.append("Use j/k to move, Enter to choose, Esc cancel")
+        choices = add_state.get('iteration_choices') or []
+        if not choices:
+            body.append("  (no iterations configured)")
+        for idx, opt in enumerate(choices):
+            prefix = "➤" if idx == add_state.get('iteration_index', 0) else " "
+            label = opt.get('title') or '(None)'
+            body.append(f" {prefix} {label}")
+
+    def _add_overlay_body_iteration_create(body: List[str]) -> None:
+        body.append("Enter: title | YYYY-MM-DD | duration days (duration optional)")
+        default_days = _default_iteration_duration(add_state.get('iteration_choices') or [])
+        body.append(f"Default duration: {default_days} days")
+        if add_state.get('iteration_creating'):
             body.append("")
-            body.append(f"📁 Project  : {project.get('project_title') if project else '(unknown)'}")
-            body.append(f"🧷 Type     : {mode_label}")
-            if add_state.get('mode', 'issue') == 'issue':
-                body.append(f"📦 Repo     : {repo_label}")
-            body.append(f"📝 Title    : {title_val or '(missing)'}")
-            body.append(f"🗓️ Start    : {start_val}")
-            body.append(f"📆 End      : {end_val}")
-            body.append(f"🎯 Focus    : {focus_val}")
-            body.append(f"🔁 Iteration: {iter_label}")
-            if add_state.get('mode', 'issue') == 'issue':
-                body.append(f"🏷️ Labels   : {', '.join(label_list) if label_list else '(none)'}")
-                body.append(f"⚡ Priority : {priority_label}")
-                body.append(f"👥 Assignees: {', '.join(assignee_display) if assignee_display else '(none)'}")
-                if comment_val.strip():
-                    lines = comment_val.splitlines() or ['']
-                    body.append(f"💬 Comment  : {lines[0]}")
-                    for line in lines[1:]:
-                        body.append(f"             {line}")
-                else:
-                    body.append("💬 Comment  : (none)")
-
-        def boxed(title: str, lines: List[str], width: int = 92) -> str:
-            inner = width - 2
-            out = ["╭" + ("─" * (width-2)) + "╮"]
-            t = f" {title.strip()} "
-            t = t[: max(0, inner-2)]
-            pad = max(0, (inner-2) - len(t))
-            left = pad // 2
-            right = pad - left
-            out.append("│ " + (" "*left) + t + (" "*right) + " │")
-            out.append("├" + ("─" * (width-2)) + "┤")
-            for ln in lines:
-                ln = ln.rstrip()
-                if len(ln) > inner-2:
-                    ln = ln[:inner-5] + "…"
-                out.append("│ " + ln.ljust(inner-2) + " │")
-            out.append("╰" + ("─" * (width-2)) + "╯")
-            return "\n".join(out)
-
-        content = boxed(title_head, body, width=92)
-        return [("", content)]
+            body.append(" Creating iteration…")
+        elif add_state.get('iteration_create_error'):
+            body.append(f" ⚠️ {add_state.get('iteration_create_error')}")
+        raw = add_state.get('iteration_create', '')
+        cur = max(0, min(len(raw), add_state.get('iteration_create_cursor', len(raw))))
+        body.append(raw[:cur] + "_" + raw[cur:])
+
+    def _add_overlay_body_labels(body: List[str]) -> None:
+        repo_full = (add_state.get('repo_full_name') or '').strip()
+        metadata_error = add_state.get('metadata_error', '')
+        loading_metadata = bool(add_state.get('loading_repo_metadata'))
+        labels = add_state.get('label_choices') or []
+        selected = add_state.get('labels_selected') or set()
+        idx = max(0, min(len(labels)-1, add_state.get('label_index', 0))) if labels else 0
+        if loading_metadata:
+            body.append(f"Loading labels for {repo_full or '(repo pending)'}…")
+        elif metadata_error:
+            body.append(f"⚠️ {metadata_error}")
+        body.append("Use j/k to move, Space to toggle, Enter to continue, Esc cancel")
+        if not labels:
+            body.append("  (no labels available)")
+        body.extend(
+            f" {'➤' if i == idx else ' '} [{'✔' if name in selected else ' '}] {name}"
+            for i, name in enumerate(labels)
+        )
+
+    def _add_overlay_body_priority(body: List[str]) -> None:
+        repo_full = (add_state.get('repo_full_name') or '').strip()
+        metadata_error = add_state.get('metadata_error', '')
+        loading_metadata = bool(add_state.get('loading_repo_metadata'))
+        priorities = add_state.get('priority_choices') or []
+        selected_label = (add_state.get('priority_label') or '').strip()
+        idx = max(0, min(len(priorities)-1, add_state.get('priority_index', 0))) if priorities else 0
+        if loading_metadata:
+            body.append(f"Loading labels for {repo_full or '(repo pending)'}…")
+        elif metadata_error and not priorities:
+            body.append(f"⚠️ {metadata_error}")
+        body.append("Use j/k to move, Space to select, Enter to continue, Esc cancel")
+        if not priorities:
+            body.append("  (no priority candidates; leave blank if not needed)")
+        body.extend(
+            f" {'➤' if i == idx else ' '} {'●' if name == selected_label else '○'} {name}"
+            for i, name in enumerate(priorities)
+        )
+
+    def _add_overlay_body_assignee(body: List[str]) -> None:
+        repo_full = (add_state.get('repo_full_name') or '').strip()
+        metadata_error = add_state.get('metadata_error', '')
+        loading_metadata = bool(add_state.get('loading_repo_metadata'))
+        assignees = add_state.get('assignee_choices') or []
+        selected = add_state.get('assignees_selected') or set()
+        idx = max(0, min(len(assignees)-1, add_state.get('assignee_index', 0))) if assignees else 0
+        if loading_metadata:
+            body.append(f"Loading assignees for {repo_full or '(repo pending)'}…")
+        elif metadata_error and not assignees:
+            body.append(f"⚠️ {metadata_error}")
+        body.append("Use j/k to move, Space to toggle, Enter to continue, Esc cancel")
+        if not assignees:
+            body.append("  (no assignable users found)")
+        body.extend(
+            f" {'➤' if i == idx else ' '} [{'✔' if entry.get('login') in selected else ' '}] "
+            f"{entry.get('display') or entry.get('login')}"
+            for i, entry in enumerate(assignees)
+        )
 
-    status_keywords: Dict[str, List[str]] = {
-        'done': ["done", "complete", "completed", "finished", "closed", "resolved", "merged", "✅", "✔"],
-        'in_progress': ["in progress", "progress", "doing", "active", "working"]
+    def _add_overlay_body_comment(body: List[str]) -> None:
+        body.append("Type an optional comment (Ctrl+J=newline), Enter to continue, Esc cancel")
+        comment = add_state.get('comment', '')
+        cur = max(0, min(len(comment), add_state.get('comment_cursor', len(comment))))
+        display = comment[:cur] + "_" + comment[cur:]
+        for line in display.splitlines():
+            body.append(line)
+
+    def _add_overlay_body_confirm(body: List[str]) -> None:
+        repo_full = (add_state.get('repo_full_name') or '').strip()
+        mode_label = 'Issue' if add_state.get('mode', 'issue') == 'issue' else 'Project Task'
+        project = _current_add_project()
+        title_val = add_state.get('title', '').strip()
+        start_val = (add_state.get('start_date') or '').strip() or '(auto)'
+        end_val = (add_state.get('end_date') or '').strip() or '(none)'
+        focus_val = (add_state.get('focus_date') or '').strip() or '(none)'
+        iteration_choices = add_state.get('iteration_choices') or []
+        iteration_idx = add_state.get('iteration_index', 0)
+        iter_label = '(none)'
+        if iteration_choices:
+            opt = iteration_choices[max(0, min(iteration_idx, len(iteration_choices)-1))]
+            iter_label = opt.get('title') or '(none)'
+        repo_label = repo_full or '(n/a)'
+        labels_selected = add_state.get('labels_selected') or set()
+        label_choices = add_state.get('label_choices') or []
+        label_list = [name for name in label_choices if name in labels_selected]
+        priority_label = (add_state.get('priority_label') or '').strip() or '(none)'
+        assignees_selected = add_state.get('assignees_selected') or set()
+        assignee_entries = add_state.get('assignee_choices') or []
+        assignee_display = []
+        known_logins: Set[str] = set()
+        for entry in assignee_entries:
+            login = entry.get('login')
+            known_logins.add(login)
+            if login in assignees_selected:
+                assignee_display.append(entry.get('display') or login)
+        assignee_display.extend(sorted(login for login in assignees_selected if login not in known_logins))
+        comment_val = add_state.get('comment', '')
+
+        body.append("Review and press Enter to create, Esc cancel")
+        body.append("")
+        body.append(f"📁 Project  : {project.get('project_title') if project else '(unknown)'}")
+        body.append(f"🧷 Type     : {mode_label}")
+        if add_state.get('mode', 'issue') == 'issue':
+            body.append(f"📦 Repo     : {repo_label}")
+        body.append(f"📝 Title    : {title_val or '(missing)'}")
+        body.append(f"🗓️ Start    : {start_val}")
+        body.append(f"📆 End      : {end_val}")
+        body.append(f"🎯 Focus    : {focus_val}")
+        body.append(f"🔁 Iteration: {iter_label}")
+        if add_state.get('mode', 'issue') == 'issue':
+            body.append(f"🏷️ Labels   : {', '.join(label_list) if label_list else '(none)'}")
+            body.append(f"⚡ Priority : {priority_label}")
+            body.append(f"👥 Assignees: {', '.join(assignee_display) if assignee_display else '(none)'}")
+            if comment_val.strip():
+                lines = comment_val.splitlines() or ['']
+                body.append(f"💬 Comment  : {lines[0]}")
+                for line in lines[1:]:
+                    body.append(f"             {line}")
+            else:
+                body.append("💬 Comment  : (none)")
+
+    def _add_overlay_boxed(title: str, lines: List[str], width: int = 92) -> str:
+        top, title_fmt, line_fmt, mid, bottom = _box_frame_parts(width)
+        span = max(0, width - 4)
+        out = [top, title_fmt.format(f" {title.strip()} "[:span]), mid]
+        for ln in lines:
+            ln = ln.rstrip()
+            if len(ln) > span:
+                ln = ln[:width-7] + "…"
+            out.append(line_fmt.format(ln))
+        out.append(bottom)
+        return "\n".join(out)
+
+    add_overlay_body_builders: Dict[str, Callable[[List[str]], None]] = {
+        'mode': _add_overlay_body_mode,
+        'project': _add_overlay_body_project,
+        'repo': _add_overlay_body_repo,
+        'title': _add_overlay_body_title,
+        'start': lambda body: _add_overlay_body_date('start', body),
+        'end': lambda body: _add_overlay_body_date('end', body),
+        'focus': lambda body: _add_overlay_body_date('focus', body),
+        'iteration': _add_overlay_body_iteration,
+        'iteration-create': _add_overlay_body_iteration_create,
+        'labels': _add_overlay_body_labels,
+        'priority': _add_overlay_body_priority,
+        'assignee': _add_overlay_body_assignee,
+        'comment': _add_overlay_body_comment,
+        'confirm': _add_overlay_body_confirm,
     }
+    # Rendered frames keyed by (title, body lines); the overlay repaints on
+    # every invalidate() even when nothing it shows has changed.
+    add_overlay_frame_cache: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+    add_overlay_frame_cache_size = 4
+
+    def build_add_overlay() -> List[Tuple[str, str]]:
+        if not add_mode:
+            return []
+        step = add_state.get('step', 'project')
+        title_head = _ADD_OVERLAY_HEADERS.get(step, '➕ Add Item')
+        body: List[str] = []
+        builder = add_overlay_body_builders.get(step)
+        if builder is not None:
+            builder(body)
+        key = (title_head, tuple(body))
+        content = add_overlay_frame_cache.get(key)
+        if content is None:
+            content = _add_overlay_boxed(title_head, body, width=92)
+            if len(add_overlay_frame_cache) >= add_overlay_frame_cache_size:
+                add_overlay_frame_cache.pop(next(iter(add_overlay_frame_cache)))
+            add_overlay_frame_cache[key] = content
+        return [("", content)]
 
     def _status_options_map(row: TaskRow) -> Dict[str, Tuple[str, str]]:
-        try:
-            data = json.loads(row.status_options or "[]")
-        except Exception:
-            data = []
-        out: Dict[str, Tuple[str, str]] = {}
-        if isinstance(data, list):
-            for opt in data:
-                if not isinstance(opt, dict):
-                    continue
-                name = (opt.get("name") or "").strip()
-                opt_id = (opt.get("id") or "").strip()
-                if name and opt_id:
-                    out[name.lower()] = (opt_id, name)
+        out: Dict[str, Tuple[str, str]] = {
+            low: (opt_id, name) for low, opt_id, name in _parse_status_options(row.status_options or "")
+        }
         if row.status and row.status_option_id:
             low = row.status.strip().lower()
             out.setdefault(low, (row.status_option_id, row.status))
@@ -5534,19 +6156,20 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
 
     def _match_status_option(row: TaskRow, target: str) -> Tuple[str, str]:
         options = _status_options_map(row)
-        keywords = status_keywords.get(target, [])
+        keywords = STATUS_KEYWORDS.get(target, [])
         for kw in keywords:
             opt = options.get(kw.lower())
             if opt:
                 return opt
-        for key, opt in options.items():
-            if any(kw in key for kw in keywords):
-                return opt
+        pattern = _STATUS_KEYWORD_RES.get(target)
+        if pattern is not None:
+            for key, opt in options.items():
+                if pattern.search(key):
+                    return opt
         return ("", "")
 
     def _is_done_name(name: str) -> int:
-        low = (name or "").lower()
-        return int(any(kw in low for kw in status_keywords['done']))
+        return 1 if _DONE_KEYWORD_SEARCH((name or "").lower()) else 0
 
     def _pending_create_action_for_url(url: str) -> Optional[PendingAction]:
         if not (url or '').startswith(PENDING_URL_PREFIX):
@@ -5563,6 +6186,30 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 return action
         return None
 
+    def _patch_cached_rows(url: str, **changes: object) -> None:
+        """Mirror a single-URL DB update onto the in-memory rows instead of reloading."""
+        nonlocal rows_version
+        rows_version += 1
+        for cached in all_rows:
+            if cached.url == url:
+                for attr, value in changes.items():
+                    setattr(cached, attr, value)
+
+    @contextlib.asynccontextmanager
+    async def _row_edit_lock(url: str):
+        """Serialize remote edits of one task; edits of different tasks still overlap."""
+        entry = row_edit_locks.get(url)
+        if entry is None:
+            entry = row_edit_locks[url] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                row_edit_locks.pop(url, None)
+
     async def _apply_status_change(target: str):
         nonlocal all_rows, status_line, current_index
         rows = filtered_rows()
@@ -5644,7 +6291,14 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         except Exception as exc:
             status_line = f"Failed to mark pending: {exc}"
             invalidate(); return
-        all_rows = load_all()
+        _patch_cached_rows(
+            row.url,
+            status=display_name,
+            is_done=int(new_is_done),
+            status_dirty=1,
+            status_pending_option_id=option_id or '',
+            status_option_id=option_id or '',
+        )
         rows_after = filtered_rows()
         if current_index >= len(rows_after):
             current_index = max(0, len(rows_after) - 1)
@@ -5653,13 +6307,12 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
 
     async def _update_task_date(field_type: str, new_value: str):
         nonlocal all_rows, status_line, current_index
-        rows = filtered_rows()
-        if not rows:
+        row = _current_row()
+        if row is None:
             status_line = "No task selected"
             if edit_task_mode:
                 task_edit_state['message'] = status_line
             invalidate(); return
-        row = rows[current_index]
         pending_create_action = _pending_create_action_for_url(row.url)
         if pending_create_action or (row.url or '').startswith(PENDING_URL_PREFIX):
             try:
@@ -5746,7 +6399,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             label = field_name
         else:
             label = 'Focus Day'
-            field_id = getattr(row, 'focus_field_id', '')
+            field_id = row.focus_field_id
             field_name = row.focus_field or label
         loop = asyncio.get_running_loop()
         if not field_id and token:
@@ -5763,8 +6416,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                     lookup_names.append('Start date')
                 for lookup_name in lookup_names:
                     field_id = await loop.run_in_executor(
-                        None,
-                        lambda name=lookup_name: get_project_field_id_by_name(token, project_id, name),
+                        _GH_EXECUTOR,
+                        functools.partial(get_project_field_id_by_name, token, project_id, lookup_name),
                     ) or ''
                     if field_id:
                         break
@@ -5810,14 +6463,13 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
 
     async def _update_task_title(new_title: str) -> None:
         nonlocal all_rows, status_line
-        rows = filtered_rows()
-        if not rows:
+        row = _current_row()
+        if row is None:
             msg = "No task selected"
             status_line = msg
             if edit_task_mode:
                 task_edit_state['message'] = msg
             invalidate(); return
-        row = rows[current_index]
         pending_create_action = _pending_create_action_for_url(row.url)
         if pending_create_action or (row.url or '').startswith(PENDING_URL_PREFIX):
             if pending_create_action:
@@ -5859,7 +6511,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             invalidate(); return
         loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(None, lambda: set_issue_title(token, row.url, new_title))
+            await loop.run_in_executor(_GH_EXECUTOR, functools.partial(set_issue_title, token, row.url, new_title))
         except Exception as exc:
             msg = f"Title update failed: {exc}"
             status_line = msg
@@ -5891,11 +6543,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         except Exception:
             current = dt.date.today()
         if months:
-            month = current.month - 1 + months
-            year = current.year + month // 12
-            month = month % 12 + 1
-            day = min(current.day, calendar.monthrange(year, month)[1])
-            current = dt.date(year, month, day)
+            current = _shift_months(current, months)
         if days:
             current += dt.timedelta(days=days)
         editing['calendar_date'] = current.isoformat()
@@ -5907,27 +6555,16 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
 
     async def _apply_assignees(logins: List[str]) -> None:
         nonlocal all_rows, status_line
-        rows = filtered_rows()
-        if not rows:
+        row = _current_row()
+        if row is None:
             msg = "No task selected"
             status_line = msg
             if edit_task_mode:
                 task_edit_state['message'] = msg
             invalidate(); return
-        row = rows[current_index]
         pending_create_action = _pending_create_action_for_url(row.url)
         if pending_create_action or (row.url or '').startswith(PENDING_URL_PREFIX):
-            clean_logins = []
-            seen = set()
-            for login in logins:
-                norm = login.strip().lstrip('@')
-                if not norm:
-                    continue
-                key = norm.lower()
-                if key in seen:
-                    continue
-                seen.add(key)
-                clean_logins.append(norm)
+            clean_logins = _dedup_casefold(login.strip().lstrip('@') for login in logins)
             try:
                 db.update_assignees(row.url, [], clean_logins)
             except Exception as exc:
@@ -5949,7 +6586,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                     if edit_task_mode:
                         task_edit_state['message'] = msg
                     invalidate(); return
-            all_rows = load_all()
+            _patch_cached_rows(row.url, assignee_user_ids='[]', assignee_logins=json.dumps(clean_logins, ensure_ascii=False))
             suffix = " (queued create)" if pending_create_action else " (local)"
             status_line = f"Assignees updated{suffix}"
             if edit_task_mode:
@@ -5969,81 +6606,70 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             if edit_task_mode:
                 task_edit_state['message'] = msg
             invalidate(); return
-        loop = asyncio.get_running_loop()
-        clean_logins = []
-        seen = set()
-        for login in logins:
-            norm = login.strip().lstrip('@')
-            if not norm:
-                continue
-            if norm.lower() in seen:
-                continue
-            seen.add(norm.lower())
-            clean_logins.append(norm)
-        user_ids: List[str] = []
-        errors: List[str] = []
-        for login in clean_logins:
-            try:
-                node_id = await loop.run_in_executor(None, lambda l=login: get_user_node_id(token, l))
-            except Exception as exc:
-                errors.append(f"{login} ({exc})")
-                continue
-            if not node_id:
-                errors.append(login)
-            else:
-                user_ids.append(node_id)
-        if errors:
-            msg = f"Unknown user(s): {', '.join(errors)}"
-            status_line = msg
-            if edit_task_mode:
-                task_edit_state['message'] = msg
-            invalidate(); return
-        try:
-            await loop.run_in_executor(None, lambda: set_project_users(token, row.project_id, row.item_id, row.assignee_field_id, user_ids))
-        except Exception as exc:
-            msg = f"People field update failed: {exc}"
-            status_line = msg
+        async with _row_edit_lock(row.url):
+            loop = asyncio.get_running_loop()
+            clean_logins = _dedup_casefold(login.strip().lstrip('@') for login in logins)
+            user_ids: List[str] = []
+            errors: List[str] = []
+            # Resolve every login concurrently; _GH_EXECUTOR bounds the fan-out.
+            lookups = await asyncio.gather(
+                *(loop.run_in_executor(_GH_EXECUTOR, functools.partial(get_user_node_id, token, login)) for login in clean_logins),
+                return_exceptions=True,
+            )
+            for login, node_id in zip(clean_logins, lookups):
+                if isinstance(node_id, BaseException):
+                    errors.append(f"{login} ({node_id})")
+                elif not node_id:
+                    errors.append(login)
+                else:
+                    user_ids.append(node_id)
+            if errors:
+                msg = f"Unknown user(s): {', '.join(errors)}"
+                status_line = msg
+                if edit_task_mode:
+                    task_edit_state['message'] = msg
+                invalidate(); return
+            # The People field and the issue assignees are independent endpoints.
+            project_result, issue_result = await asyncio.gather(
+                loop.run_in_executor(_GH_EXECUTOR, functools.partial(set_project_users, token, row.project_id, row.item_id, row.assignee_field_id, user_ids)),
+                loop.run_in_executor(_GH_EXECUTOR, functools.partial(set_issue_assignees, token, row.url, clean_logins)),
+                return_exceptions=True,
+            )
+            if isinstance(project_result, BaseException):
+                msg = f"People field update failed: {project_result}"
+                status_line = msg
+                if edit_task_mode:
+                    task_edit_state['message'] = msg
+                invalidate(); return
+            if isinstance(issue_result, BaseException):
+                try:
+                    logger.warning("Issue assignee update failed for %s: %s", row.url, issue_result)
+                except Exception:
+                    pass
+            db.update_assignees(row.url, user_ids, clean_logins)
+            _patch_cached_rows(
+                row.url,
+                assignee_user_ids=json.dumps(user_ids, ensure_ascii=False),
+                assignee_logins=json.dumps(clean_logins, ensure_ascii=False),
+            )
+            status_line = 'Assignees updated'
             if edit_task_mode:
-                task_edit_state['message'] = msg
-            invalidate(); return
-        try:
-            await loop.run_in_executor(None, lambda: set_issue_assignees(token, row.url, clean_logins))
-        except Exception as exc:
-            try:
-                logger.warning("Issue assignee update failed for %s: %s", row.url, exc)
-            except Exception:
-                pass
-        db.update_assignees(row.url, user_ids, clean_logins)
-        all_rows = load_all()
-        status_line = 'Assignees updated'
-        if edit_task_mode:
-            task_edit_state['message'] = status_line
-            _refresh_task_editor_state()
-        invalidate()
+                task_edit_state['message'] = status_line
+                _refresh_task_editor_state()
+            invalidate()
 
     async def _apply_labels(labels_new: List[str]) -> None:
         nonlocal all_rows, status_line
-        rows = filtered_rows()
-        if not rows:
+        row = _current_row()
+        if row is None:
             msg = "No task selected"
             status_line = msg
             if edit_task_mode:
                 task_edit_state['message'] = msg
             invalidate(); return
-        row = rows[current_index]
         pending_create_action = _pending_create_action_for_url(row.url)
         if pending_create_action or (row.url or '').startswith(PENDING_URL_PREFIX):
-            clean_labels = []
-            seen = set()
-            for lab in labels_new:
-                nm = lab.strip()
-                if not nm:
-                    continue
-                key = nm.lower()
-                if key in seen:
-                    continue
-                seen.add(key)
-                clean_labels.append(nm)
+            clean_labels = _dedup_casefold(lab.strip() for lab in labels_new)
             try:
                 db.update_labels(row.url, clean_labels)
             except Exception as exc:
@@ -6063,7 +6689,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                     if edit_task_mode:
                         task_edit_state['message'] = msg
                     invalidate(); return
-            all_rows = load_all()
+            _patch_cached_rows(row.url, labels=json.dumps(clean_labels, ensure_ascii=False))
             suffix = " (queued create)" if pending_create_action else " (local)"
             status_line = f"Labels updated{suffix}"
             if edit_task_mode:
@@ -6084,32 +6710,24 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             if edit_task_mode:
                 task_edit_state['message'] = msg
             invalidate(); return
-        loop = asyncio.get_running_loop()
-        clean_labels = []
-        seen = set()
-        for lab in labels_new:
-            nm = lab.strip()
-            if not nm:
-                continue
-            if nm.lower() in seen:
-                continue
-            seen.add(nm.lower())
-            clean_labels.append(nm)
-        try:
-            await loop.run_in_executor(None, lambda: set_issue_labels(token, row.url, clean_labels))
-        except Exception as exc:
-            msg = f"Label update failed: {exc}"
-            status_line = msg
+        async with _row_edit_lock(row.url):
+            loop = asyncio.get_running_loop()
+            clean_labels = _dedup_casefold(lab.strip() for lab in labels_new)
+            try:
+                await loop.run_in_executor(_GH_EXECUTOR, functools.partial(set_issue_labels, token, row.url, clean_labels))
+            except Exception as exc:
+                msg = f"Label update failed: {exc}"
+                status_line = msg
+                if edit_task_mode:
+                    task_edit_state['message'] = msg
+                invalidate(); return
+            db.update_labels(row.url, clean_labels)
+            _patch_cached_rows(row.url, labels=json.dumps(clean_labels, ensure_ascii=False))
+            status_line = 'Labels updated'
             if edit_task_mode:
-                task_edit_state['message'] = msg
-            invalidate(); return
-        db.update_labels(row.url, clean_labels)
-        all_rows = load_all()
-        status_line = 'Labels updated'
-        if edit_task_mode:
-            task_edit_state['message'] = status_line
-            _refresh_task_editor_state()
-        invalidate()
+                task_edit_state['message'] = status_line
+                _refresh_task_editor_state()
+            invalidate()
 
     async def _load_priority_options_for_editor(row: TaskRow) -> None:
         nonlocal all_rows, status_line
@@ -6145,7 +6763,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             return field_id, options
 
         try:
-            field_id, options = await loop.run_in_executor(None, _fetch_priority)
+            field_id, options = await loop.run_in_executor(_GH_EXECUTOR, _fetch_priority)
         except Exception as exc:
             task_edit_state['message'] = f'Priority options unavailable: {exc}'
         else:
@@ -6186,8 +6804,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         loop = asyncio.get_running_loop()
         try:
             field_id, options, field_name = await loop.run_in_executor(
-                None,
-                lambda: get_iteration_field_metadata(token, row.project_id, cfg.iteration_field_regex),
+                _GH_EXECUTOR,
+                functools.partial(get_iteration_field_metadata, token, row.project_id, cfg.iteration_field_regex),
             )
         except Exception as exc:
             task_edit_state['message'] = f'Iteration options unavailable: {exc}'
@@ -6242,15 +6860,16 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         try:
             if not field_id or not options:
                 field_id, options, field_name = await loop.run_in_executor(
-                    None,
-                    lambda: get_iteration_field_metadata(token, project_id, cfg.iteration_field_regex),
+                    _GH_EXECUTOR,
+                    functools.partial(get_iteration_field_metadata, token, project_id, cfg.iteration_field_regex),
                 )
             if not field_id:
                 raise RuntimeError('Iteration field not configured')
             updated_options = await loop.run_in_executor(
-                None,
-                lambda: create_project_iteration(
-                    token, project_id, field_id, title, start_date, duration_days, options
+                _GH_EXECUTOR,
+                functools.partial(
+                    create_project_iteration,
+                    token, project_id, field_id, title, start_date, duration_days, options,
                 ),
             )
             new_id = _find_iteration_option_id(updated_options, title, start_date)
@@ -6296,14 +6915,13 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             task_edit_state['iteration_create_task'] = None
             invalidate()
             return
-        rows = filtered_rows()
-        if not rows:
+        row = _current_row()
+        if row is None:
             status_line = 'No task selected'
             task_edit_state['message'] = status_line
             task_edit_state['iteration_create_task'] = None
             invalidate()
             return
-        row = rows[current_index]
         project_id = (row.project_id or '').strip()
         if not project_id:
             msg = 'Task missing project metadata'
@@ -6319,15 +6937,16 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         try:
             if not field_id or not options:
                 field_id, options, field_name = await loop.run_in_executor(
-                    None,
-                    lambda: get_iteration_field_metadata(token, project_id, cfg.iteration_field_regex),
+                    _GH_EXECUTOR,
+                    functools.partial(get_iteration_field_metadata, token, project_id, cfg.iteration_field_regex),
                 )
             if not field_id:
                 raise RuntimeError('Iteration field not configured')
             updated_options = await loop.run_in_executor(
-                None,
-                lambda: create_project_iteration(
-                    token, project_id, field_id, title, start_date, duration_days, options
+                _GH_EXECUTOR,
+                functools.partial(
+                    create_project_iteration,
+                    token, project_id, field_id, title, start_date, duration_days, options,
                 ),
             )
             new_id = _find_iteration_option_id(updated_options, title, start_date)
@@ -6412,7 +7031,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         invalidate()
         loop = asyncio.get_running_loop()
         try:
-            field_id = await loop.run_in_executor(None, lambda: get_people_field_id(token, row.project_id))
+            field_id = await loop.run_in_executor(_GH_EXECUTOR, functools.partial(get_people_field_id, token, row.project_id))
         except Exception as exc:
             task_edit_state['message'] = f'People field lookup failed: {exc}'
         else:
@@ -6464,7 +7083,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 repo_full = f"{parts[0]}/{parts[1]}"
             if repo_full and token:
                 try:
-                    assignees_raw = await loop.run_in_executor(None, lambda: list_repo_assignees(token, repo_full))
+                    assignees_raw = await loop.run_in_executor(_GH_EXECUTOR, functools.partial(list_repo_assignees, token, repo_full))
                 except Exception as exc:
                     task_edit_state['assignee_error'] = f'Assignee fetch failed: {exc}'
                 else:
@@ -6518,6 +7137,50 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 task_edit_state['assignee_task'] = None
                 invalidate()
 
+    async def _repo_labels(repo_full: str) -> List[Dict[str, str]]:
+        """Labels for a repo, served from repo_metadata_cache while fresh.
+
+        Concurrent callers for the same repo share a single request.
+        """
+        key = repo_full.lower()
+        cached = repo_metadata_cache.get(key)
+        if cached and (time.monotonic() - float(cached.get('ts', 0.0))) < repo_metadata_cache_ttl:
+            return cached.get('labels') or []
+        pending = repo_labels_inflight.get(key)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = loop.run_in_executor(_GH_EXECUTOR, list_repo_labels, token, repo_full)
+            repo_labels_inflight[key] = pending
+
+            def _store(fut: asyncio.Future) -> None:
+                repo_labels_inflight.pop(key, None)
+                if not fut.cancelled() and fut.exception() is None:
+                    repo_metadata_cache[key] = {'ts': time.monotonic(), 'labels': fut.result(), 'assignees': None}
+
+            pending.add_done_callback(_store)
+        return await asyncio.shield(pending)
+
+    async def _warm_repo_labels(repos: List[str]) -> None:
+        await asyncio.gather(*(_repo_labels(repo) for repo in repos), return_exceptions=True)
+
+    def _schedule_label_prefetch(current_repo: str) -> None:
+        """Warm the label cache for the other repos in the current view."""
+        now = time.monotonic()
+        skip = current_repo.lower()
+        repos: List[str] = []
+        for repo in dict.fromkeys(r.repo for r in filtered_rows() if r.repo):
+            key = repo.lower()
+            if key == skip or key in repo_labels_inflight:
+                continue
+            cached = repo_metadata_cache.get(key)
+            if cached and (now - float(cached.get('ts', 0.0))) < repo_metadata_cache_ttl:
+                continue
+            repos.append(repo)
+            if len(repos) >= repo_labels_prefetch_limit:
+                break
+        if repos:
+            _spawn_background(_warm_repo_labels(repos))
+
     async def _load_label_choices_for_editor(repo_full: str, initial_selection: Set[str]) -> None:
         if not token:
             if edit_task_mode and task_edit_state.get('labels_repo') == repo_full:
@@ -6527,11 +7190,11 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 invalidate()
             return
         try:
-            loop = asyncio.get_running_loop()
+            asyncio.get_running_loop()
         except RuntimeError:
             return
         try:
-            labels_raw = await loop.run_in_executor(None, lambda: list_repo_labels(token, repo_full))
+            labels_raw = await _repo_labels(repo_full)
         except asyncio.CancelledError:
             return
         except Exception as exc:
@@ -6577,14 +7240,13 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
 
     async def _add_comment(comment: str) -> None:
         nonlocal status_line
-        rows = filtered_rows()
-        if not rows:
+        row = _current_row()
+        if row is None:
             msg = "No task selected"
             status_line = msg
             if edit_task_mode:
                 task_edit_state['message'] = msg
             invalidate(); return
-        row = rows[current_index]
         pending_create_action = _pending_create_action_for_url(row.url)
         if pending_create_action or (row.url or '').startswith(PENDING_URL_PREFIX):
             body = (comment or '').strip()
@@ -6632,7 +7294,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             invalidate(); return
         loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(None, lambda: add_issue_comment(token, row.url, body))
+            await loop.run_in_executor(_GH_EXECUTOR, functools.partial(add_issue_comment, token, row.url, body))
         except Exception as exc:
             msg = f"Comment failed: {exc}"
             status_line = msg
@@ -6675,11 +7337,10 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
 
     async def _change_priority(delta: Optional[int] = None, option_id: Optional[str] = None):
         nonlocal all_rows, status_line, current_index
-        rows = filtered_rows()
-        if not rows:
+        row = _current_row()
+        if row is None:
             status_line = "No task selected"
             invalidate(); return
-        row = rows[current_index]
         selected_url = row.url
         if not selected_url:
             status_line = "Selected task missing URL"
@@ -6730,7 +7391,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 except Exception as exc:
                     status_line = f"Failed to update queued create: {exc}"
                     invalidate(); return
-            all_rows = load_all()
+            _patch_cached_rows(selected_url, priority=display_name, priority_option_id=new_option_id,
+                               priority_dirty=0, priority_pending_option_id='')
             suffix = " (queued create)" if pending_create_action else " (local)"
             status_line = f"Priority set to {display_name}{suffix}"
             if edit_task_mode:
@@ -6744,110 +7406,112 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         if selected_url in pending_priority_urls:
             status_line = "Priority update already in progress"
             invalidate(); return
-        if not (row.project_id and row.item_id and row.priority_field_id):
-            status_line = "Task missing priority metadata"
-            invalidate(); return
-        options = _priority_options(row)
-        if (not options) and token and row.priority_field_id:
-            try:
-                fetched_opts = get_project_field_options(token, row.priority_field_id)
-            except Exception as exc:
-                fetched_opts = []
-                try:
-                    logger.warning("Unable to fetch priority options for %s: %s", row.priority_field_id, exc)
-                except Exception:
-                    pass
-            if fetched_opts:
+        async with _row_edit_lock(selected_url):
+            if not (row.project_id and row.item_id and row.priority_field_id):
+                status_line = "Task missing priority metadata"
+                invalidate(); return
+            options = _priority_options(row)
+            if (not options) and token and row.priority_field_id:
                 try:
-                    db.update_priority_options_by_field(row.priority_field_id, fetched_opts)
-                except Exception:
+                    fetched_opts = get_project_field_options(token, row.priority_field_id)
+                except Exception as exc:
+                    fetched_opts = []
                     try:
-                        db.update_priority_options(selected_url, fetched_opts)
+                        logger.warning("Unable to fetch priority options for %s: %s", row.priority_field_id, exc)
                     except Exception:
                         pass
-                all_rows = load_all()
-                rows = filtered_rows()
-                if rows:
-                    for idx, candidate in enumerate(rows):
-                        if candidate.url == selected_url:
-                            current_index = idx
-                            row = candidate
-                            break
-                    else:
-                        current_index = max(0, min(len(rows)-1, current_index))
-                        row = rows[current_index]
-                options = _priority_options(row)
-        if not options:
-            status_line = "No priority options available"
-            invalidate(); return
-        option_map = [opt for opt in options if isinstance(opt, dict) and opt.get('id')]
-        if not option_map:
-            status_line = "Priority options missing ids"
-            invalidate(); return
-        try:
-            current_idx = next((idx for idx, opt in enumerate(option_map) if (opt.get('id') or '') == (row.priority_option_id or '')), 0)
-        except Exception:
-            current_idx = 0
-        if option_id is not None:
-            new_opt = next((opt for opt in option_map if (opt.get('id') or '').strip() == option_id.strip()), None)
-            if not new_opt:
-                status_line = "Priority option not found"
+                if fetched_opts:
+                    try:
+                        db.update_priority_options_by_field(row.priority_field_id, fetched_opts)
+                    except Exception:
+                        try:
+                            db.update_priority_options(selected_url, fetched_opts)
+                        except Exception:
+                            pass
+                    all_rows = load_all()
+                    rows = filtered_rows()
+                    if rows:
+                        for idx, candidate in enumerate(rows):
+                            if candidate.url == selected_url:
+                                current_index = idx
+                                row = candidate
+                                break
+                        else:
+                            current_index = max(0, min(len(rows)-1, current_index))
+                            row = rows[current_index]
+                    options = _priority_options(row)
+            if not options:
+                status_line = "No priority options available"
                 invalidate(); return
-            new_idx = option_map.index(new_opt)
-        else:
-            if delta is None:
-                status_line = "No priority change provided"
+            option_map = [opt for opt in options if isinstance(opt, dict) and opt.get('id')]
+            if not option_map:
+                status_line = "Priority options missing ids"
                 invalidate(); return
-            new_idx = (current_idx + delta) % len(option_map)
-            new_opt = option_map[new_idx]
-        new_option_id = (new_opt.get('id') or '').strip()
-        display_name = (new_opt.get('name') or '').strip() or '(unset)'
-        if not new_option_id:
-            status_line = "Selected priority option missing id"
-            invalidate(); return
-        if (row.priority_option_id == new_option_id) and not getattr(row, 'priority_dirty', 0):
-            status_line = f"Priority already {display_name}"
-            invalidate(); return
-        original_priority = row.priority or ""
-        original_option = row.priority_option_id or ""
-        try:
-            db.mark_priority_pending(selected_url, display_name, new_option_id)
-        except Exception as exc:
-            status_line = f"Failed to mark priority pending: {exc}"
-            invalidate(); return
-        pending_priority_urls.add(selected_url)
-        all_rows = load_all()
-        status_line = f"Updating priority to {display_name}…"
-        invalidate()
-
-        loop = asyncio.get_running_loop()
-
-        def _do_update():
-            set_project_priority(token, row.project_id, row.item_id, row.priority_field_id, new_option_id)
-
-        try:
-            await loop.run_in_executor(None, _do_update)
-        except Exception as exc:
-            db.reset_priority(selected_url, original_priority, original_option)
-            status_line = f"Priority update failed: {exc}"
-        else:
-            db.mark_priority_synced(selected_url)
-            status_line = f"Priority set to {display_name}"
-        finally:
-            pending_priority_urls.discard(selected_url)
-            all_rows = load_all()
-            if edit_task_mode:
-                task_edit_state['message'] = status_line
-                _refresh_task_editor_state()
+            try:
+                current_idx = next((idx for idx, opt in enumerate(option_map) if (opt.get('id') or '') == (row.priority_option_id or '')), 0)
+            except Exception:
+                current_idx = 0
+            if option_id is not None:
+                new_opt = next((opt for opt in option_map if (opt.get('id') or '').strip() == option_id.strip()), None)
+                if not new_opt:
+                    status_line = "Priority option not found"
+                    invalidate(); return
+                new_idx = option_map.index(new_opt)
+            else:
+                if delta is None:
+                    status_line = "No priority change provided"
+                    invalidate(); return
+                new_idx = (current_idx + delta) % len(option_map)
+                new_opt = option_map[new_idx]
+            new_option_id = (new_opt.get('id') or '').strip()
+            display_name = (new_opt.get('name') or '').strip() or '(unset)'
+            if not new_option_id:
+                status_line = "Selected priority option missing id"
+                invalidate(); return
+            if (row.priority_option_id == new_option_id) and not row.priority_dirty:
+                status_line = f"Priority already {display_name}"
+                invalidate(); return
+            original_priority = row.priority or ""
+            original_option = row.priority_option_id or ""
+            try:
+                db.mark_priority_pending(selected_url, display_name, new_option_id)
+            except Exception as exc:
+                status_line = f"Failed to mark priority pending: {exc}"
+                invalidate(); return
+            pending_priority_urls.add(selected_url)
+            _patch_cached_rows(selected_url, priority=display_name, priority_option_id=new_option_id,
+                               priority_dirty=1, priority_pending_option_id=new_option_id)
+            status_line = f"Updating priority to {display_name}…"
             invalidate()
 
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(
+                    _GH_EXECUTOR,
+                    functools.partial(set_project_priority, token, row.project_id, row.item_id, row.priority_field_id, new_option_id),
+                )
+            except Exception as exc:
+                db.reset_priority(selected_url, original_priority, original_option)
+                _patch_cached_rows(selected_url, priority=original_priority, priority_option_id=original_option,
+                                   priority_dirty=0, priority_pending_option_id='')
+                status_line = f"Priority update failed: {exc}"
+            else:
+                db.mark_priority_synced(selected_url)
+                _patch_cached_rows(selected_url, priority_dirty=0, priority_pending_option_id='')
+                status_line = f"Priority set to {display_name}"
+            finally:
+                pending_priority_urls.discard(selected_url)
+                if edit_task_mode:
+                    task_edit_state['message'] = status_line
+                    _refresh_task_editor_state()
+                invalidate()
+
     async def _apply_iteration(option: Dict[str, object]) -> None:
         nonlocal all_rows, status_line, current_index
-        rows = filtered_rows()
-        if not rows:
+        row = _current_row()
+        if row is None:
             status_line = "No task selected"
             invalidate(); return
-        row = rows[current_index]
         pending_create_action = _pending_create_action_for_url(row.url)
         if pending_create_action or (row.url or '').startswith(PENDING_URL_PREFIX):
             iteration_id = (option.get('id') or '').strip()
@@ -6902,8 +7566,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         loop = asyncio.get_running_loop()
         try:
             await loop.run_in_executor(
-                None,
-                lambda: set_project_iteration(token, row.project_id, row.item_id, row.iteration_field_id, iteration_id),
+                _GH_EXECUTOR,
+                functools.partial(set_project_iteration, token, row.project_id, row.item_id, row.iteration_field_id, iteration_id),
             )
         except Exception as exc:
             status_line = f"Iteration update failed: {exc}"
@@ -6918,8 +7582,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
 
     def _safe_date(s: str) -> Optional[dt.date]:
         try:
-            return dt.date.fromisoformat(s)
-        except Exception:
+            return _parse_iso_date(s)
+        except TypeError:  # unhashable input
             return None
 
     def apply_filters(rows: List[TaskRow]) -> List[TaskRow]:
@@ -6930,59 +7594,58 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             pass
         def _is_pending(row: TaskRow) -> bool:
             return (row.url or '').startswith(PENDING_URL_PREFIX)
-        if hide_done:
-            out = [r for r in out if not r.is_done]
+        # Collect the enabled filters (pending creates bypass all but hide_done)
+        # and walk the rows once instead of rebuilding a list per filter.
+        checks: List[Callable[[TaskRow], bool]] = []
         if hide_no_date:
             if use_iteration:
-                out = [r for r in out if _is_pending(r) or r.iteration_title or r.iteration_start]
+                checks.append(lambda r: bool(r.iteration_title or r.iteration_start))
             else:
-                out = [r for r in out if _is_pending(r) or r.focus_date]
+                checks.append(lambda r: bool(r.focus_date))
         if not include_created:
-            out = [r for r in out if _is_pending(r) or not (r.created_by_me and not r.assigned_to_me)]
+            checks.append(lambda r: not (r.created_by_me and not r.assigned_to_me))
         if project_cycle:
-            out = [r for r in out if _is_pending(r) or r.project_title == project_cycle]
+            checks.append(lambda r: r.project_title == project_cycle)
         active_search = search_buffer if in_search else search_term
         if active_search:
             needle = active_search.lower()
-            out = [r for r in out if _is_pending(r) or needle in (r.title or '').lower() or
-                                   needle in (r.repo or '').lower() or
-                                   needle in (r.priority or '').lower() or
-                                   needle in (r.status or '').lower() or
-                                   needle in (r.project_title or '').lower()]
+            checks.append(lambda r: needle in _task_search_blob(
+                r.title or '', r.repo or '', r.priority or '', r.status or '', r.project_title or ''))
         if date_max:
             dm = _safe_date(date_max)
             if dm:
-                tmp: List[TaskRow] = []
-                for r in out:
-                    if _is_pending(r):
-                        tmp.append(r)
-                        continue
-                    if not r.focus_date:
-                        continue
-                    rsd = _safe_date(r.focus_date)
-                    if rsd and rsd <= dm:
-                        tmp.append(r)
-                out = tmp
+                def _within_date_max(r: TaskRow) -> bool:
+                    rsd = _parse_iso_date(r.focus_date) if r.focus_date else None
+                    return rsd is not None and rsd <= dm
+                checks.append(_within_date_max)
+
+        def _keep(r: TaskRow) -> bool:
+            if hide_done and r.is_done:
+                return False
+            if not checks or _is_pending(r):
+                return True
+            for check in checks:
+                if not check(r):
+                    return False
+            return True
+
+        out = [r for r in out if _keep(r)] if (hide_done or checks) else out
         # apply sorting last
         preset = sort_presets[max(0, min(sort_index, len(sort_presets)-1))]
-        key_func = preset.get('key', lambda r: (r.project_title or '', _safe_date(r.focus_date) or dt.date.max, r.title or ''))
+        key_func = preset.get('key', lambda r: (r.project_title or '', _parse_iso_date(r.focus_date) or dt.date.max, r.title or ''))
         reverse = bool(preset.get('reverse'))
         out = sorted(out, key=key_func, reverse=reverse)
         return out
 
     def projects_list(rows: Iterable[TaskRow]) -> List[str]:
-        seen = []
-        for r in rows:
-            if r.project_title not in seen:
-                seen.append(r.project_title)
-        return seen
+        return list(dict.fromkeys(r.project_title for r in rows))
 
     sort_presets: List[Dict[str, object]] = [
         {
             'name': 'Project → Focus → Priority',
             'key': lambda r: (
                 r.project_title or '',
-                _safe_date(r.focus_date) or dt.date.max,
+                _parse_iso_date(r.focus_date) or dt.date.max,
                 _priority_rank(r),
                 r.title or ''
             ),
@@ -6990,7 +7653,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         {
             'name': 'Focus Day → Priority → Project',
             'key': lambda r: (
-                _safe_date(r.focus_date) or dt.date.max,
+                _parse_iso_date(r.focus_date) or dt.date.max,
                 _priority_rank(r),
                 r.project_title or '',
                 r.title or ''
@@ -7000,7 +7663,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             'name': 'Priority → Focus → Project',
             'key': lambda r: (
                 _priority_rank(r),
-                _safe_date(r.focus_date) or dt.date.max,
+                _parse_iso_date(r.focus_date) or dt.date.max,
                 r.project_title or '',
                 r.title or ''
             ),
@@ -7018,45 +7681,35 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
     if not (0 <= sort_index < len(sort_presets)):
         sort_index = 0
 
+    # apply_filters() runs several times per frame (table, summary, status bar,
+    # editors); reuse the result until the rows or the filter state change.
+    # rows_version is bumped on in-place row updates and on every invalidate().
+    rows_version = 0
+    filtered_rows_cache: Dict[str, object] = {'src': None, 'key': None, 'rows': []}
+
     def filtered_rows() -> List[TaskRow]:
-        return apply_filters(all_rows)
+        key = (
+            rows_version, hide_done, hide_no_date, use_iteration, include_created,
+            project_cycle, search_buffer if in_search else search_term, date_max, sort_index,
+        )
+        if filtered_rows_cache['src'] is all_rows and filtered_rows_cache['key'] == key:
+            return filtered_rows_cache['rows']
+        out = apply_filters(all_rows)
+        filtered_rows_cache.update(src=all_rows, key=key, rows=out)
+        return out
 
-    def _task_labels(row: TaskRow) -> List[str]:
-        try:
-            data = json.loads(row.labels or "[]")
-            return [str(x) for x in data if isinstance(x, str) and x]
-        except Exception:
-            return []
+    def _current_row() -> Optional[TaskRow]:
+        """The selected row of the (memoized) filtered view, or None when empty."""
+        rows = filtered_rows()
+        if not rows:
+            return None
+        return rows[max(0, min(current_index, len(rows) - 1))]
 
     def _priority_options(row: TaskRow) -> List[Dict[str, object]]:
-        try:
-            data = json.loads(row.priority_options or "[]")
-            if isinstance(data, list):
-                return [opt for opt in data if isinstance(opt, dict)]
-        except Exception:
-            pass
-        return []
+        return list(_parse_priority_options(row.priority_options or "[]"))
 
     def _priority_rank(row: TaskRow) -> int:
-        opts = _priority_options(row)
-        if opts:
-            id_lookup = {str(opt.get('id') or ''): idx for idx, opt in enumerate(opts)}
-            opt_id = (row.priority_option_id or '').strip()
-            if opt_id in id_lookup:
-                return id_lookup[opt_id]
-            name_lookup = {(opt.get('name') or '').strip().lower(): idx for idx, opt in enumerate(opts)}
-            pname = (row.priority or '').strip().lower()
-            if pname in name_lookup:
-                return name_lookup[pname]
-            return len(opts)
-        pname = (row.priority or '').strip().lower()
-        if pname in ('urgent', 'highest', 'high'):  # conventional mapping
-            return 0
-        if pname in ('medium', 'normal'):  # mid tier
-            return 1
-        if pname in ('low', 'lowest', 'minor'):
-            return 2
-        return 99
+        return _priority_rank_for(row.priority_options or "[]", row.priority_option_id or "", row.priority or "")
 
     def _select_status_option(options: List[Dict[str, object]], preferred: Optional[str] = None) -> Tuple[str, str]:
         if not options:
@@ -7118,7 +7771,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         if not field_id:
             for name in STATUS_FIELD_CANDIDATES:
                 try:
-                    candidate = await loop.run_in_executor(None, lambda n=name: get_project_field_id_by_name(token, project_id, n))
+                    candidate = await loop.run_in_executor(_GH_EXECUTOR, functools.partial(get_project_field_id_by_name, token, project_id, name))
                 except Exception:
                     candidate = None
                 if candidate:
@@ -7126,7 +7779,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                     break
         if field_id and not options_clean:
             try:
-                fetched_opts = await loop.run_in_executor(None, lambda: get_project_field_options(token, field_id))
+                fetched_opts = await loop.run_in_executor(_GH_EXECUTOR, functools.partial(get_project_field_options, token, field_id))
             except Exception:
                 fetched_opts = []
             options_clean = _normalize_status_options(fetched_opts)
@@ -7345,8 +7998,34 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             invalidate()
 
 
+    def _timer_frame() -> Dict[str, object]:
+        now_mon = time.monotonic()
+        if timer_frame_cache['active_urls'] is None or (now_mon - float(timer_frame_cache['ts'])) >= timer_frame_ttl:
+            try:
+                active_urls = set(db.active_task_urls())
+            except Exception:
+                active_urls = set()
+            timer_frame_cache.update(ts=now_mon, active_urls=active_urls, project_secs={})
+        return timer_frame_cache
+
+    def _frame_active_urls() -> Set[str]:
+        return _timer_frame()['active_urls']
+
+    def _frame_project_seconds(project_title: str) -> int:
+        project_secs = _timer_frame()['project_secs']
+        if project_title not in project_secs:
+            project_secs[project_title] = db.project_total_seconds(project_title)
+        return project_secs[project_title]
+
+    def _status_task_seconds(task_url: str) -> Tuple[int, int]:
+        now_mon = time.monotonic()
+        if status_snapshot_cache['key'] != task_url or (now_mon - float(status_snapshot_cache['ts'])) >= status_snapshot_ttl:
+            vals = (db.task_current_elapsed_seconds(task_url), db.task_total_seconds(task_url))
+            status_snapshot_cache.update(ts=now_mon, key=task_url, vals=vals)
+        return status_snapshot_cache['vals']
+
     def build_table_fragments() -> List[Tuple[str,str]]:
-        nonlocal task_duration_cache, current_index, v_offset, table_row_gap_value, table_row_offsets, table_total_lines
+        nonlocal current_index, v_offset, table_row_gap_value
         rows = filtered_rows()
         if current_index >= len(rows):
             current_index = max(0, len(rows) - 1)
@@ -7369,6 +8048,24 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             v_offset = current_index
         elif current_index >= v_offset + visible_rows:
             v_offset = current_index - visible_rows + 1
+        # filtered_rows() hands back a new list whenever rows_version or a filter
+        # moves, so redraws that only repaint (idle ticks, unbound keys) reuse the
+        # last table. Running timers change the Time cells every second.
+        active_urls = _frame_active_urls()
+        fragments_key = (
+            total_rows, total_cols, current_index, v_offset, h_offset, zen_mode,
+            current_theme_index, use_iteration, show_start_column, show_end_column, show_assignee_column,
+            today_date, search_buffer if in_search else search_term, db.sessions_version,
+            frozenset(active_urls), int(time.time()) if active_urls else 0,
+        )
+        if table_fragments_cache['rows'] is rows and table_fragments_cache['key'] == fragments_key:
+            return table_fragments_cache['fragments']
+        frags = _build_table_body(rows, total_rows, total_cols, visible_rows, row_gap, active_urls)
+        table_fragments_cache.update(rows=rows, key=fragments_key, fragments=frags)
+        return frags
+
+    def _build_table_body(rows: List[TaskRow], total_rows: int, total_cols: int, visible_rows: int, row_gap: float, active_urls: Set[str]) -> List[Tuple[str, str]]:
+        nonlocal task_duration_cache, table_row_offsets, table_total_lines
         frags: List[Tuple[str, str]] = []
         right_panel_width = 32 + 1
         avail_cols = max(40, total_cols - right_panel_width)
@@ -7400,22 +8097,6 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 suffix = f"({delta_days}d)"
             return f"{date_str} {suffix}"
 
-        def _assignees_text(row: TaskRow) -> str:
-            raw = getattr(row, 'assignee_logins', '[]') or '[]'
-            try:
-                parsed = json.loads(raw)
-                if not isinstance(parsed, list):
-                    parsed = []
-            except Exception:
-                parsed = []
-            names = [('@' + s) if s and not s.startswith('@') else s for s in parsed if s]
-            if not names:
-                return '-'
-            clipped = names[:3]
-            if len(names) > 3:
-                clipped.append('…')
-            return ', '.join(clipped)
-
         future_seen: Set[str] = set()
         future_dates: List[Tuple[dt.date, str]] = []
         for r in rows:
@@ -7502,34 +8183,45 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             cols.append({'id': 'project', 'header': 'Project', 'min': 12, 'dynamic': True, 'weight': 1, 'align': 'left'})
             return cols
 
-        columns = _build_columns()
-        dynamic_cols = [c for c in columns if c.get('dynamic')]
-        total_fixed = 2 * len(columns)
-        for col in columns:
-            col['width'] = int(col.get('min', 5))
-            total_fixed += col['width']
-        extra_space = avail_cols - total_fixed
-        if dynamic_cols:
-            if extra_space > 0:
-                weight_sum = sum(int(c.get('weight', 1)) for c in dynamic_cols) or 1
-                allocated = 0
-                for col in dynamic_cols[:-1]:
-                    add = (extra_space * int(col.get('weight', 1))) // weight_sum
-                    col['width'] += add
-                    allocated += add
-                dynamic_cols[-1]['width'] += max(0, extra_space - allocated)
-            elif extra_space < 0:
-                deficit = -extra_space
-                min_floor = 6
-                while deficit > 0 and any(c['width'] > min_floor for c in dynamic_cols):
-                    for col in reversed(dynamic_cols):
-                        if deficit <= 0:
-                            break
-                        if col['width'] > min_floor:
-                            col['width'] -= 1
-                            deficit -= 1
+        layout_key = (avail_cols, use_iteration, show_start, show_end, show_assignees)
+        if table_layout_cache['key'] == layout_key:
+            columns = table_layout_cache['columns']
+            header = table_layout_cache['header']
+            column_lookup = table_layout_cache['lookup']
+            widths = table_layout_cache['widths']
+        else:
+            columns = _build_columns()
+            dynamic_cols = [c for c in columns if c.get('dynamic')]
+            total_fixed = 2 * len(columns)
+            for col in columns:
+                col['width'] = int(col.get('min', 5))
+                total_fixed += col['width']
+            extra_space = avail_cols - total_fixed
+            if dynamic_cols:
+                if extra_space > 0:
+                    weight_sum = sum(int(c.get('weight', 1)) for c in dynamic_cols) or 1
+                    allocated = 0
+                    for col in dynamic_cols[:-1]:
+                        add = (extra_space * int(col.get('weight', 1))) // weight_sum
+                        col['width'] += add
+                        allocated += add
+                    dynamic_cols[-1]['width'] += max(0, extra_space - allocated)
+                elif extra_space < 0:
+                    deficit = -extra_space
+                    min_floor = 6
+                    while deficit > 0 and any(c['width'] > min_floor for c in dynamic_cols):
+                        for col in reversed(dynamic_cols):
+                            if deficit <= 0:
+                                break
+                            if col['width'] > min_floor:
+                                col['width'] -= 1
+                                deficit -= 1
+
+            header = ''.join('  ' + _pad_display(col['header'], col['width'], align=col.get('align', 'left')) for col in columns)
+            column_lookup = {c['id']: c for c in columns}
+            widths = {cid: col['width'] for cid, col in column_lookup.items()}
+            table_layout_cache.update(key=layout_key, columns=columns, header=header, lookup=column_lookup, widths=widths)
 
-        header = ''.join('  ' + _pad_display(col['header'], col['width'], align=col.get('align', 'left')) for col in columns)
         frags.append((_style_class('table.header'), header[h_offset:]))
         frags.append(("", "\n"))
         line_cursor = 0
@@ -7546,83 +8238,55 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             return frags
 
         today = today_date
-        active_urls = db.active_task_urls()
+        today_iso = today.isoformat()
         display_slice = rows[v_offset:v_offset+visible_rows]
         duration_urls = [t.url for t in display_slice if t.url]
+        # summarize() and build_top_status() read the selected row from this
+        # snapshot; include it even when it is scrolled out of the window.
+        selected_url = rows[current_index].url
+        if selected_url and selected_url not in duration_urls:
+            duration_urls.append(selected_url)
         task_duration_cache = db.task_duration_snapshot(duration_urls)
 
-        date_palette = {
-            'today': _style_class('table.date.today'),
-            'past': _style_class('table.date.past'),
-            'future': _style_class('table.date.future'),
-            'unknown': _style_class('table.date.unknown'),
-        }
+        date_palette = _date_palette()
 
         def status_style_for(name: Optional[str]) -> str:
-            if not name:
-                return ''
-            norm = name.strip().lower()
-            if 'block' in norm or 'hold' in norm or 'stuck' in norm:
-                return _style_class('table.status.blocked')
-            if 'progress' in norm or 'doing' in norm or 'active' in norm or 'working' in norm:
-                return _style_class('table.status.in_progress')
-            if 'wait' in norm:
-                return _style_class(STATUS_WAITING_CLASS)
-            if 'done' in norm or 'complete' in norm or 'closed' in norm or 'shipped' in norm:
-                return _style_class('table.status.done')
-            if 'todo' in norm or 'backlog' in norm or 'ready' in norm or 'plan' in norm:
-                return _style_class('table.status.todo')
-            return ''
+            style_name = _status_style_name(name)
+            return _style_class(style_name) if style_name else ''
+
+        active_search = search_buffer if in_search else search_term
+        highlight_re = None
+        if active_search:
+            if search_highlight_cache['needle'] != active_search:
+                search_highlight_cache['needle'] = active_search
+                search_highlight_cache['pattern'] = re.compile(re.escape(active_search), re.IGNORECASE)
+            highlight_re = search_highlight_cache['pattern']
 
-        def trim_segments(segments: List[Tuple[str, str]], offset: int) -> List[Tuple[str, str]]:
-            if offset <= 0:
-                return segments
-            remaining = offset
-            trimmed: List[Tuple[str, str]] = []
-            for style_txt, text in segments:
-                if not text:
-                    continue
-                if remaining >= len(text):
-                    remaining -= len(text)
-                    continue
-                if remaining > 0:
-                    trimmed.append((style_txt, text[remaining:]))
-                    remaining = 0
-                else:
-                    trimmed.append((style_txt, text))
-            return trimmed
-
-        def highlight_segments(segments: List[Tuple[str, str]], needle: str) -> List[Tuple[str, str]]:
-            if not needle:
-                return segments
-            result: List[Tuple[str, str]] = []
-            needle_lower = needle.lower()
-            for style_txt, text in segments:
-                if not text:
-                    continue
-                lower_text = text.lower()
-                if needle_lower not in lower_text:
-                    result.append((style_txt, text))
-                    continue
-                start = 0
-                n_len = len(needle)
-                while True:
-                    idx = lower_text.find(needle_lower, start)
-                    if idx == -1:
-                        if start < len(text):
-                            result.append((style_txt, text[start:]))
-                        break
-                    if idx > start:
-                        result.append((style_txt, text[start:idx]))
-                    highlight_style = (style_txt + ' underline').strip() if style_txt else 'underline'
-                    result.append((highlight_style, text[idx:idx+n_len]))
-                    start = idx + n_len
-            return result
-
-        column_lookup = {c['id']: c for c in columns}
         int_row_gap = int(row_gap_value)
         fractional_row_gap = row_gap_value - int_row_gap
 
+        # Loop invariants: the first date column depends only on the view mode,
+        # and row styles only on the theme.
+        pad = _pad_display
+
+        def _iteration_cell(t: TaskRow, values: Dict[str, str]) -> None:
+            iter_label = t.iteration_title or t.iteration_start or '-'
+            if t.iteration_title and t.iteration_start:
+                iter_label = f"{t.iteration_title} ({t.iteration_start})"
+            values['iteration'] = pad(iter_label, widths['iteration'])
+
+        def _focus_cell(t: TaskRow, values: Dict[str, str]) -> None:
+            values['focus'] = pad(t.focus_date or '-', widths['focus'])
+
+        lead_cell = _iteration_cell if use_iteration else _focus_cell
+        column_specs = [(col['id'], col['width']) for col in columns]
+        duration_for = task_duration_cache.get
+        running_row_style = _style_class(ROW_STYLE_RUNNING) or 'ansicyan bold'
+        unknown_row_style = _style_class(ROW_STYLE_UNKNOWN)
+        today_row_style = _style_class(ROW_STYLE_TODAY)
+        past_row_style = _style_class(ROW_STYLE_PAST)
+        future_row_styles = [_style_class(name) for name in FUTURE_ROW_STYLE_CLASSES]
+
         for rel_idx, t in enumerate(display_slice):
             idx = v_offset + rel_idx
             is_sel = (idx == current_index)
@@ -7631,112 +8295,66 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             date_key = (t.focus_date or t.start_date or '').strip()
             date_val = _safe_date(date_key) if date_key else None
             if running:
-                base_style = _style_class(ROW_STYLE_RUNNING) or 'ansicyan bold'
+                base_style = running_row_style
             else:
                 if date_val is None:
-                    base_style = _style_class(ROW_STYLE_UNKNOWN) or color_for_date(t.focus_date, today, date_palette)
+                    base_style = unknown_row_style or color_for_date(t.focus_date, today_iso, date_palette)
                 elif date_val == today:
-                    base_style = _style_class(ROW_STYLE_TODAY)
+                    base_style = today_row_style
                 elif date_val < today:
-                    base_style = _style_class(ROW_STYLE_PAST)
+                    base_style = past_row_style
                 else:
                     idx_map = future_map.get(date_key, 0)
-                    class_name = FUTURE_ROW_STYLE_CLASSES[idx_map % len(FUTURE_ROW_STYLE_CLASSES)]
-                    base_style = _style_class(class_name)
+                    base_style = future_row_styles[idx_map % len(future_row_styles)]
                 if not base_style:
-                    base_style = color_for_date(t.focus_date, today, date_palette)
+                    base_style = color_for_date(t.focus_date, today_iso, date_palette)
             marker = '⏱ ' if running else '  '
-            snapshot = task_duration_cache.get(t.url) if t.url else None
-            tot_s = snapshot.get('total', 0) if snapshot else 0
-            cur_s = snapshot.get('current', 0) if snapshot else 0
-            if not running:
-                cur_s = 0
-            mm, ss = divmod(int(max(0, cur_s)), 60)
-            th, rem = divmod(int(max(0, tot_s)), 3600)
-            tm, _ = divmod(rem, 60)
-            time_text = f"{mm:02d}:{ss:02d}|{th:d}:{tm:02d}" if tot_s else f"{mm:02d}:{ss:02d}|0:00"
-            priority_display = (t.priority or '-') + ('*' if getattr(t, 'priority_dirty', 0) else '')
+            snapshot = duration_for(t.url) if t.url else None
+            time_text = _TIME_TEXT_IDLE
+            if snapshot:
+                tot_s = snapshot.get('total', 0)
+                cur_s = snapshot.get('current', 0) if running else 0
+                if cur_s or tot_s:
+                    time_text = _time_cell_text(cur_s, tot_s)
             status_style = status_style_for(t.status)
-            running_style = base_style if running else None
             if running:
                 status_style = base_style
             if not status_style:
                 status_style = base_style
 
-            widths = {cid: col['width'] for cid, col in column_lookup.items()}
             values: Dict[str, str] = {}
-            if use_iteration:
-                if 'iteration' in column_lookup:
-                    iter_label = t.iteration_title or t.iteration_start or '-'
-                    if t.iteration_title and t.iteration_start:
-                        iter_label = f"{t.iteration_title} ({t.iteration_start})"
-                    values['iteration'] = _pad_display(iter_label or '-', widths['iteration'])
-                if show_start and 'start' in column_lookup:
-                    values['start'] = _pad_display(t.start_date or '-', widths['start'])
-            else:
-                if 'focus' in column_lookup:
-                    values['focus'] = _pad_display(t.focus_date or '-', widths['focus'])
-                if show_start and 'start' in column_lookup:
-                    values['start'] = _pad_display(t.start_date or '-', widths['start'])
+            lead_cell(t, values)
+            if show_start and 'start' in column_lookup:
+                values['start'] = pad(t.start_date or '-', widths['start'])
             if show_end and 'end' in column_lookup:
-                values['end'] = _pad_display(_format_deadline(getattr(t, 'end_date', ''), today), widths['end'])
-            status_text = (t.status or '-')
-            if t.status_dirty:
-                status_text = (t.status or '-') + '*'
+                values['end'] = pad(_format_deadline(t.end_date, today), widths['end'])
             if 'status' in column_lookup:
-                values['status'] = _pad_display(status_text, widths['status'])
+                values['status'] = pad(_dirty_cell_text(t.status, bool(t.status_dirty)), widths['status'])
             if 'priority' in column_lookup:
-                values['priority'] = _pad_display(priority_display, widths['priority'])
+                values['priority'] = pad(_dirty_cell_text(t.priority, bool(t.priority_dirty)), widths['priority'])
             if 'time' in column_lookup:
-                values['time'] = _pad_display(time_text, widths['time'], align='right')
+                values['time'] = pad(time_text, widths['time'], align='right')
             if show_assignees and 'assignees' in column_lookup:
-                values['assignees'] = _pad_display(_assignees_text(t), widths['assignees'])
+                values['assignees'] = pad(_assignees_cell_text(t.assignee_logins or '[]'), widths['assignees'])
             if 'title' in column_lookup:
-                values['title'] = _pad_display(t.title, widths['title'])
-            labels_list = _task_labels(t)
-            labels_text = ", ".join(labels_list)
+                values['title'] = pad(t.title, widths['title'])
             if 'labels' in column_lookup:
-                values['labels'] = _pad_display(labels_text or '-', widths['labels'])
+                values['labels'] = pad(_labels_cell_text(t.labels or '[]'), widths['labels'])
             if 'project' in column_lookup:
-                values['project'] = _pad_display(t.project_title, widths['project'])
-
-            segments: List[Tuple[str, str]] = []
-
-            def add_segment(text: str, seg_style: Optional[str] = None) -> None:
-                if not text:
-                    return
-                if is_sel:
-                    segments.append((style_row, text))
-                    return
-                style_token = seg_style if seg_style is not None else base_style
-                segments.append((style_token.strip(), text))
-
-            def add_column(text: str, seg_style: Optional[str] = None) -> None:
-                add_segment('  ', running_style if running_style and seg_style is None and not is_sel else (base_style if not is_sel else style_row))
-                add_segment(text, seg_style)
-
-            add_segment(marker, base_style if not is_sel else style_row)
-            style_map = {
-                'status': status_style,
-                'time': running_style if running_style else base_style,
-            }
-            for col_index, col in enumerate(columns):
-                col_id = col['id']
-                text = values.get(col_id, _pad_display('-', col['width']))
-                seg_style = style_map.get(col_id, base_style)
-                if col_index == 0:
-                    add_segment(text, seg_style)
-                else:
-                    add_column(text, seg_style)
+                values['project'] = pad(t.project_title, widths['project'])
 
-            segments = trim_segments(segments, h_offset)
-            active_search = search_buffer if in_search else search_term
-            if active_search and not is_sel:
-                segments = highlight_segments(segments, active_search)
+            # Selected rows render entirely reversed; otherwise only the status
+            # cell may differ from the row's base style.
+            if is_sel:
+                segments = _table_row_segments(marker, values, column_specs, style_row, style_row)
+            else:
+                segments = _table_row_segments(marker, values, column_specs, base_style.strip(), status_style.strip())
+            segments = _trim_segments(segments, h_offset)
+            if highlight_re is not None and not is_sel:
+                segments = _highlight_segments(segments, highlight_re)
 
             row_offsets.append(line_cursor)
-            for seg_style, seg_text in segments:
-                frags.append((seg_style, seg_text))
+            frags.extend(_merge_style_runs(segments))
             frags.append(("", "\n"))
             line_cursor += 1
             if rel_idx < len(display_slice) - 1:
@@ -7755,31 +8373,31 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         table_row_offsets = row_offsets
         return frags
 
+    def _summary_tops(kind: str, limit: int) -> List[Tuple[str, int]]:
+        """Largest 30-day totals for 'project' or 'label', refreshed every summary_cache_ttl."""
+        entry = summary_cache[kind]
+        now_mon = time.monotonic()
+        if (now_mon - float(entry.get('ts', 0.0))) >= summary_cache_ttl or not entry.get('tops'):
+            aggregate = db.aggregate_project_totals if kind == 'project' else db.aggregate_label_totals
+            try:
+                data = aggregate(since_days=30)
+            except Exception:
+                data = entry.get('data', {}) or {}
+            else:
+                entry['data'] = data
+                entry['tops'] = heapq.nlargest(limit, data.items(), key=itemgetter(1))
+            entry['ts'] = now_mon
+        return entry.get('tops', []) or []
+
     def summarize() -> List[Tuple[str,str]]:
         nonlocal task_duration_cache
         rows = filtered_rows()
         total = len(rows)
         done_ct = sum(1 for r in rows if r.is_done)
-        now_mon = time.monotonic()
-
-        def _fmt_hm(ts: int) -> str:
-            s = int(max(0, ts))
-            h, r = divmod(s, 3600)
-            m, _ = divmod(r, 60)
-            return f"{h:d}:{m:02d}"
-
-        def _fmt_mmss(ts: int) -> str:
-            s = int(max(0, ts))
-            m, s = divmod(s, 60)
-            return f"{m:02d}:{s:02d}"
 
         # Timer snapshot
         now_s = task_s = proj_s = 0
-        active_count = 0
-        try:
-            active_count = len(db.active_task_urls())
-        except Exception:
-            active_count = 0
+        active_count = len(_frame_active_urls())
         if rows:
             cur = rows[current_index]
             if cur.url:
@@ -7793,14 +8411,11 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                     now_s = snapshot.get('current', 0)
                     task_s = snapshot.get('total', 0)
             if cur.project_title:
-                proj_s = db.project_total_seconds(cur.project_title)
+                proj_s = _frame_project_seconds(cur.project_title)
 
         active_search_val = (search_buffer if in_search else search_term) or '-'
 
-        heading_style = _style_class('summary.title')
-        label_style = _style_class('summary.label')
-        value_style = _style_class('summary.value')
-        accent_style = _style_class('summary.accent')
+        heading_style, label_style, value_style, accent_style = _summary_styles()
 
         fr: List[Tuple[str, str]] = []
 
@@ -7903,7 +8518,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 for name, val in items[:6]:
                     ratio = min(1.0, float(val) / float(max_val))
                     filled = int(round(ratio * bar_width))
-                    bar = '█' * filled + '░' * (bar_width - filled)
+                    bar = _meter_bar(filled, bar_width)
                     fr.append((accent_style, _pad_display(f"• {_truncate(name or '-', left_width - 2)}", left_width)))
                     fr.append((value_style, _pad_display(_fmt_hm(val), value_width)))
                     fr.append(("", gap))
@@ -8008,30 +8623,10 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             add_heading_bar('Filters')
             add_two_column(filter_rows)
 
-            proj_cache_entry = summary_cache['project']
-            if (now_mon - float(proj_cache_entry.get('ts', 0.0))) >= summary_cache_ttl or not proj_cache_entry.get('tops'):
-                try:
-                    proj_data = db.aggregate_project_totals(since_days=30)
-                except Exception:
-                    proj_data = proj_cache_entry.get('data', {}) or {}
-                else:
-                    proj_cache_entry['data'] = proj_data
-                    proj_cache_entry['tops'] = sorted(proj_data.items(), key=lambda kv: kv[1], reverse=True)[:6]
-                proj_cache_entry['ts'] = now_mon
-            project_tops = proj_cache_entry.get('tops', []) or []
+            project_tops = _summary_tops('project', 6)
             add_bar_section('Top Projects (30d)', project_tops)
 
-            label_cache_entry = summary_cache['label']
-            if (now_mon - float(label_cache_entry.get('ts', 0.0))) >= summary_cache_ttl or not label_cache_entry.get('tops'):
-                try:
-                    label_data = db.aggregate_label_totals(since_days=30)
-                except Exception:
-                    label_data = label_cache_entry.get('data', {}) or {}
-                else:
-                    label_cache_entry['data'] = label_data
-                    label_cache_entry['tops'] = sorted(label_data.items(), key=lambda kv: kv[1], reverse=True)[:6]
-                label_cache_entry['ts'] = now_mon
-            label_tops = label_cache_entry.get('tops', []) or []
+            label_tops = _summary_tops('label', 6)
             add_bar_section('Top Labels (30d)', label_tops)
 
             add_detail_columns(detail_map, detail_url)
@@ -8040,6 +8635,18 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 fr[-1] = (fr[-1][0], fr[-1][1][:-1])
             return fr
 
+        # The vertical panel is a pure function of these values; reuse the last
+        # fragments on redraws where none of them moved (e.g. key repeats, idle ticks).
+        project_tops = _summary_tops('project', 5)
+        label_tops = _summary_tops('label', 5)
+        fragments_key = (
+            current_theme_index, total, done_ct, now_s, task_s, proj_s, active_count,
+            active_search_val, project_cycle, hide_done, hide_no_date, date_max, sort_index,
+            tuple(project_tops), tuple(label_tops),
+        )
+        if summary_fragments_cache['key'] == fragments_key:
+            return summary_fragments_cache['fragments']
+
         add_heading('Overview')
         overview_rows = [
             ('👤', 'User', cfg.user),
@@ -8063,33 +8670,11 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             filter_rows.insert(2, ('📅', 'Date Max', date_max))
         render_rows(filter_rows, label_width=12, value_cap=24)
 
-        proj_cache_entry = summary_cache['project']
-        if (now_mon - float(proj_cache_entry.get('ts', 0.0))) >= summary_cache_ttl or not proj_cache_entry.get('tops'):
-            try:
-                proj_data = db.aggregate_project_totals(since_days=30)
-            except Exception:
-                proj_data = proj_cache_entry.get('data', {}) or {}
-            else:
-                proj_cache_entry['data'] = proj_data
-                proj_cache_entry['tops'] = sorted(proj_data.items(), key=lambda kv: kv[1], reverse=True)[:5]
-            proj_cache_entry['ts'] = now_mon
-        project_tops = proj_cache_entry.get('tops', []) or []
         if project_tops:
             add_heading('Top Projects (30d)', leading_blank=True)
             project_rows = [('•', name or '-', _fmt_hm(secs)) for name, secs in project_tops]
             render_rows(project_rows, label_width=18, value_cap=12, label_style_override=accent_style)
 
-        label_cache_entry = summary_cache['label']
-        if (now_mon - float(label_cache_entry.get('ts', 0.0))) >= summary_cache_ttl or not label_cache_entry.get('tops'):
-            try:
-                label_data = db.aggregate_label_totals(since_days=30)
-            except Exception:
-                label_data = label_cache_entry.get('data', {}) or {}
-            else:
-                label_cache_entry['data'] = label_data
-                label_cache_entry['tops'] = sorted(label_data.items(), key=lambda kv: kv[1], reverse=True)[:5]
-            label_cache_entry['ts'] = now_mon
-        label_tops = label_cache_entry.get('tops', []) or []
         if label_tops:
             add_heading('Top Labels (30d)', leading_blank=True)
             label_rows = [('•', name or '-', _fmt_hm(secs)) for name, secs in label_tops]
@@ -8097,6 +8682,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
 
         if fr and fr[-1][1].endswith("\n"):
             fr[-1] = (fr[-1][0], fr[-1][1][:-1])
+        summary_fragments_cache.update(key=fragments_key, fragments=fr)
         return fr
 
     def _row_index_from_mouse(line_no: int) -> Optional[int]:
@@ -8184,7 +8770,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             return super().mouse_handler(mouse_event)
 
     table_control = _TableFormattedTextControl(
-        text=lambda: build_table_fragments(),
+        text=build_table_fragments,
         focusable=True,
         click_handler=_handle_table_mouse if _MOUSE_EVENTS_AVAILABLE else None,
         key_bindings=table_kb,
@@ -8215,32 +8801,30 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                     now_s = snapshot.get('current', 0)
                     task_s = snapshot.get('total', 0)
             if t.project_title:
-                proj_s = db.project_total_seconds(t.project_title)
-        try:
-            active_count = len(db.active_task_urls())
-        except Exception:
-            active_count = 0
-        def _fmt_hms(s:int)->str:
-            s = int(max(0, s))
-            h, r = divmod(s, 3600)
-            m, s = divmod(r, 60)
-            return f"{h:d}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+                proj_s = _frame_project_seconds(t.project_title)
+        active_count = len(_frame_active_urls())
         timers = f" Now:{_fmt_hms(now_s)} Task:{_fmt_hms(task_s)} Proj:{_fmt_hms(proj_s)} Act:{active_count} "
         view_label = 'Iteration' if use_iteration else 'Dates'
         sort_label = _truncate(sort_presets[sort_index]['name'], 20)
         txt = f"{timers}| Date: {today_date.isoformat()}  | Project: {_truncate(active_proj,30)}  | View: {view_label}  | Sort: {sort_label}  | Shown: {total}  | Search: {_truncate(active_search,30)} "
         return [("reverse", txt)]
-    top_status_control = FormattedTextControl(text=lambda: build_top_status())
+    top_status_control = FormattedTextControl(text=build_top_status)
     top_status_window = Window(height=1, content=top_status_control)
-    stats_control = FormattedTextControl(text=lambda: summarize())
+    stats_control = FormattedTextControl(text=summarize)
+
+    def _stats_window_spec(layout_name: str) -> Tuple[str, int, str]:
+        """(layout, stats height or width, panel style) that the stats window is built from."""
+        if layout_name == 'horizontal':
+            size = _layout_int('stats_height', 12)
+        else:
+            size = _layout_int('stats_width', 32)
+        return layout_name, size, _style_class('summary.panel') or ''
 
     def _build_stats_window(layout_name: str) -> Window:
-        panel_style = _style_class('summary.panel') or ''
+        _, size, panel_style = _stats_window_spec(layout_name)
         if layout_name == 'horizontal':
-            stats_height = _layout_int('stats_height', 12)
-            return Window(height=Dimension(preferred=stats_height), content=stats_control, wrap_lines=False, always_hide_cursor=True, style=panel_style)
-        stats_width = _layout_int('stats_width', 32)
-        return Window(width=stats_width, content=stats_control, wrap_lines=False, always_hide_cursor=True, style=panel_style)
+            return Window(height=Dimension(preferred=size), content=stats_control, wrap_lines=False, always_hide_cursor=True, style=panel_style)
+        return Window(width=size, content=stats_control, wrap_lines=False, always_hide_cursor=True, style=panel_style)
 
     detail_control = FormattedTextControl(text=lambda: build_detail_text())
     detail_body = Window(
@@ -8261,12 +8845,6 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
     show_report = False
     report_granularity = 'day'  # one of: day, week, month
 
-    def _fmt_hms_full(s:int) -> str:
-        s = int(max(0, s))
-        h, r = divmod(s, 3600)
-        m, s = divmod(r, 60)
-        return f"{h:d}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
-
     def _parse_session_dt(raw: Optional[str]) -> Optional[dt.datetime]:
         if not raw:
             return None
@@ -8391,12 +8969,11 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
 
     def open_session_editor() -> None:
         nonlocal edit_sessions_mode, session_float, session_state, status_line, detail_mode, show_report, in_search, in_date_filter
-        rows = filtered_rows()
-        if not rows:
+        task = _current_row()
+        if task is None:
             status_line = "No task selected"
             invalidate()
             return
-        task = rows[current_index]
         if not task.url:
             status_line = "Selected task missing URL"
             invalidate()
@@ -8574,7 +9151,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
 
     def build_session_editor_text() -> List[Tuple[str, str]]:
         if not edit_sessions_mode:
-            return []
+            return _EMPTY_FT
         title = session_state.get('task_title') or session_state.get('task_url') or 'Timer Sessions'
         project_title = session_state.get('project_title') or ''
         sessions = session_state.get('sessions') or []
@@ -8591,15 +9168,16 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         if not sessions:
             lines.append("  No recorded sessions for this task.")
         else:
-            lines.append(f"  Total logged: {_fmt_hms_full(total_secs)}")
+            lines.append(f"  Total logged: {_fmt_hms(total_secs)}")
             lines.append("")
-            for idx, sess in enumerate(sessions):
-                marker = '>' if idx == cursor else ' '
-                start_disp = sess.get('start_display') or '-'
-                end_disp = sess.get('end_display') or '-'
-                dur_disp = _fmt_hms_full(int(sess.get('duration') or 0))
-                running_flag = ' ⏱' if sess.get('open') else ''
-                lines.append(f"{marker} {idx+1:02d}  {start_disp}  ->  {end_disp:<19}  {dur_disp:>9}{running_flag}")
+            lines.extend([
+                _session_row_text(
+                    '>' if idx == cursor else ' ', idx + 1,
+                    sess.get('start_display') or '-', sess.get('end_display') or '-',
+                    int(sess.get('duration') or 0), bool(sess.get('open')),
+                )
+                for idx, sess in enumerate(sessions)
+            ])
         lines.append("")
         if edit_field:
             lines.append(f"Editing {edit_field} (Enter=save | Esc=cancel)")
@@ -8616,14 +9194,13 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             return [("bold", head), ("", "\n" + rest)]
         return [("bold", block)]
 
-    session_control = FormattedTextControl(text=lambda: build_session_editor_text())
+    session_control = FormattedTextControl(text=build_session_editor_text)
     session_window = Window(width=96, height=24, content=session_control, wrap_lines=False, always_hide_cursor=True, style="bg:#202020 #ffffff")
 
     def build_task_edit_text() -> List[Tuple[str, str]]:
         if not edit_task_mode:
-            return []
-        rows = filtered_rows()
-        row = rows[current_index] if rows else None
+            return _EMPTY_FT
+        row = _current_row()
         if row and task_edit_state.get('task_url') != row.url:
             _refresh_task_editor_state(preserve_cursor=False, do_invalidate=False)
         fields = task_edit_state.get('fields') or []
@@ -8631,13 +9208,16 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         cursor = max(0, min(cursor, len(fields)-1)) if fields else 0
         mode = task_edit_state.get('mode', 'list')
 
-        segments: List[Tuple[str, str]] = []
+        line_styles: List[str] = []
+        line_texts: List[str] = []
 
         def add_line(text: str, style: str = 'class:editor.text') -> None:
-            segments.append((style, text + '\n'))
+            line_styles.append(style)
+            line_texts.append(text)
 
         def add_blank() -> None:
-            segments.append(('', '\n'))
+            line_styles.append('')
+            line_texts.append('')
 
         if row:
             header = f"📋 {row.title or row.url}"
@@ -8655,77 +9235,13 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             add_line("No editable fields", 'class:editor.warning')
         else:
             add_blank()
+            renderers_get = _EDIT_FIELD_RENDERERS.get
             for idx, field_info in enumerate(fields):
-                marker = '➤' if idx == cursor else ' '
-                ftype = field_info.get('type')
-                extra_lines: List[str] = []
-                if ftype == 'priority':
-                    opts = field_info.get('options') or []
-                    index = max(0, min(field_info.get('index', 0), len(opts)-1)) if opts else 0
-                    if opts:
-                        value = opts[index].get('name') if opts else '(no options)'
-                        if row and getattr(row, 'priority_dirty', 0):
-                            value = (value or '-') + '*'
-                    else:
-                        fallback = (row.priority or '').strip() if row else ''
-                        if fallback:
-                            value = fallback
-                        else:
-                            if field_info.get('field_available'):
-                                value = '(load options)'
-                            else:
-                                value = '(none)'
-                elif ftype == 'assignees':
-                    vals = field_info.get('value') or []
-                    if isinstance(vals, list):
-                        value = ', '.join(vals) or '-'
-                    else:
-                        value = str(vals) or '-'
-                elif ftype == 'labels':
-                    vals = field_info.get('value') or []
-                    if isinstance(vals, list):
-                        value = ', '.join(vals) or '-'
-                    else:
-                        value = str(vals) or '-'
-                elif ftype == 'iteration':
-                    opts = field_info.get('options') or []
-                    index = max(0, min(field_info.get('index', 0), len(opts)-1)) if opts else 0
-                    if opts:
-                        opt = opts[index]
-                        title = (opt.get('title') or '').strip()
-                        start = (opt.get('startDate') or '').strip()
-                        if title and start:
-                            value = f"{title} ({start})"
-                        else:
-                            value = title or start or '-'
-                    else:
-                        value = field_info.get('value') or ''
-                        if not value:
-                            if field_info.get('field_available'):
-                                value = '(load options)'
-                            else:
-                                value = '(none)'
-                elif ftype == 'priority-text':
-                    value = field_info.get('value') or '-'
-                elif ftype == 'comment':
-                    value = '(add comment)'
-                elif ftype == 'comment-history':
-                    values = field_info.get('value') or []
-                    if isinstance(values, list) and values:
-                        value = values[0]
-                        extra_lines = values[1:]
-                    elif isinstance(values, list):
-                        value = '(no comments)'
-                    else:
-                        value = str(values) or '(no comments)'
-                else:
-                    value = field_info.get('value', '')
-                value = value or '-'
-                style = 'class:editor.field.cursor' if idx == cursor else 'class:editor.field'
-                add_line(f" {marker} {field_info.get('name')} : {value}", style)
-                if extra_lines:
-                    for extra in extra_lines:
-                        add_line(f"   {extra}", 'class:editor.meta')
+                value, extra_lines = renderers_get(field_info.get('type'), _edit_field_default)(field_info, row)
+                is_cursor = idx == cursor
+                add_line(f" {_CURSOR_MARKERS[is_cursor]} {field_info.get('name')} : {value or '-'}", _EDITOR_FIELD_STYLES[is_cursor])
+                for extra in extra_lines:
+                    add_line(f"   {extra}", 'class:editor.meta')
 
         if mode == 'edit-date-calendar' and fields:
             editing = task_edit_state.get('editing') or {}
@@ -8734,24 +9250,12 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 cursor_date = dt.date.fromisoformat(iso)
             except Exception:
                 cursor_date = dt.date.today()
-            cal = calendar.Calendar(firstweekday=0)
             add_blank()
             add_line(f"🗓️ Select {fields[cursor].get('name')} (h/l day, j/k week, </> month, t today, x clear)", 'class:editor.instructions')
             add_line(cursor_date.strftime("%B %Y"), 'class:editor.calendar')
-            day_header = ''.join(f" {calendar.day_abbr[i][:2]} " for i in range(7))
-            add_line(day_header, 'class:editor.calendar')
-            for week in cal.monthdatescalendar(cursor_date.year, cursor_date.month):
-                row_cells: List[str] = []
-                for day in week:
-                    label = f"{day.day:2d}"
-                    if day == cursor_date:
-                        cell = f"[{label}]"
-                    elif day.month != cursor_date.month:
-                        cell = f"({label})"
-                    else:
-                        cell = f" {label} "
-                    row_cells.append(cell)
-                add_line("".join(row_cells), 'class:editor.calendar')
+            add_line(_CALENDAR_DAY_HEADER, 'class:editor.calendar')
+            for week_line in _calendar_week_lines(cursor_date):
+                add_line(week_line, 'class:editor.calendar')
             add_blank()
             add_line("Enter=save · Esc=cancel", 'class:editor.instructions')
         elif mode == 'edit-title':
@@ -8760,15 +9264,12 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             add_line(f"✏️  {task_edit_state.get('input', '')}", 'class:editor.entry')
         elif mode == 'priority-select':
             field = fields[cursor] if cursor < len(fields) else None
-            opts = (field or {}).get('options') or []
             idx = (field or {}).get('index', 0)
             add_blank()
             add_line("⚡ Select priority (j/k move, Enter=save, Esc=cancel)", 'class:editor.instructions')
-            for i, opt in enumerate(opts):
-                marker = '➤' if i == idx else ' '
-                name = (opt.get('name') if isinstance(opt, dict) else None) or '(option)'
-                style = 'class:editor.priority.cursor' if i == idx else 'class:editor.priority'
-                add_line(f"   {marker} {name}", style)
+            for i, name in enumerate(task_edit_state.get('priority_option_names') or ()):
+                is_cursor = i == idx
+                add_line(f"   {_CURSOR_MARKERS[is_cursor]} {name}", _EDITOR_OPTION_STYLES[is_cursor])
         elif mode == 'iteration-select':
             field = fields[cursor] if cursor < len(fields) else None
             opts = (field or {}).get('options') or []
@@ -8779,12 +9280,11 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             add_blank()
             add_line("🔁 Select iteration (j/k move, Enter=save, Esc=cancel)", 'class:editor.instructions')
             for i, opt in enumerate(choices):
-                marker = '➤' if i == idx else ' '
+                is_cursor = i == idx
                 title = (opt.get('title') if isinstance(opt, dict) else None) or '(iteration)'
                 start = (opt.get('startDate') or '').strip() if isinstance(opt, dict) else ''
                 label = f"{title} ({start})" if title and start else (title or start or '(iteration)')
-                style = 'class:editor.priority.cursor' if i == idx else 'class:editor.priority'
-                add_line(f"   {marker} {label}", style)
+                add_line(f"   {_CURSOR_MARKERS[is_cursor]} {label}", _EDITOR_OPTION_STYLES[is_cursor])
         elif mode == 'iteration-create':
             field = fields[cursor] if cursor < len(fields) else None
             opts = (field or {}).get('options') or []
@@ -8801,8 +9301,6 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             else:
                 choices = task_edit_state.get('assignee_choices') or []
                 selected = task_edit_state.get('assignees_selected') or set()
-                if not isinstance(selected, set):
-                    selected = set(selected)
                 idx = max(0, min(len(choices)-1, task_edit_state.get('assignee_index', 0))) if choices else 0
                 assignee_error = task_edit_state.get('assignee_error') or ''
                 if assignee_error:
@@ -8812,17 +9310,12 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                     for i, entry in enumerate(choices):
                         login = (entry.get('login') or '').strip()
                         display = (entry.get('display') or login or '(unknown)')
-                        pointer = '➤' if i == idx else ' '
-                        checkbox = '☑' if login in selected else '☐'
-                        if i == idx and login in selected:
-                            style = 'class:editor.label.cursor.selected'
-                        elif i == idx:
-                            style = 'class:editor.label.cursor'
-                        elif login in selected:
-                            style = 'class:editor.label.selected'
-                        else:
-                            style = 'class:editor.label'
-                        add_line(f" {pointer} {checkbox} {display}", style)
+                        is_cursor = i == idx
+                        is_selected = login in selected
+                        add_line(
+                            f" {_CURSOR_MARKERS[is_cursor]} {_CHECKBOXES[is_selected]} {display}",
+                            _EDITOR_CHECK_STYLES[is_cursor * 2 + is_selected],
+                        )
                 else:
                     add_line("No project assignees found.", 'class:editor.warning')
                     add_line("Type logins manually (comma-separated).", 'class:editor.instructions')
@@ -8839,26 +9332,20 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             else:
                 labels_error = task_edit_state.get('labels_error') or ''
                 choices = task_edit_state.get('label_choices') or []
+                # Every writer stores a set, so render reads it as-is.
                 selected = task_edit_state.get('labels_selected') or set()
-                if not isinstance(selected, set):
-                    selected = set(selected)
                 idx = max(0, min(len(choices)-1, task_edit_state.get('label_index', 0))) if choices else 0
                 if labels_error:
                     add_line(f"⚠️ {labels_error}", 'class:editor.warning')
                 if choices:
                     add_line("🏷️ Use j/k to move, Space to toggle, Enter=save, Esc=cancel", 'class:editor.instructions')
                     for i, name in enumerate(choices):
-                        pointer = '➤' if i == idx else ' '
-                        checkbox = '☑' if name in selected else '☐'
-                        if i == idx and name in selected:
-                            style = 'class:editor.label.cursor.selected'
-                        elif i == idx:
-                            style = 'class:editor.label.cursor'
-                        elif name in selected:
-                            style = 'class:editor.label.selected'
-                        else:
-                            style = 'class:editor.label'
-                        add_line(f" {pointer} {checkbox} {name}", style)
+                        is_cursor = i == idx
+                        is_selected = name in selected
+                        add_line(
+                            f" {_CURSOR_MARKERS[is_cursor]} {_CHECKBOXES[is_selected]} {name}",
+                            _EDITOR_CHECK_STYLES[is_cursor * 2 + is_selected],
+                        )
                 else:
                     add_line(f"No labels available for {repo_label}", 'class:editor.warning')
                     add_line("Enter=save (keep current) · Esc=cancel", 'class:editor.instructions')
@@ -8885,15 +9372,9 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             add_blank()
             add_line(f"💡 {message}", 'class:editor.message')
 
-        if segments:
-            style_last, text_last = segments[-1]
-            if text_last.endswith('\n'):
-                segments[-1] = (style_last, text_last[:-1])
-                if not segments[-1][1]:
-                    segments.pop()
-        return segments
+        return _join_styled_lines(line_styles, line_texts)
 
-    task_edit_control = FormattedTextControl(text=lambda: build_task_edit_text())
+    task_edit_control = FormattedTextControl(text=build_task_edit_text)
     task_edit_body = Window(
         width=Dimension(preferred=100, max=120),
         height=Dimension(preferred=32, max=50),
@@ -8904,19 +9385,30 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
     )
     task_edit_window = Frame(body=task_edit_body, title="🛠 Task Field Editor", style="class:editor.frame")
 
+    # The report runs a dozen aggregate queries; redraws reuse the last build
+    # until the selection, granularity or sessions change. While a timer runs
+    # the totals grow on their own, so the key then also rolls over each second.
+    report_cache: Dict[str, object] = {'key': None, 'fragments': []}
+
     def build_report_text() -> List[Tuple[str,str]]:
         lines: List[str] = []
         # current selection snapshot
-        rows = filtered_rows()
-        cur_proj = rows[current_index].project_title if rows else None
-        cur_url = rows[current_index].url if rows else None
-        now_s = db.task_current_elapsed_seconds(cur_url) if cur_url else 0
-        task_s = db.task_total_seconds(cur_url) if cur_url else 0
-        proj_s = db.project_total_seconds(cur_proj) if cur_proj else 0
+        cur = _current_row()
+        cur_proj = cur.project_title if cur else None
+        cur_url = cur.url if cur else None
+        cur_title = cur.title if cur else '-'
+        report_key = (
+            report_granularity, cur_proj, cur_url, cur_title, db.sessions_version, dt.date.today(),
+            int(time.monotonic()) if _frame_active_urls() else None,
+        )
+        if report_cache['key'] == report_key:
+            return report_cache['fragments']
+        now_s, task_s = _status_task_seconds(cur_url) if cur_url else (0, 0)
+        proj_s = _frame_project_seconds(cur_proj) if cur_proj else 0
         hdr = f"Timer Report — granularity: {report_granularity.upper()}  (d/w/m to switch, Enter/Esc to close)"
         lines.append(hdr)
         lines.append("")
-        lines.append(f"Now: {_fmt_hms_full(now_s)}  Task: {_fmt_hms_full(task_s)}  Proj: {_fmt_hms_full(proj_s)}  Active: {len(db.active_task_urls())}")
+        lines.append(f"Now: {_fmt_hms(now_s)}  Task: {_fmt_hms(task_s)}  Proj: {_fmt_hms(proj_s)}  Active: {len(_frame_active_urls())}")
         lines.append("")
         # Choose lookback window
         if report_granularity == 'day':
@@ -8928,91 +9420,61 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         else:
             since_days = 365*2
             limit = 12
+        # One pass over the sessions serves every period block and quick-view sum.
+        scope_filters: List[Tuple[str, Optional[str], Optional[str]]] = [('Overall', None, None)]
+        if cur_proj:
+            scope_filters.append(('Project', cur_proj, None))
+        if cur_url:
+            scope_filters.append(('Task', None, cur_url))
+        quick_windows = (('day', 14), ('week', 7*12), ('month', 365))
+        scope_specs = [(report_granularity, since_days, proj, url) for _, proj, url in scope_filters]
+        scope_specs += [(gran, days, proj, url) for _, proj, url in scope_filters for gran, days in quick_windows]
+        # Aggregate each distinct scope once should a lookback match a quick window.
+        scope_specs = list(dict.fromkeys(scope_specs))
+        scope_totals = dict(zip(scope_specs, db.aggregate_period_totals_multi(scope_specs)))
         # Overall
         lines.append("Overall:")
-        totals = db.aggregate_period_totals(report_granularity, since_days=since_days)
-        keys = sorted(totals.keys(), reverse=True)[:limit]
-        if not keys:
-            lines.append("  (no data)")
-        else:
-            maxv = max(totals[k] for k in keys) or 1
-            for k in keys:
-                v = totals[k]
-                bar = '█' * max(1, int(30 * v / maxv))
-                lines.append(f"  {k:<10} {_fmt_hms_full(v):>10}  {bar}")
+        totals = scope_totals[(report_granularity, since_days, None, None)]
+        lines.extend(_report_bar_lines([(k, totals[k]) for k in heapq.nlargest(limit, totals)]))
         lines.append("")
         # Current selection project/task
         lines.append(f"Project: {cur_proj or '-'}")
-        p_tot = db.aggregate_period_totals(report_granularity, since_days=since_days, project_title=cur_proj) if cur_proj else {}
-        p_keys = sorted(p_tot.keys(), reverse=True)[:limit]
-        if not p_keys:
-            lines.append("  (no data)")
-        else:
-            maxv = max(p_tot[k] for k in p_keys) or 1
-            for k in p_keys:
-                v = p_tot[k]
-                bar = '█' * max(1, int(30 * v / maxv))
-                lines.append(f"  {k:<10} {_fmt_hms_full(v):>10}  {bar}")
+        p_tot = scope_totals[(report_granularity, since_days, cur_proj, None)] if cur_proj else {}
+        lines.extend(_report_bar_lines([(k, p_tot[k]) for k in heapq.nlargest(limit, p_tot)]))
         lines.append("")
-        lines.append(f"Task: {rows[current_index].title if rows else '-'}")
-        t_tot = db.aggregate_period_totals(report_granularity, since_days=since_days, task_url=cur_url) if cur_url else {}
-        t_keys = sorted(t_tot.keys(), reverse=True)[:limit]
-        if not t_keys:
-            lines.append("  (no data)")
-        else:
-            maxv = max(t_tot[k] for k in t_keys) or 1
-            for k in t_keys:
-                v = t_tot[k]
-                bar = '█' * max(1, int(30 * v / maxv))
-                lines.append(f"  {k:<10} {_fmt_hms_full(v):>10}  {bar}")
+        lines.append(f"Task: {cur_title}")
+        t_tot = scope_totals[(report_granularity, since_days, None, cur_url)] if cur_url else {}
+        lines.extend(_report_bar_lines([(k, t_tot[k]) for k in heapq.nlargest(limit, t_tot)]))
         lines.append("")
         lines.append("Top projects (window):")
         proj_totals = db.aggregate_project_totals(since_days=since_days)
-        tops = sorted(proj_totals.items(), key=lambda x: x[1], reverse=True)[:10]
-        if not tops:
-            lines.append("  (no data)")
-        else:
-            maxv = max(v for _,v in tops) or 1
-            for name, secs in tops:
-                nm = (name or '-')
-                bar = '█' * max(1, int(30 * secs / maxv))
-                lines.append(f"  {_truncate(nm,20):<20} {_fmt_hms_full(secs):>10}  {bar}")
+        tops = heapq.nlargest(10, proj_totals.items(), key=itemgetter(1))
+        lines.extend(_report_bar_lines([(_truncate(name or '-', 20), secs) for name, secs in tops], 20))
         lines.append("")
         lines.append("Top labels (window):")
         label_totals = db.aggregate_label_totals(since_days=since_days)
-        label_tops = sorted(label_totals.items(), key=lambda x: x[1], reverse=True)[:10]
-        if not label_tops:
-            lines.append("  (no data)")
-        else:
-            maxv_lab = max(v for _, v in label_tops) or 1
-            for name, secs in label_tops:
-                nm = (name or '-')
-                bar = '█' * max(1, int(30 * secs / maxv_lab))
-                lines.append(f"  {_truncate(nm,20):<20} {_fmt_hms_full(secs):>10}  {bar}")
+        label_tops = heapq.nlargest(10, label_totals.items(), key=itemgetter(1))
+        lines.extend(_report_bar_lines([(_truncate(name or '-', 20), secs) for name, secs in label_tops], 20))
         # Quick multi-granularity snapshot (recent sums)
         lines.append("")
         lines.append("Quick view (recent sums):")
-        def _sum_recent(gran: str, days: int, filt_proj=None, filt_task=None) -> int:
-            m = db.aggregate_period_totals(gran, since_days=days, project_title=filt_proj, task_url=filt_task)
-            return sum(m.values())
-        lines.append(f"Overall  D:{_fmt_hms_full(_sum_recent('day', 14))}  W:{_fmt_hms_full(_sum_recent('week', 7*12))}  M:{_fmt_hms_full(_sum_recent('month', 365))}")
-        if cur_proj:
-            lines.append(f"Project  D:{_fmt_hms_full(_sum_recent('day', 14, filt_proj=cur_proj))}  W:{_fmt_hms_full(_sum_recent('week', 7*12, filt_proj=cur_proj))}  M:{_fmt_hms_full(_sum_recent('month', 365, filt_proj=cur_proj))}")
-        if cur_url:
-            lines.append(f"Task     D:{_fmt_hms_full(_sum_recent('day', 14, filt_task=cur_url))}  W:{_fmt_hms_full(_sum_recent('week', 7*12, filt_task=cur_url))}  M:{_fmt_hms_full(_sum_recent('month', 365, filt_task=cur_url))}")
-        return [("bold", lines[0])] + [("", "\n" + "\n".join(lines[1:]))]
-
-    report_control = FormattedTextControl(text=lambda: build_report_text())
+        for label, proj, url in scope_filters:
+            d, w, m = (sum(scope_totals[(gran, days, proj, url)].values()) for gran, days in quick_windows)
+            lines.append(f"{label:<7}  D:{_fmt_hms(d)}  W:{_fmt_hms(w)}  M:{_fmt_hms(m)}")
+        fragments = [("bold", lines[0])] + [("", "\n" + "\n".join(lines[1:]))]
+        report_cache.update(key=report_key, fragments=fragments)
+        return fragments
+
+    report_control = FormattedTextControl(text=build_report_text)
     report_window = Window(width=100, height=28, content=report_control, wrap_lines=True, always_hide_cursor=True, style="bg:#202020 #ffffff")
 
     def build_detail_text() -> List[Tuple[str,str]]:
         if not detail_mode:
-            return []
-        rows = filtered_rows()
+            return _EMPTY_FT
+        t = _current_row()
         value_style_default = _style_class('detail.value', 'summary.value') or ''
-        if not rows:
+        if t is None:
             return [(value_style_default, "No selection")]
-        t = rows[current_index]
 
         def _clean(value: Optional[object]) -> str:
             if value is None:
@@ -9022,37 +9484,6 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 return '—'
             return text.replace('\n', ' ').replace('\r', ' ')
 
-        def _assignees_display(row: TaskRow) -> str:
-            raw = getattr(row, 'assignee_logins', '[]') or '[]'
-            try:
-                parsed = json.loads(raw)
-                if not isinstance(parsed, list):
-                    parsed = []
-            except Exception:
-                parsed = []
-            cleaned: List[str] = []
-            seen: Set[str] = set()
-            for entry in parsed:
-                login = str(entry).strip()
-                if not login:
-                    continue
-                if not login.startswith('@'):
-                    login_disp = '@' + login
-                else:
-                    login_disp = login
-                key = login_disp.lower()
-                if key in seen:
-                    continue
-                seen.add(key)
-                cleaned.append(login_disp)
-                if len(cleaned) >= 5:
-                    break
-            if not cleaned:
-                return '—'
-            if len(cleaned) > 3:
-                return ', '.join(cleaned[:3]) + ', …'
-            return ', '.join(cleaned)
-
         label_style = _style_class('detail.label', 'summary.label') or ''
         value_style = value_style_default
         meta_style = _style_class('detail.meta', 'summary.accent') or value_style
@@ -9060,13 +9491,12 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         instructions_style = _style_class('detail.instructions', 'editor.instructions') or ''
         title_style = _style_class('detail.title', 'summary.title') or meta_style
 
-        labels_list = _task_labels(t)
-        labels_display = ", ".join(labels_list) if labels_list else "—"
+        labels_display = _labels_cell_text(t.labels or "[]", "—")
 
         priority_base = (t.priority or '').strip()
         if not priority_base:
             priority_base = '—'
-        if getattr(t, 'priority_dirty', 0):
+        if t.priority_dirty:
             priority_base = f"{priority_base} ⏳"
 
         status_text = (t.status or '').strip() or 'No status'
@@ -9103,10 +9533,10 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             segments.append(('', '\n'))
 
         project_bits: List[str] = []
-        owner = _clean(t.owner) if getattr(t, 'owner', None) else ''
+        owner = _clean(t.owner) if t.owner else ''
         if owner and owner != '—':
             project_bits.append(owner)
-        if getattr(t, 'project_number', None):
+        if t.project_number:
             project_bits.append(f"#{t.project_number}")
         project_suffix = f" ({' · '.join(project_bits)})" if project_bits else ""
         project_display = f"{_clean(t.project_title)}{project_suffix}"
@@ -9153,7 +9583,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             iter_display = ", ".join(iter_suffix)
         add_line("🧭", "Iteration", iter_display or "—")
 
-        add_line("👥", "Assignees", _assignees_display(t))
+        add_line("👥", "Assignees", _assignees_detail_text(t.assignee_logins or '[]'))
         ownership_bits: List[str] = []
         if t.assigned_to_me:
             ownership_bits.append("assigned to you")
@@ -9165,9 +9595,9 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         sync_bits: List[str] = []
         if (t.url or "").startswith(PENDING_URL_PREFIX):
             sync_bits.append("awaiting create")
-        if getattr(t, 'status_dirty', 0):
+        if t.status_dirty:
             sync_bits.append("status queued")
-        if getattr(t, 'priority_dirty', 0):
+        if t.priority_dirty:
             sync_bits.append("priority queued")
         sync_text = ", ".join(sync_bits) if sync_bits else "Up to date"
         add_line("🛰", "Sync", sync_text, meta_style if sync_bits else value_style)
@@ -9187,13 +9617,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
 
     show_help = False
 
-    def _fmt_hms(total_seconds: int) -> str:
-        s = int(max(0, total_seconds))
-        h, r = divmod(s, 3600)
-        m, s = divmod(r, 60)
-        if h:
-            return f"{h:d}:{m:02d}:{s:02d}"
-        return f"{m:02d}:{s:02d}"
+    # Repaints between timer ticks usually see identical inputs; reuse the text.
+    status_bar_cache: Dict[str, object] = {'key': None, 'text': ''}
 
     def build_status_bar() -> str:
         try:
@@ -9220,26 +9645,22 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         else:
             mode = "🧭 BROWSE"
         # Minimal, elegant bottom bar with live timers only
-        rows = filtered_rows()
+        t = _current_row()
         now_s = task_s = proj_s = 0
-        active_count = 0
-        try:
-            active_count = len(db.active_task_urls())
-        except Exception:
-            active_count = 0
-        if rows:
-            t = rows[current_index]
+        active_count = len(_frame_active_urls())
+        if t is not None:
             if t.url:
-                now_s = db.task_current_elapsed_seconds(t.url)
-                task_s = db.task_total_seconds(t.url)
+                now_s, task_s = _status_task_seconds(t.url)
             if t.project_title:
-                proj_s = db.project_total_seconds(t.project_title)
-        def _mmss(s:int)->str:
-            s = int(max(0, s)); m, s = divmod(s, 60); return f"{m:02d}:{s:02d}"
-        def _hm(s:int)->str:
-            s = int(max(0, s)); h, r = divmod(s, 3600); m, _ = divmod(r, 60); return f"{h:d}:{m:02d}"
+                proj_s = _frame_project_seconds(t.project_title)
         theme_label = theme_presets[current_theme_index].name if theme_presets else 'Default'
-        base = f" {mode}  ⏱ {_mmss(now_s)}  🧩 {_hm(task_s)}  📦 {_hm(proj_s)}  🟢 {active_count}  🎨 {theme_label}"
+        status_key = (mode, now_s, task_s, proj_s, active_count, theme_label, status_line, total_cols)
+        if status_bar_cache['key'] == status_key:
+            return status_bar_cache['text']
+        base = _STATUS_BAR_TEMPLATE.format(
+            mode=mode, now=_fmt_mmss(now_s), task=_fmt_hm(task_s), proj=_fmt_hm(proj_s),
+            active=active_count, theme=theme_label,
+        )
         message = f"  {status_line}" if status_line else ""
 
         def _clip(text: str, max_width: int) -> str:
@@ -9264,10 +9685,11 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         combined_width = _display_width(combined)
         if target_width > combined_width:
             combined += " " * (target_width - combined_width)
+        status_bar_cache.update(key=status_key, text=combined)
         return combined
 
     from prompt_toolkit.layout.containers import Float, FloatContainer
-    add_control = FormattedTextControl(text=lambda: build_add_overlay())
+    add_control = FormattedTextControl(text=build_add_overlay)
     add_window = Window(width=92, height=Dimension(preferred=26, max=44), content=add_control, wrap_lines=False, always_hide_cursor=True, style="bg:#202020 #ffffff")
     floats = []
     overrun_prompt: Optional[Dict[str, object]] = None
@@ -9304,7 +9726,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         ]
         return "\n".join(lines)
 
-    overrun_control = FormattedTextControl(text=lambda: build_overrun_prompt_text())
+    overrun_control = FormattedTextControl(text=build_overrun_prompt_text)
     overrun_body = Window(
         width=Dimension.exact(62),
         height=Dimension(preferred=11, max=14),
@@ -9554,8 +9976,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             task_edit_state['message'] = 'Use h/j/k/l to move, </> month, t=Today, x=clear, Enter=save, Esc=cancel'
         elif ftype == 'priority':
             options = field.get('options') or []
-            rows = filtered_rows()
-            row = rows[current_index] if rows else None
+            row = _current_row()
             if not options:
                 if not row:
                     task_edit_state['message'] = 'No task selected'
@@ -9564,11 +9985,13 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 return
             task_edit_state['mode'] = 'priority-select'
             task_edit_state['editing'] = {'field_idx': cursor, 'prev_index': field.get('index', 0)}
+            task_edit_state['priority_option_names'] = tuple(
+                (opt.get('name') if isinstance(opt, dict) else None) or '(option)' for opt in options
+            )
             task_edit_state['message'] = 'Use j/k to choose priority (Enter=save, Esc=cancel)'
         elif ftype == 'iteration':
             options = field.get('options') or []
-            rows = filtered_rows()
-            row = rows[current_index] if rows else None
+            row = _current_row()
             if not row:
                 task_edit_state['message'] = 'No task selected'
                 return
@@ -9589,11 +10012,10 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             }
             task_edit_state['message'] = 'Use j/k to choose iteration (Enter=save, Esc=cancel)'
         elif ftype == 'assignees':
-            rows = filtered_rows()
-            if not rows:
+            row = _current_row()
+            if row is None:
                 task_edit_state['message'] = 'No task selected'
                 invalidate(); return
-            row = rows[current_index]
             if not (row.assignee_field_id or '').strip():
                 asyncio.create_task(_ensure_assignee_field(row))
                 return
@@ -9616,11 +10038,10 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 _load_assignee_choices_for_editor(row, set(current))
             )
         elif ftype == 'labels':
-            rows = filtered_rows()
-            if not rows:
+            row = _current_row()
+            if row is None:
                 task_edit_state['message'] = 'No task selected'
                 invalidate(); return
-            row = rows[current_index]
             repo_full = (row.repo or '').strip()
             parts = _parse_issue_url(row.url)
             if (not repo_full) and parts:
@@ -9649,6 +10070,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             task_edit_state['labels_repo'] = repo_full
             task_edit_state['labels_task'] = asyncio.create_task(_load_label_choices_for_editor(repo_full, set(selected)))
             task_edit_state['message'] = f'Loading labels for {repo_full}…'
+            _schedule_label_prefetch(repo_full)
         elif ftype == 'comment':
             task_edit_state['mode'] = 'edit-comment'
             task_edit_state['input'] = ''
@@ -9670,7 +10092,18 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             _build_stats_window('vertical'),
         ])
 
-    root_body = _build_root_body()
+    # Bodies keyed on _stats_window_spec(); theme switches that keep the layout
+    # reuse the existing container tree instead of rebuilding it.
+    root_body_cache: Dict[Tuple[str, int, str], object] = {}
+
+    def _cached_root_body() -> object:
+        key = _stats_window_spec('horizontal' if current_layout_name == 'horizontal' else 'vertical')
+        body = root_body_cache.get(key)
+        if body is None:
+            body = root_body_cache[key] = _build_root_body()
+        return body
+
+    root_body = _cached_root_body()
     root_content = HSplit([top_status_window, root_body, status_window])
     container = FloatContainer(content=root_content, floats=floats)
 
@@ -9680,7 +10113,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             new_content = HSplit([table_window])
             root_body = table_window
         else:
-            new_body = _build_root_body()
+            new_body = _cached_root_body()
             root_body = new_body
             new_content = HSplit([top_status_window, new_body, status_window])
         root_content = new_content
@@ -9729,8 +10162,10 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
     is_quick_add_allowed = Condition(lambda: not (add_mode or edit_sessions_mode or edit_task_mode or overrun_prompt))
 
     def invalidate():
-        table_control.text = lambda: build_table_fragments()  # ensure recalculated
-        stats_control.text = lambda: summarize()
+        nonlocal rows_version
+        rows_version += 1
+        # Both controls call their builders on each render; app.invalidate() already
+        # coalesces bursts of calls into a single redraw.
         if app is not None:
             app.invalidate()
 
@@ -9768,6 +10203,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
     def _reset_timer_caches() -> None:
         nonlocal task_duration_cache
         task_duration_cache = {}
+        timer_frame_cache['active_urls'] = None
+        status_snapshot_cache['key'] = None
         _invalidate_summary_cache()
 
     async def _sync_pending_date(action: PendingAction, loop: asyncio.AbstractEventLoop) -> bool:
@@ -9796,8 +10233,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                     lookup_names.extend(list(END_FIELD_HINTS))
                 for name in lookup_names:
                     lookup = await loop.run_in_executor(
-                        None,
-                        lambda n=name: get_project_field_id_by_name(token, project_id, n),
+                        _GH_EXECUTOR,
+                        functools.partial(get_project_field_id_by_name, token, project_id, name),
                     )
                     if lookup:
                         break
@@ -9816,8 +10253,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 return False
         try:
             updated_field_id = await loop.run_in_executor(
-                None,
-                lambda: set_project_date(token, project_id, item_id, field_id, value, field_name),
+                _GH_EXECUTOR,
+                functools.partial(set_project_date, token, project_id, item_id, field_id, value, field_name),
             )
             if updated_field_id:
                 field_id = updated_field_id
@@ -9866,35 +10303,44 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         start_field_name = (payload.get('start_field_name') or '').strip()
         end_field_name = (payload.get('end_field_name') or '').strip()
         focus_field_name = (payload.get('focus_field_name') or '').strip()
+        user_ids_by_login: Dict[str, str] = {}
+
+        async def _resolve_assignee_ids() -> List[str]:
+            # Issue creation and the People field both need these; look each login up once.
+            pending = [login for login in dict.fromkeys(assignees) if login not in user_ids_by_login]
+            lookups = await asyncio.gather(
+                *(loop.run_in_executor(_GH_EXECUTOR, functools.partial(get_user_node_id, token, login)) for login in pending),
+                return_exceptions=True,
+            )
+            for login, node_id in zip(pending, lookups):
+                if isinstance(node_id, BaseException):
+                    try:
+                        logger.warning("Could not resolve user id for %s: %s", login, node_id)
+                    except Exception:
+                        pass
+                    node_id = ''
+                user_ids_by_login[login] = node_id
+            return list(dict.fromkeys(user_ids_by_login[login] for login in assignees if user_ids_by_login[login]))
+
         try:
             if mode == 'issue':
                 if not repo_id:
                     lookup_source = (payload.get('repo_manual') or repo_source or '').strip()
                     if not lookup_source:
                         raise RuntimeError('Repository metadata unavailable')
-                    repo_lookup = await loop.run_in_executor(None, lambda: get_repo_id(token, lookup_source))
+                    repo_lookup = await loop.run_in_executor(_GH_EXECUTOR, functools.partial(get_repo_id, token, lookup_source))
                     repo_id = repo_lookup.get('repo_id') or ''
                 if not repo_id:
                     raise RuntimeError('Repository metadata unavailable')
-                assignee_node_ids: List[str] = []
-                for login in assignees:
-                    try:
-                        node_id = get_user_node_id(token, login)
-                        if node_id and node_id not in assignee_node_ids:
-                            assignee_node_ids.append(node_id)
-                    except Exception as exc:
-                        try:
-                            logger.warning("Could not resolve user id for %s: %s", login, exc)
-                        except Exception:
-                            pass
-                issue_result = await loop.run_in_executor(None, lambda: create_issue(token, repo_id, title, '', assignee_node_ids))
+                assignee_node_ids = await _resolve_assignee_ids()
+                issue_result = await loop.run_in_executor(_GH_EXECUTOR, functools.partial(create_issue, token, repo_id, title, '', assignee_node_ids))
                 issue_id = issue_result.get('issue_id')
                 issue_url = issue_result.get('url') or ''
                 if not issue_id:
                     raise RuntimeError('Issue creation did not return id')
-                item_id = await loop.run_in_executor(None, lambda: add_project_item(token, project_id, issue_id))
+                item_id = await loop.run_in_executor(_GH_EXECUTOR, functools.partial(add_project_item, token, project_id, issue_id))
             else:
-                item_id = await loop.run_in_executor(None, lambda: create_project_draft(token, project_id, title))
+                item_id = await loop.run_in_executor(_GH_EXECUTOR, functools.partial(create_project_draft, token, project_id, title))
                 if not item_id:
                     raise RuntimeError('GitHub did not return item id')
             start_value_raw = payload.get('start_value')
@@ -9905,8 +10351,9 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             start_field_id = (payload.get('start_field_id') or '').strip()
             if start_field_id:
                 await loop.run_in_executor(
-                    None,
-                    lambda: set_project_date(
+                    _GH_EXECUTOR,
+                    functools.partial(
+                        set_project_date,
                         token,
                         project_id,
                         item_id,
@@ -9919,18 +10366,18 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             if end_value:
                 end_field_id = (payload.get('end_field_id') or '').strip()
                 if not end_field_id:
-                    for candidate in ('end date', 'due date', 'target date', 'finish date'):
-                        try:
-                            fid = await loop.run_in_executor(None, lambda name=candidate: get_project_field_id_by_name(token, project_id, name))
-                        except Exception:
-                            fid = None
-                        if fid:
-                            end_field_id = fid
-                            break
+                    try:
+                        field_ids = await loop.run_in_executor(_GH_EXECUTOR, functools.partial(get_project_field_ids, token, project_id))
+                    except Exception:
+                        field_ids = {}
+                    # One fields query covers every candidate; the first match in order wins.
+                    candidates = ('end date', 'due date', 'target date', 'finish date')
+                    end_field_id = next((field_ids[name] for name in candidates if field_ids.get(name)), '')
                 if end_field_id:
                     await loop.run_in_executor(
-                        None,
-                        lambda: set_project_date(
+                        _GH_EXECUTOR,
+                        functools.partial(
+                            set_project_date,
                             token,
                             project_id,
                             item_id,
@@ -9944,13 +10391,14 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 focus_field_id = (payload.get('focus_field_id') or '').strip()
                 if not focus_field_id:
                     try:
-                        focus_field_id = await loop.run_in_executor(None, lambda: get_project_field_id_by_name(token, project_id, 'focus day'))
+                        focus_field_id = await loop.run_in_executor(_GH_EXECUTOR, functools.partial(get_project_field_id_by_name, token, project_id, FOCUS_DAY_FIELD_NAME))
                     except Exception:
                         focus_field_id = ''
                 if focus_field_id:
                     await loop.run_in_executor(
-                        None,
-                        lambda: set_project_date(
+                        _GH_EXECUTOR,
+                        functools.partial(
+                            set_project_date,
                             token,
                             project_id,
                             item_id,
@@ -9977,14 +10425,14 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 fetched_status_opts: List[Dict[str, object]] = []
                 if not status_option_id:
                     try:
-                        fetched_status_opts = await loop.run_in_executor(None, lambda: get_project_field_options(token, status_field_id))
+                        fetched_status_opts = await loop.run_in_executor(_GH_EXECUTOR, functools.partial(get_project_field_options, token, status_field_id))
                     except Exception:
                         fetched_status_opts = []
                     if fetched_status_opts:
                         status_option_id, status_label = _select_status_option(fetched_status_opts, status_label or 'Todo')
                 if status_option_id:
                     try:
-                        await loop.run_in_executor(None, lambda: set_project_status(token, project_id, item_id, status_field_id, status_option_id))
+                        await loop.run_in_executor(_GH_EXECUTOR, functools.partial(set_project_status, token, project_id, item_id, status_field_id, status_option_id))
                     except Exception as exc:
                         try:
                             logger.warning("Unable to set status for %s: %s", title, exc)
@@ -9993,52 +10441,25 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             iteration_id = (payload.get('iteration_id') or '').strip()
             iteration_field_id = (payload.get('iteration_field_id') or '').strip()
             if iteration_id and iteration_field_id:
-                await loop.run_in_executor(None, lambda: set_project_iteration(token, project_id, item_id, iteration_field_id, iteration_id))
+                await loop.run_in_executor(_GH_EXECUTOR, functools.partial(set_project_iteration, token, project_id, item_id, iteration_field_id, iteration_id))
             priority_field_id = (payload.get('priority_field_id') or '').strip()
             priority_label = (payload.get('priority_label') or '').strip()
             priority_opts = payload.get('priority_options') or []
             if priority_field_id and priority_label:
                 if not priority_opts:
                     try:
-                        priority_opts = await loop.run_in_executor(None, lambda: get_project_field_options(token, priority_field_id))
+                        priority_opts = await loop.run_in_executor(_GH_EXECUTOR, functools.partial(get_project_field_options, token, priority_field_id))
                     except Exception:
                         priority_opts = []
-                def _match_priority_option(label: str, options: List[Dict[str, object]]) -> str:
-                    if not label:
-                        return ''
-                    norm = label.strip().lower()
-                    core = norm.split(':', 1)[-1].strip() if ':' in norm else norm
-                    for opt in options:
-                        name = (opt.get('name') or '').strip()
-                        if not name:
-                            continue
-                        low = name.lower()
-                        if low == norm or low == core:
-                            return opt.get('id') or ''
-                    for opt in options:
-                        name_low = (opt.get('name') or '').strip().lower()
-                        if core and core in name_low:
-                            return opt.get('id') or ''
-                    return ''
                 priority_option_id = _match_priority_option(priority_label, priority_opts)
                 if priority_option_id:
-                    await loop.run_in_executor(None, lambda: set_project_priority(token, project_id, item_id, priority_field_id, priority_option_id))
+                    await loop.run_in_executor(_GH_EXECUTOR, functools.partial(set_project_priority, token, project_id, item_id, priority_field_id, priority_option_id))
             assignee_field_id = (payload.get('assignee_field_id') or '').strip()
             if assignee_field_id and assignees:
-                project_user_ids: List[str] = []
-                for login in assignees:
-                    try:
-                        uid = get_user_node_id(token, login)
-                        if uid and uid not in project_user_ids:
-                            project_user_ids.append(uid)
-                    except Exception as exc:
-                        try:
-                            logger.warning("Could not resolve user id for %s: %s", login, exc)
-                        except Exception:
-                            pass
+                project_user_ids = await _resolve_assignee_ids()
                 if project_user_ids:
                     try:
-                        await loop.run_in_executor(None, lambda: set_project_users(token, project_id, item_id, assignee_field_id, project_user_ids))
+                        await loop.run_in_executor(_GH_EXECUTOR, functools.partial(set_project_users, token, project_id, item_id, assignee_field_id, project_user_ids))
                     except Exception as exc:
                         try:
                             logger.warning("Unable to set project users for %s: %s", assignee_field_id, exc)
@@ -10047,7 +10468,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             labels = payload.get('labels') or []
             if mode == 'issue' and labels:
                 try:
-                    await loop.run_in_executor(None, lambda: set_issue_labels(token, issue_url, labels))
+                    await loop.run_in_executor(_GH_EXECUTOR, functools.partial(set_issue_labels, token, issue_url, labels))
                 except Exception as exc:
                     try:
                         logger.warning("Unable to set labels for %s: %s", issue_url, exc)
@@ -10055,7 +10476,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                         pass
             if mode == 'issue' and assignees:
                 try:
-                    await loop.run_in_executor(None, lambda: set_issue_assignees(token, issue_url, assignees))
+                    await loop.run_in_executor(_GH_EXECUTOR, functools.partial(set_issue_assignees, token, issue_url, assignees))
                 except Exception as exc:
                     try:
                         logger.warning("Unable to set assignees for %s: %s", issue_url, exc)
@@ -10064,7 +10485,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             comment_body = (payload.get('comment') or '').strip()
             if mode == 'issue' and comment_body:
                 try:
-                    await loop.run_in_executor(None, lambda: add_issue_comment(token, issue_url, comment_body))
+                    await loop.run_in_executor(_GH_EXECUTOR, functools.partial(add_issue_comment, token, issue_url, comment_body))
                 except Exception as exc:
                     try:
                         logger.warning("Unable to add comment for %s: %s", issue_url, exc)
@@ -10098,7 +10519,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         try:
             dirty_rows = [
                 row for row in db.load(today_only=False)
-                if getattr(row, 'status_dirty', 0)
+                if row.status_dirty
                 and not (row.url or '').startswith(PENDING_URL_PREFIX)
             ]
         except Exception:
@@ -10151,8 +10572,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 return False
             try:
                 await loop.run_in_executor(
-                    None,
-                    lambda r=row, fid=status_field_id, oid=option_id: set_project_status(token, r.project_id, r.item_id, fid, oid),
+                    _GH_EXECUTOR,
+                    functools.partial(set_project_status, token, row.project_id, row.item_id, status_field_id, option_id),
                 )
             except Exception as exc:
                 status_line = f"Status sync failed: {exc}"
@@ -10218,7 +10639,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 if not option_id:
                     continue
                 try:
-                    await loop.run_in_executor(None, lambda r=row, oid=option_id: set_project_status(token, r.project_id, r.item_id, r.status_field_id, oid))
+                    await loop.run_in_executor(_GH_EXECUTOR, functools.partial(set_project_status, token, row.project_id, row.item_id, row.status_field_id, option_id))
                 except Exception as exc:
                     try:
                         logger.warning("Default status sync failed for %s: %s", row.title or row.url, exc)
@@ -10319,6 +10740,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 except Exception:
                     pass
                 db.replace_all(rows)
+                # A full fetch may follow a project schema change; re-resolve field ids lazily.
+                PROJECT_FIELD_ID_CACHE.clear()
                 _reconcile_synced_pending_creates(rows)
                 replaced_cache = True
             try:
@@ -10358,6 +10781,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                     logger.info("Update finished successfully. Cached rows: %d", len(all_rows))
                 except Exception:
                     pass
+                _schedule_priority_prefetch()
         except Exception as e:
             status_line = f"Error: {e}"
             try:
@@ -10427,24 +10851,6 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             project_choice['status_options'] = status_options_clean
         status_option_id, status_label = _select_status_option(status_options_clean, 'Todo')
 
-        def _match_priority_option(label: str, options: List[Dict[str, object]]) -> str:
-            if not label:
-                return ''
-            norm = label.strip().lower()
-            core = norm.split(':', 1)[-1].strip() if ':' in norm else norm
-            for opt in options:
-                name = (opt.get('name') or '').strip()
-                if not name:
-                    continue
-                low = name.lower()
-                if low == norm or low == core:
-                    return opt.get('id') or ''
-            for opt in options:
-                name_low = (opt.get('name') or '').strip().lower()
-                if core and core in name_low:
-                    return opt.get('id') or ''
-            return ''
-
         priority_option_id = _match_priority_option(priority_label, priority_opts)
         placeholder_url = f"{PENDING_URL_PREFIX}{uuid.uuid4().hex}"
         start_date_val = start_val.strip() or dt.date.today().isoformat()
@@ -10998,10 +11404,9 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         asyncio.create_task(_update_task_date('focus', today_focus))
 
     def _focus_shift(days: int) -> None:
-        rows = filtered_rows()
-        if not rows:
+        row = _current_row()
+        if row is None:
             return
-        row = rows[current_index]
         try:
             current = dt.date.fromisoformat(row.focus_date or row.start_date or '')
         except Exception:
@@ -11889,12 +12294,7 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
         if not ch or (ch not in '0123456789-' and ch.lower() != 't'):
             return
         step = add_state.get('step')
-        field_map = {
-            'start': ('start_date', 'start_cursor'),
-            'end': ('end_date', 'end_cursor'),
-            'focus': ('focus_date', 'focus_cursor'),
-        }
-        field_key, cursor_key = field_map.get(step, ('start_date', 'start_cursor'))
+        field_key, cursor_key = _ADD_DATE_FIELD_MAP.get(step, ('start_date', 'start_cursor'))
         date_val = add_state.get(field_key, '')
         cur = max(0, min(len(date_val), add_state.get(cursor_key, len(date_val))))
         if ch.lower() == 't':
@@ -11965,8 +12365,6 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             idx = max(0, min(len(choices)-1, add_state.get('label_index', 0)))
             label = choices[idx]
             selected = add_state.get('labels_selected') or set()
-            if not isinstance(selected, set):
-                selected = set(selected)
             if label in selected:
                 selected.remove(label)
             else:
@@ -11990,8 +12388,6 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             if not login:
                 return
             selected = add_state.get('assignees_selected') or set()
-            if not isinstance(selected, set):
-                selected = set(selected)
             if login in selected:
                 selected.remove(login)
             else:
@@ -12220,8 +12616,6 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 status_line = 'No labels available yet'
                 invalidate(); return
             selected = add_state.get('labels_selected') or set()
-            if not isinstance(selected, set):
-                selected = set(selected)
             if not selected:
                 status_line = 'Select at least one label (space to toggle)'
                 invalidate(); return
@@ -12251,8 +12645,6 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                 status_line = 'No assignable users found'
                 invalidate(); return
             selected = add_state.get('assignees_selected') or set()
-            if not isinstance(selected, set):
-                selected = set(selected)
             if not selected:
                 status_line = 'Select at least one assignee'
                 invalidate(); return
@@ -12300,14 +12692,10 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
                         status_line = 'Repository is required'
                         invalidate(); return
             labels_selected = add_state.get('labels_selected') or set()
-            if not isinstance(labels_selected, set):
-                labels_selected = set(labels_selected)
             label_choices = add_state.get('label_choices') or []
             ordered_labels = [name for name in label_choices if name in labels_selected]
             priority_label = (add_state.get('priority_label') or '').strip()
             assignees_selected = add_state.get('assignees_selected') or set()
-            if not isinstance(assignees_selected, set):
-                assignees_selected = set(assignees_selected)
             assignees_ordered: List[str] = []
             for entry in add_state.get('assignee_choices') or []:
                 login = (entry.get('login') or '').strip()
@@ -12524,10 +12912,9 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
     @kb.add('w', filter=is_normal)
     def _(event):
         nonlocal status_line
-        rows = filtered_rows()
-        if not rows:
+        t = _current_row()
+        if t is None:
             return
-        t = rows[current_index]
         if not t.url:
             return
         # Toggle: if running -> stop, else start
@@ -12604,11 +12991,6 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             out_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f'report-{ts}.pdf')
             # Use the same portrait renderer as CLI export
             # Implemented within CLI block; re-implement minimal version here for consistency
-            def fmt_hm(s:int)->str:
-                s = int(max(0, s))
-                h, r = divmod(s, 3600)
-                m, _ = divmod(r, 60)
-                return f"{h:d}:{m:02d}"
             def draw_header(c):
                 generated = dt.datetime.now().strftime('%Y-%m-%d %H:%M')
                 c.setFillColor(colors.HexColor('#111111'))
@@ -12674,14 +13056,14 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             proj_rows_all = []
             for name in proj_names:
                 d = proj_totals['D'].get(name,0); wv = proj_totals['W'].get(name,0); m = proj_totals['M'].get(name,0); yv = proj_totals['Y'].get(name,0)
-                proj_rows_all.append((name or '-', yv, [name or '-', fmt_hm(d), fmt_hm(wv), fmt_hm(m), fmt_hm(yv)]))
+                proj_rows_all.append((name or '-', yv, [name or '-', _fmt_hm(d), _fmt_hm(wv), _fmt_hm(m), _fmt_hm(yv)]))
             proj_rows_all.sort(key=lambda t: t[1], reverse=True)
             task_urls = set().union(*[set(d.keys()) for d in task_totals.values()])
             task_rows_all = []
             for url in task_urls:
                 nm = task_titles.get(url, url)
                 d = task_totals['D'].get(url,0); wv = task_totals['W'].get(url,0); m = task_totals['M'].get(url,0); yv = task_totals['Y'].get(url,0)
-                task_rows_all.append((nm, yv, [nm[:48] + ('…' if len(nm)>48 else ''), fmt_hm(d), fmt_hm(wv), fmt_hm(m), fmt_hm(yv)]))
+                task_rows_all.append((nm, yv, [nm[:48] + ('…' if len(nm)>48 else ''), _fmt_hm(d), _fmt_hm(wv), _fmt_hm(m), _fmt_hm(yv)]))
             task_rows_all.sort(key=lambda t: t[1], reverse=True)
             c = canvas.Canvas(out_path, pagesize=A4)
             draw_header(c)
@@ -12886,8 +13268,53 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
     app = Application(layout=Layout(container), key_bindings=kb, full_screen=True, mouse_support=True, style=style, editing_mode=EditingMode.VI)
     apply_theme(current_theme_index, announce=False)
 
+    def _missing_priority_field_ids() -> List[str]:
+        return list(dict.fromkeys(
+            r.priority_field_id for r in all_rows if r.priority_field_id and not _priority_options(r)
+        ))
+
+    async def _prefetch_priority_options(field_ids: List[str]) -> None:
+        nonlocal all_rows
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(_GH_EXECUTOR, functools.partial(get_project_field_options, token, fid)) for fid in field_ids),
+            return_exceptions=True,
+        )
+        updated = False
+        for fid, opts in zip(field_ids, results):
+            if isinstance(opts, BaseException):
+                try:
+                    logger.warning("Unable to fetch priority options for %s: %s", fid, opts)
+                except Exception:
+                    pass
+                continue
+            if opts:
+                try:
+                    db.update_priority_options_by_field(fid, opts)
+                except Exception:
+                    continue
+                updated = True
+        if updated:
+            all_rows = load_all()
+            invalidate()
+
+    def _schedule_priority_prefetch() -> None:
+        """Fetch missing priority option sets for all cached rows in one concurrent batch."""
+        if not token:
+            return
+        field_ids = _missing_priority_field_ids()
+        if not field_ids:
+            return
+        _spawn_background(_prefetch_priority_options(field_ids))
+
+    def _redraw() -> None:
+        # Repaint only: nothing in the rows changed, so keep rows_version (and the
+        # filtered/table caches keyed on it) as they are.
+        if app is not None:
+            app.invalidate()
+
     # Background ticker to refresh timers & status once per second
-    async def _ticker(update_search_status=update_search_status, invalidate_fn=invalidate):
+    async def _ticker(update_search_status=update_search_status, invalidate_fn=_redraw):
         while True:
             try:
                 await asyncio.sleep(1)
@@ -12923,7 +13350,8 @@ def run_ui(db: TaskDB, cfg: Config, token: Optional[str], state_path: Optional[s
             ticker_coro = None
 
     try:
-        app.run()
+        # pre_run fires once the event loop is up, so the startup prefetch can be scheduled.
+        app.run(pre_run=_schedule_priority_prefetch)
     finally:
         _drain_background_tasks(app)
     return
@@ -13163,12 +13591,6 @@ def main() -> None:
             print("ReportLab not installed. Try: pip install reportlab", file=sys.stderr)
             sys.exit(2)
 
-        def fmt_hm(s:int)->str:
-            s = int(max(0, s))
-            h, r = divmod(s, 3600)
-            m, _ = divmod(r, 60)
-            return f"{h:d}:{m:02d}"
-
         def draw_header(c):
             meta = payload.get('meta',{})
             user = meta.get('user','')
@@ -13258,7 +13680,7 @@ def main() -> None:
             w = proj_totals['W'].get(name,0)
             m = proj_totals['M'].get(name,0)
             y = proj_totals['Y'].get(name,0)
-            proj_rows_all.append((name or '-', y, [name or '-', fmt_hm(d), fmt_hm(w), fmt_hm(m), fmt_hm(y)]))
+            proj_rows_all.append((name or '-', y, [name or '-', _fmt_hm(d), _fmt_hm(w), _fmt_hm(m), _fmt_hm(y)]))
         proj_rows_all.sort(key=lambda t: t[1], reverse=True)
 
         # Build task rows sorted by yearly desc
@@ -13272,7 +13694,7 @@ def main() -> None:
             w = task_totals['W'].get(url,0)
             m = task_totals['M'].get(url,0)
             y = task_totals['Y'].get(url,0)
-            task_rows_all.append((name, y, [name and (name[:48]+('…' if len(name)>48 else '')) or '-', fmt_hm(d), fmt_hm(w), fmt_hm(m), fmt_hm(y)]))
+            task_rows_all.append((name, y, [name and (name[:48]+('…' if len(name)>48 else '')) or '-', _fmt_hm(d), _fmt_hm(w), _fmt_hm(m), _fmt_hm(y)]))
         task_rows_all.sort(key=lambda t: t[1], reverse=True)
 
         # Compose page
@@ -29,7 +29,9 @@ def _install_prompt_toolkit_stub() -> None:
         def invalidate(self):
             self.invalidate_calls += 1
 
-        def run(self):
+        def run(self, pre_run=None):
+            if pre_run is not None:
+                pre_run()
             return None
 
         def create_background_task(self, coro):
@@ -327,3 +327,50 @@ def test_fetch_tasks_github_skips_malformed_nodes(monkeypatch):
 
     assert len(result.rows) == 2
     assert all(row.start_field in {'(no date)', 'Start date'} for row in result.rows)
+
+
+def test_project_field_id_lookup_caches_per_project(monkeypatch):
+    calls = []
+
+    def fake_graphql(_session, _query, variables, on_wait=None):
+        calls.append(variables['id'])
+        fields = [{'id': 'due-1', 'name': 'Due Date'}, {'id': 'focus-1', 'name': ' Focus Day '}]
+        return {'data': {'node': {'fields': {'nodes': fields}}}}
+
+    _patch_common(monkeypatch, fake_graphql)
+    monkeypatch.setattr(ght, 'PROJECT_FIELD_ID_CACHE', {})
+
+    assert ght.get_project_field_id_by_name('token', 'proj-1', 'due date') == 'due-1'
+    assert ght.get_project_field_id_by_name('token', 'proj-1', 'Focus Day') == 'focus-1'
+    assert ght.get_project_field_id_by_name('token', 'proj-1', 'end date') is None
+    assert ght.get_project_field_ids('token', 'proj-1') == {'due date': 'due-1', 'focus day': 'focus-1'}
+    assert calls == ['proj-1']
+
+    ght.PROJECT_FIELD_ID_CACHE.clear()
+    assert ght.get_project_field_id_by_name('token', 'proj-1', 'due date') == 'due-1'
+    assert calls == ['proj-1', 'proj-1']
+
+
+def test_set_project_date_refetches_field_ids_after_missing_field_error(monkeypatch):
+    field_id = {'current': 'due-old'}
+    calls = []
+
+    def fake_graphql(_session, query, variables, on_wait=None):
+        if query is ght.GQL_PROJECT_FIELDS:
+            calls.append('fields')
+            return {'data': {'node': {'fields': {'nodes': [{'id': field_id['current'], 'name': 'Due Date'}]}}}}
+        calls.append(('set', variables['fieldId']))
+        if variables['fieldId'] != field_id['current']:
+            return {'errors': [{'message': 'The field does not exist in the project'}]}
+        return {'data': {}}
+
+    _patch_common(monkeypatch, fake_graphql)
+    monkeypatch.setattr(ght, 'PROJECT_FIELD_ID_CACHE', {})
+
+    assert ght.get_project_field_id_by_name('token', 'proj-1', 'due date') == 'due-old'
+    field_id['current'] = 'due-new'  # field recreated on GitHub
+    result = ght.set_project_date('token', 'proj-1', 'item-1', 'due-old', '2024-01-10', 'Due Date')
+
+    assert result == 'due-new'
+    assert calls == ['fields', ('set', 'due-old'), 'fields', ('set', 'due-new')]
+    assert ght.PROJECT_FIELD_ID_CACHE['proj-1'] == {'due date': 'due-new'}
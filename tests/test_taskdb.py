@@ -220,3 +220,22 @@ def test_taskdb_update_helpers_handle_invalid_payloads():
         assert other_value == other_options
     finally:
         db.conn.close()
+
+
+def test_replace_all_streams_generator_rows():
+    db = ght.TaskDB(':memory:')
+    try:
+        db.upsert_many([make_task_row(title='Stale', url='https://example.com/tasks/old')])
+        fresh = (
+            make_task_row(title=f'Task {idx}', url=f'https://example.com/tasks/{idx}')
+            for idx in range(3)
+        )
+        db.replace_all(fresh)
+        titles = sorted(row[0] for row in db.conn.execute("SELECT title FROM tasks"))
+        assert titles == ['Task 0', 'Task 1', 'Task 2']
+
+        db.replace_all(iter(()))
+        assert db.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 0
+    finally:
+        db.conn.close()
+
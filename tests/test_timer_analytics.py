@@ -134,3 +134,35 @@ def test_aggregate_functions_with_running_sessions(analytics_db):
 
     all_day = analytics_db.aggregate_period_totals('day', since_days=7)
     assert all_day['2024-01-07'] == 3600
+
+
+def test_aggregate_period_totals_multi_matches_single_scopes(analytics_db):
+    scopes = [
+        ('day', 2, None, None),
+        ('week', 7, 'Project Beta', None),
+        ('month', 30, None, 'task1'),
+        ('day', None, 'Project Alpha', 'task2'),  # task filter wins, as in the single call
+    ]
+    expected = [
+        analytics_db.aggregate_period_totals(gran, since_days=days, project_title=proj, task_url=url)
+        for gran, days, proj, url in scopes
+    ]
+    assert analytics_db.aggregate_period_totals_multi(scopes) == expected
+    assert analytics_db.aggregate_period_totals_multi([]) == []
+
+
+def test_sessions_version_bumps_on_session_writes(fixed_now):
+    db = ght.TaskDB(':memory:')
+    try:
+        assert db.sessions_version == 0
+        db.start_session('task1', 'Project Alpha')
+        db.start_session('task1', 'Project Alpha')  # already open: no write
+        assert db.sessions_version == 1
+        db.stop_session('task1', 'Project Alpha')
+        assert db.sessions_version == 2
+        session_id = db.get_sessions_for_task('task1')[0]['id']
+        db.update_session_times(session_id, ended_at=_iso(2024, 1, 10, 13))
+        db.delete_session(session_id)
+        assert db.sessions_version == 4
+    finally:
+        db.conn.close()
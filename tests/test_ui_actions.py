@@ -713,7 +713,18 @@ def test_label_editor_fetch_cancel_and_error(monkeypatch, temp_db_path, tmp_path
     assert fields[label_idx]["value"] == ["Existing"]
     assert len(fetch_calls) == 1
 
-    # Error path
+    # Reopening within the cache TTL reuses the fetched labels
+    task_state["cursor"] = label_idx
+    enter_handler(SimpleNamespace())
+    asyncio.run(scheduled_tasks.pop())
+    assert len(fetch_calls) == 1
+    assert task_state["label_choices"] == ["Bug", "Chore", "Existing"]
+    cancel_edit("Back to list")
+
+    # Error path (cache expired)
+    start_edit = enter_cells["_start_task_field_edit"].cell_contents
+    prefetch = _closure_cells(start_edit)["_schedule_label_prefetch"].cell_contents
+    _closure_cells(prefetch)["repo_metadata_cache"].cell_contents.clear()
     task_state["cursor"] = label_idx
     enter_handler(SimpleNamespace())
     assert scheduled_tasks, "failing label load should schedule background task"
@@ -1586,3 +1597,51 @@ def test_escape_handler_clears_modes(monkeypatch, temp_db_path, tmp_path, ui_con
     assert status_line_cell.cell_contents == 'Timer editor closed'
 
     db.conn.close()
+
+
+def test_priority_prefetch_is_scheduled_once_the_app_runs(monkeypatch, temp_db_path, tmp_path, ui_config):
+    from prompt_toolkit import Application
+
+    db = ght.TaskDB(str(temp_db_path))
+    row = _make_task_row(priority_field_id="prio-field", priority_options="[]")
+    db.upsert_many([row])
+
+    # Like prompt_toolkit, refuse background tasks until run() has an event loop.
+    running = {"on": False}
+    original_run = Application.run
+    original_create = Application.create_background_task
+
+    def run(self, pre_run=None):
+        running["on"] = True
+        try:
+            return original_run(self, pre_run=pre_run)
+        finally:
+            running["on"] = False
+
+    def create_background_task(self, coro):
+        if not running["on"]:
+            raise RuntimeError("no running event loop")
+        return original_create(self, coro)
+
+    monkeypatch.setattr(Application, "run", run)
+    monkeypatch.setattr(Application, "create_background_task", create_background_task)
+    fetch_calls = []
+
+    def fake_field_options(token, field_id):
+        fetch_calls.append(field_id)
+        return [{"id": "prio-high", "name": "High"}]
+
+    monkeypatch.setattr(ght, "get_project_field_options", fake_field_options)
+
+    harness = _build_ui(db, ui_config, token="token", state_path=str(tmp_path / "state.json"))
+
+    prefetch = [
+        coro for coro in harness.app.background_tasks
+        if getattr(getattr(coro, "cr_code", None), "co_name", "") == "_prefetch_priority_options"
+    ]
+    assert len(prefetch) == 1
+    asyncio.run(prefetch[0])
+    assert fetch_calls == ["prio-field"]
+    assert json.loads(db.load()[0].priority_options) == [{"id": "prio-high", "name": "High"}]
+
+    db.conn.close()
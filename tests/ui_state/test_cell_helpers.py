@@ -1,4 +1,5 @@
 import datetime as dt
+import re
 
 import gh_task_viewer as ght
 
@@ -30,6 +31,9 @@ def test_cell_helpers_handle_unicode():
     assert ght.color_for_date('2024-01-12', today) == 'ansigreen'
     assert ght.color_for_date('invalid', today) == 'ansigray'
     assert ght.color_for_date(None, today) == 'ansigray'
+    assert ght.color_for_date('2024-02-30', '2024-01-10') == 'ansigray'
+    assert ght.color_for_date('2024-01-09', '2024-01-10') == 'ansiyellow'
+    assert ght.color_for_date('2024-01-09', 'not-a-date', {'unknown': 'grey'}) == 'grey'
 
     primary = make_task(title='Today Focus', focus_date='2024-01-10')
     double_width = make_task(
@@ -57,3 +61,151 @@ def test_cell_helpers_handle_unicode():
     header_text = ''.join(text for style, text in fragments if style == 'bold')
     assert '## Project Alpha' in header_text
     assert '## Project Beta' in header_text
+
+
+def test_build_fragments_renders_only_requested_window():
+    today = dt.date(2024, 1, 10)
+    alpha = [make_task(title=f'Alpha {idx}', url=f'https://x/{idx}') for idx in range(3)]
+    beta = [make_task(project_title='Project Beta', title=f'Beta {idx}', url=f'https://y/{idx}') for idx in range(3)]
+    tasks = alpha + beta
+
+    fragments = ght.build_fragments(tasks, today, start=2, end=4)
+    body = ''.join(text for _, text in fragments)
+    assert 'Alpha 2' in body and 'Beta 0' in body
+    assert 'Alpha 1' not in body and 'Beta 1' not in body
+    # The Alpha group started above the window but still gets its header.
+    assert '## Project Alpha' in body
+    assert '## Project Beta' in body
+
+    tail = ''.join(text for _, text in ght.build_fragments(tasks, today, start=4))
+    assert '## Project Alpha' not in tail
+    assert 'Beta 1' in tail and 'Beta 2' in tail
+
+
+def test_priority_rank_uses_option_order_then_conventional_names():
+    options = '[{"id": "p0", "name": "P0"}, {"id": "p1", "name": "P1"}, "junk"]'
+    assert ght._parse_priority_options(options) == ({'id': 'p0', 'name': 'P0'}, {'id': 'p1', 'name': 'P1'})
+    assert ght._priority_rank_for(options, 'p1', '') == 1
+    assert ght._priority_rank_for(options, '', ' p0 ') == 0
+    assert ght._priority_rank_for(options, 'gone', 'Other') == 2
+    assert ght._priority_rank_for('[]', '', 'Medium') == 1
+    assert ght._priority_rank_for('not json', '', '') == 99
+    assert ght._parse_task_labels('["bug", "", 3, "ui"]') == ('bug', 'ui')
+
+
+def test_task_search_blob_keeps_fields_separate():
+    blob = ght._task_search_blob('Fix Login', 'acme/Web', 'High', 'Todo', 'Alpha')
+    assert 'fix login' in blob and 'acme/web' in blob and 'alpha' in blob
+    # Matches never span two fields.
+    assert 'loginacme' not in blob and 'login acme' not in blob
+
+
+def test_dedup_casefold_keeps_first_spelling_and_order():
+    assert ght._dedup_casefold(['Bug', '', 'feature', 'BUG', 'Straße', 'STRASSE']) == ['Bug', 'feature', 'Straße']
+
+
+def test_shift_months_clamps_day_and_crosses_years():
+    assert ght._shift_months(dt.date(2024, 1, 31), 1) == dt.date(2024, 2, 29)
+    assert ght._shift_months(dt.date(2024, 1, 15), -1) == dt.date(2023, 12, 15)
+    assert ght._shift_months(dt.date(2023, 11, 30), 15) == dt.date(2025, 2, 28)
+
+
+def test_status_style_name_classifies_by_keyword():
+    assert ght._status_style_name('  On Hold ') == 'table.status.blocked'
+    assert ght._status_style_name('In Progress') == 'table.status.in_progress'
+    assert ght._status_style_name('Waiting for review') == ght.STATUS_WAITING_CLASS
+    assert ght._status_style_name('Shipped') == 'table.status.done'
+    assert ght._status_style_name('Backlog') == 'table.status.todo'
+    assert ght._status_style_name('Done (blocked upstream)') == 'table.status.blocked'
+    assert ght._status_style_name('Triage') == ''
+    assert ght._status_style_name(None) == ''
+
+
+def test_duration_formatters():
+    assert ght._fmt_hm(3 * 3600 + 5 * 60 + 59) == '3:05'
+    assert ght._fmt_mmss(75 * 60 + 3) == '75:03'
+    assert ght._fmt_hms(59) == '00:59'
+    assert ght._fmt_hms(3600 + 61) == '1:01:01'
+    assert ght._fmt_hms(-5) == '00:00'
+    assert ght._time_cell_text(61, 0) == '01:01|0:00'
+    assert ght._time_cell_text(0, 2 * 3600 + 30 * 60) == '00:00|2:30'
+    assert ght._TIME_TEXT_IDLE == ght._time_cell_text(0, 0)
+
+
+def test_merge_style_runs_joins_adjacent_fragments():
+    segments = [('a', 'x'), ('a', 'y'), ('b', ''), ('b', 'z'), ('a', 'w'), ('a', '')]
+    assert ght._merge_style_runs(segments) == [('a', 'xy'), ('b', 'z'), ('a', 'w')]
+    assert ght._merge_style_runs([]) == []
+
+
+def test_table_cell_text_helpers():
+    assert ght._labels_cell_text('["bug", "ui"]') == 'bug, ui'
+    assert ght._labels_cell_text('[]') == '-'
+    assert ght._labels_cell_text('["bug", "ui"]', '—') == 'bug, ui'
+    assert ght._labels_cell_text('not json', '—') == '—'
+    assert ght._assignees_cell_text('["octo", "@cat"]') == '@octo, @cat'
+    assert ght._assignees_cell_text('["a", "b", "c", "d"]') == '@a, @b, @c, …'
+    assert ght._assignees_cell_text('{"not": "a list"}') == '-'
+    assert ght._assignees_detail_text('["octo", "@Octo", "cat", "dog"]') == '@octo, @cat, @dog'
+    assert ght._assignees_detail_text('["a", "b", "c", "d"]') == '@a, @b, @c, …'
+    assert ght._assignees_detail_text('[]') == '—'
+    assert ght._dirty_cell_text('High', True) == 'High*'
+    assert ght._dirty_cell_text('', False) == '-'
+
+
+def test_table_row_segments_trim_and_highlight():
+    specs = [('focus', 4), ('status', 4), ('title', 6)]
+    cells = {'focus': 'Mon ', 'status': 'Todo', 'title': 'Fix it'}
+    segments = ght._table_row_segments('  ', cells, specs, 'row', 'st')
+    assert ''.join(text for _, text in segments) == '  Mon   Todo  Fix it'
+    assert ('st', 'Todo') in segments
+    # Missing cells fall back to a padded dash.
+    assert ('row', '-   ') in ght._table_row_segments('  ', {}, specs[:1], 'row', 'st')
+
+    trimmed = ght._trim_segments(segments, 5)
+    assert ''.join(text for _, text in trimmed) == '  Mon   Todo  Fix it'[5:]
+    assert ght._trim_segments(segments, 99) == []
+
+    pattern = re.compile(re.escape('fix'), re.IGNORECASE)
+    highlighted = ght._highlight_segments(segments, pattern)
+    assert ('row underline', 'Fix') in highlighted
+    assert ''.join(text for _, text in highlighted) == '  Mon   Todo  Fix it'
+    assert ght._highlight_segments(segments, re.compile('zzz')) is segments
+
+
+def test_calendar_week_lines_mark_cursor_and_other_months():
+    lines = ght._calendar_week_lines(dt.date(2024, 2, 14))
+    assert len(lines) == 5
+    assert lines[0].startswith('(29)(30)(31)')
+    assert '[14]' in lines[2] and '[' not in lines[1]
+    assert lines[-1].endswith(' 29 ( 1)( 2)( 3)')
+    assert ght._calendar_week_lines(dt.date(2024, 2, 14)) is lines
+
+
+def test_report_bar_lines_scale_to_largest_value():
+    lines = ght._report_bar_lines([('2024-01-02', 3600), ('2024-01-01', 60)])
+    assert lines[0] == '  2024-01-02    1:00:00  ' + '█' * 30
+    assert lines[1] == '  2024-01-01      01:00  █'
+    assert ght._report_bar_lines([('Alpha', 0)], 6) == ['  Alpha       00:00  █']
+    assert ght._report_bar_lines([]) == ['  (no data)']
+    assert ght._BARS[30] == '█' * 30 and ght._BARS[0] == ''
+    assert ght._meter_bar(2, 5) == '██░░░'
+
+
+def test_edit_field_renderers_by_type():
+    render = ght._EDIT_FIELD_RENDERERS
+    dirty = make_task(priority='Low', priority_dirty=1)
+    assert render['priority']({'options': [{'name': 'High'}], 'index': 3}, dirty) == ('High*', ())
+    assert render['priority']({'options': [], 'field_available': True}, None) == ('(load options)', ())
+    assert render['labels']({'value': ['bug', 'ui']}, None) == ('bug, ui', ())
+    assert render['iteration']({'options': [{'title': 'S1', 'startDate': '2024-01-08'}]}, None) == ('S1 (2024-01-08)', ())
+    assert render['comment-history']({'value': ['a', 'b', 'c']}, None) == ('a', ('b', 'c'))
+    assert ght._edit_field_default({'value': '2024-01-10'}, None) == ('2024-01-10', ())
+
+
+def test_join_styled_lines_coalesces_runs():
+    styles = ['h', 'm', 'm', '', 'f', '']
+    texts = ['Head', 'a', 'b', '', 'x', '']
+    assert ght._join_styled_lines(styles, texts) == [('h', 'Head\n'), ('m', 'a\nb\n'), ('', '\n'), ('f', 'x\n')]
+    assert ght._join_styled_lines(['m', 'm'], ['a', 'b']) == [('m', 'a\nb')]
+    assert ght._join_styled_lines([], []) == []
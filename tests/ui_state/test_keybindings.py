@@ -3,7 +3,9 @@ import inspect
 from prompt_toolkit.keys import Keys
 from prompt_toolkit.layout.dimension import Dimension as _Dimension
 
-from .helpers import closure_map, closure_value, dummy_event, ticker_update
+import gh_task_viewer as ght
+
+from .helpers import closure_map, closure_value, dummy_event, make_task, ticker_update
 
 
 if not hasattr(_Dimension, 'exact'):
@@ -140,3 +142,64 @@ def test_filter_toggle_keybindings(ui_context):
     toggle_created(dummy_event())
     assert closure_value(toggle_created, 'include_created') is True
     assert closure_value(toggle_created, 'status_line') == 'Including created tasks'
+
+
+def test_filtered_rows_reused_until_filters_change(ui_context):
+    hide_done_toggle = get_binding(ui_context, 'd', requires={'hide_done'})
+    rows_fn = get_binding(ui_context, 'j', requires={'filtered_rows'})
+    rows_fn = closure_value(rows_fn, 'filtered_rows')
+    ui_context.db.upsert_many([make_task(title='Finished', url='https://github.com/acme/repo/issues/2', status='Done', is_done=1)])
+    closure_map(rows_fn)['all_rows'].cell_contents = ui_context.db.load()
+
+    first = rows_fn()
+    assert rows_fn() is first
+    assert {r.title for r in first} == {'Task One', 'Finished'}
+
+    hide_done_toggle(dummy_event())
+    hidden = rows_fn()
+    assert hidden is not first
+    assert [r.title for r in hidden] == ['Task One']
+    assert rows_fn() is hidden
+
+
+def test_table_fragments_reused_until_view_changes(ui_context, monkeypatch):
+    zen = get_binding(ui_context, 'z', requires={'_apply_layout'})
+    table_window = closure_value(closure_value(zen, '_apply_layout'), 'table_window')
+    build = table_window.kwargs['content'].text
+    move_down = get_binding(ui_context, 'j', requires={'move'})
+    status_change = closure_value(get_binding(ui_context, 'd', requires={'_apply_status_change'}), '_apply_status_change')
+    patch_rows = closure_value(status_change, '_patch_cached_rows')
+    second_url = 'https://github.com/acme/repo/issues/2'
+    ui_context.db.upsert_many([make_task(title='Task Two', url=second_url)])
+    closure_map(closure_value(build, 'filtered_rows'))['all_rows'].cell_contents = ui_context.db.load()
+    clock = [1000.2]
+    monkeypatch.setattr(ght.time, 'time', lambda: clock[0])
+
+    first = build()
+    assert build() is first
+
+    move_down(dummy_event())
+    moved = build()
+    assert closure_value(build, 'current_index') == 1
+    assert moved is not first
+    assert build() is moved
+
+    patch_rows(second_url, priority='Urgent')
+    patched = build()
+    assert patched is not moved
+    assert any('Urgent' in text for _style, text in patched)
+    assert build() is patched
+
+    ui_context.db.sessions_version += 1
+    bumped = build()
+    assert bumped is not patched
+    assert build() is bumped
+
+    ui_context.db.start_session(second_url, 'Project Alpha')
+    closure_value(closure_value(closure_value(build, '_frame_active_urls'), '_timer_frame'), 'timer_frame_cache')['active_urls'] = None
+    ticking = build()
+    assert ticking is not bumped
+    clock[0] = 1000.9
+    assert build() is ticking
+    clock[0] = 1001.0
+    assert build() is not ticking
@@ -1,9 +1,11 @@
 from .helpers import (
+    closure_map,
     closure_value,
     dummy_event,
     editor_state_from,
     find_binding_for_state,
     find_state_change_binding,
+    make_task,
     move_to_field,
 )
 
@@ -118,3 +120,42 @@ def test_label_editor_cancel_reverts_changes(ui_context):
 
     label_field = next(f for f in state['fields'] if f.get('type') == 'labels')
     assert label_field['value'] == ['bug']
+
+
+def test_label_commit_patches_every_cached_row_of_the_issue(ui_context):
+    # The same issue tracked in a second project shares the URL but not the item.
+    ui_context.db.upsert_many([make_task(project_number=2, project_title='Project Beta', item_id='item-2', start_date='2024-01-08')])
+    state, enter = _open_label_editor(ui_context)
+    apply_cells = closure_map(closure_value(enter, '_apply_labels'))
+    apply_cells['all_rows'].cell_contents = ui_context.db.load()
+
+    enter(dummy_event())
+    ui_context.run_pending('_load_label_choices_for_editor')
+    space_toggle = find_binding_for_state(ui_context.kb.bindings, ' ', state, 'label toggle binding')
+    nav_down = find_state_change_binding(ui_context.kb.bindings, 'j', state, 'label_index', 'label navigation binding')
+    nav_down(dummy_event())
+    space_toggle(dummy_event())
+    enter(dummy_event())
+    ui_context.run_pending('_apply_labels')
+
+    cached = apply_cells['all_rows'].cell_contents
+    assert sorted((r.project_title, r.item_id, r.start_date) for r in cached) == [
+        ('Project Alpha', 'item-1', '2024-01-09'),
+        ('Project Beta', 'item-2', '2024-01-08'),
+    ]
+    assert all(r.labels == '["bug", "feature"]' for r in cached)
+
+
+def test_label_editor_warms_other_repos_as_a_tracked_background_task(ui_context):
+    ui_context.db.upsert_many([make_task(url='https://github.com/acme/other/issues/2', repo='acme/other', title='Task Two')])
+    state, enter = _open_label_editor(ui_context)
+    closure_map(closure_value(enter, '_apply_labels'))['all_rows'].cell_contents = ui_context.db.load()
+
+    enter(dummy_event())
+    warm = [
+        coro
+        for coro in ui_context.app.background_tasks
+        if getattr(getattr(coro, 'cr_code', None), 'co_name', '') == '_warm_repo_labels'
+    ]
+    assert len(warm) == 1
+    assert not any(getattr(getattr(coro, 'cr_code', None), 'co_name', '') == '_warm_repo_labels' for coro in ui_context.pending_tasks)
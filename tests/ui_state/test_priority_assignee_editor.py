@@ -1,3 +1,5 @@
+import gh_task_viewer as ght
+
 from .helpers import (
     dummy_event,
     editor_state_from,
@@ -44,6 +46,7 @@ def test_priority_and_assignee_editor_states(ui_context):
     move_to_field(enter, move_idle, state, 'priority')
     enter(dummy_event())
     assert state['mode'] == 'priority-select'
+    assert state['priority_option_names'] == ('High', 'Medium', 'Low')
     nav_priority = find_priority_nav()
     nav_priority(dummy_event())
     fields = state['fields']
@@ -81,3 +84,12 @@ def test_priority_and_assignee_editor_states(ui_context):
     for coro in scheduled_assignees:
         coro.close()
         ui_context.pending_tasks.remove(coro)
+
+
+def test_match_priority_option_prefers_exact_then_substring():
+    options = [{'id': 'p1', 'name': 'P1: High'}, {'id': 'hi', 'name': ' High '}, {'id': 'lo', 'name': 'Low'}]
+    assert ght._match_priority_option('Priority: high', options) == 'hi'
+    assert ght._match_priority_option('LOW', options) == 'lo'
+    assert ght._match_priority_option('P1', options) == 'p1'
+    assert ght._match_priority_option('Urgent', options) == ''
+    assert ght._match_priority_option('', options) == ''